@@ -0,0 +1,59 @@
+"""
+Per-line cost of InlineMarkupSanitizer compared with running its _PIPELINE until nothing changes (as it was done
+before the single pass), on typical wiki lines.
+
+    python benchmarks/inline_markup_benchmark.py [repeat]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from doku_gpt.sanitizer.doku.line.inline_markup_sanitizer import InlineMarkupSanitizer
+
+LINES = [
+    "Plain text without any markup, as most lines of a page are.",
+    "DokuWiki supports **bold**, //italic//, __underlined__ and ''monospaced'' texts.",
+    "====== A Header ======",
+    "  * A list item with a [[:books:page|Page]] link.",
+    "<sub>Subscript</sub>, <del>deleted</del> and {{image.png|A caption}}.",
+    "~~NOTOC~~",
+    "",
+]
+
+
+def pipeline(line: str) -> str:
+    prev = None
+    while prev != line:
+        prev = line
+        for s in InlineMarkupSanitizer._PIPELINE:
+            line = s.sanitize(line)
+    return line
+
+
+def measure(name: str, function, lines: list[str]) -> float:
+    for line in LINES:
+        function(line)
+
+    start = time.perf_counter()
+    for line in lines:
+        function(line)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {elapsed:8.3f} s  {elapsed / len(lines) * 1e6:8.2f} µs/line")
+    return elapsed
+
+
+def main() -> None:
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    lines = LINES * repeat
+    for line in LINES:
+        assert pipeline(line) == InlineMarkupSanitizer.sanitize(line), line
+
+    before = measure("pipeline", pipeline, lines)
+    after = measure("single pass", InlineMarkupSanitizer.sanitize, lines)
+    print(f"speedup      {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
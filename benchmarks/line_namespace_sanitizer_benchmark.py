@@ -0,0 +1,93 @@
+"""
+Per-link cost of LineNamespaceSanitizer, compared with building the factory and the resolver for every link (as it
+was done before they were kept per page).
+
+    python benchmarks/line_namespace_sanitizer_benchmark.py [pages] [links per page]
+"""
+
+from __future__ import annotations
+
+import copy
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from doku_gpt.enum.link_type import LinkType
+from doku_gpt.factory.link_tag_factory import LinkTagFactory
+from doku_gpt.functions import extract_link_tags
+from doku_gpt.resolver.link_tag.internal_absolute_resolver import InternalAbsoluteResolver
+from doku_gpt.resolver.link_tag.internal_implicit_resolver import InternalImplicitResolver
+from doku_gpt.resolver.link_tag.internal_prior_resolver import InternalPriorResolver
+from doku_gpt.resolver.link_tag.internal_relative_resolver import InternalRelativeResolver
+from doku_gpt.sanitizer.root.line_namespace_sanitizer import LineNamespaceSanitizer
+
+LINKS = ["[[:books:page_{index}]]", "[[.page_{index}|Page]]", "[[..:books:page_{index}]]", "[[page_{index}]]"]
+
+
+def build_wiki(root: Path, pages: int, links: int) -> list[tuple[Path, list[str]]]:
+    folder = root.joinpath("books")
+    folder.mkdir(parents=True)
+    result = []
+    for index in range(pages):
+        page_path = folder.joinpath(f"page_{index}.txt")
+        lines = [f"====== Page {index} ======", ""]
+        for link in range(links):
+            lines.append("See " + LINKS[link % len(LINKS)].format(index=(index + link) % pages) + " for more.")
+        page_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        result.append((page_path, lines))
+    return result
+
+
+def per_link_construction(root: Path, page_path: Path, lines: list[str]) -> None:
+    for line in lines:
+        for link_tag in extract_link_tags(line):
+            tag = LinkTagFactory(root_folder=root).get(link_tag)
+            resolved_tag = copy.copy(tag)
+            if LinkType.INTERNAL_ABSOLUTE == resolved_tag.link_type:
+                resolver = InternalAbsoluteResolver(root_folder=root, context=page_path)
+            elif LinkType.INTERNAL_PRIOR == resolved_tag.link_type:
+                resolver = InternalPriorResolver(root_folder=root, context=page_path)
+            elif LinkType.INTERNAL_RELATIVE == resolved_tag.link_type:
+                resolver = InternalRelativeResolver(root_folder=root, context=page_path)
+            else:
+                resolver = InternalImplicitResolver(root_folder=root, context=page_path)
+            resolver.resolve(resolved_tag)
+
+
+def per_page_construction(root: Path, page_path: Path, lines: list[str]) -> None:
+    sanitizer = LineNamespaceSanitizer(root_folder=root, page_path=page_path)
+    for line in lines:
+        sanitizer.sanitize(line)
+
+
+def measure(name: str, function, root: Path, wiki: list[tuple[Path, list[str]]], total_links: int) -> float:
+    for page_path, lines in wiki:
+        function(root, page_path, lines)
+
+    start = time.perf_counter()
+    for page_path, lines in wiki:
+        function(root, page_path, lines)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} {elapsed:8.3f} s  {elapsed / total_links * 1e6:8.1f} µs/link")
+    return elapsed
+
+
+def main() -> None:
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    links = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    root = Path(tempfile.mkdtemp(prefix="doku_gpt_benchmark_"))
+    try:
+        wiki = build_wiki(root, pages, links)
+        total_links = pages * links
+        print(f"{pages} pages, {total_links} links")
+        before = measure("per link construction", per_link_construction, root, wiki, total_links)
+        after = measure("per page construction", per_page_construction, root, wiki, total_links)
+        print(f"speedup {before / after:.2f}x")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
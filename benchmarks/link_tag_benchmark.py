@@ -0,0 +1,62 @@
+"""
+Construction time and memory per tag of the pydantic LinkTag compared with the slotted CompactLinkTag, built the way
+LinkTagFactory builds them (an empty tag whose fields are then set one by one).
+
+    python benchmarks/link_tag_benchmark.py [tags]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from doku_gpt.enum.link_type import LinkType
+from doku_gpt.model.compact_link_tag import CompactLinkTag
+from doku_gpt.model.link_tag import LinkTag
+
+ROOT = Path("/tmp")
+
+
+def build(cls, index: int):
+    link_tag = cls()
+    link_tag.attach_root(ROOT)
+    link_tag.label = f"Page {index}"
+    link_tag.target_query = "do=edit"
+    link_tag.target_prefix = f":books:page_{index}"
+    link_tag.link_type = LinkType.INTERNAL_ABSOLUTE
+    return link_tag
+
+
+def measure(cls, tags: int) -> tuple[float, float]:
+    for index in range(1000):
+        build(cls, index)
+
+    start = time.perf_counter()
+    for index in range(tags):
+        build(cls, index)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    kept = [build(cls, index) for index in range(tags)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed / tags * 1e6, current / tags
+
+
+def main() -> None:
+    tags = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{tags} tags")
+    results = {}
+    for cls in (LinkTag, CompactLinkTag):
+        results[cls] = measure(cls, tags)
+        micro, memory = results[cls]
+        print(f"{cls.__name__:<16} {micro:8.2f} µs/tag  {memory:8.0f} bytes/tag")
+    print(f"speedup {results[LinkTag][0] / results[CompactLinkTag][0]:.2f}x")
+    print(f"memory  {results[LinkTag][1] / results[CompactLinkTag][1]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class CountingHttpAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that counts the requests it sends and the connections its pools open, so connection reuse can be
+    measured (every request that did not open a connection reused a kept-alive one).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        self.__lock = threading.Lock()
+        self.requests = 0
+        self.connections = 0
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": self.__counting_pool(HTTPConnectionPool),
+            "https": self.__counting_pool(HTTPSConnectionPool),
+        }
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        with self.__lock:
+            self.requests += 1
+        return super().send(request, *args, **kwargs)
+
+    def count_connection(self) -> None:
+        with self.__lock:
+            self.connections += 1
+
+    def __counting_pool(self, pool_class: type[HTTPConnectionPool]) -> type[HTTPConnectionPool]:
+        adapter = self
+
+        def _new_conn(pool: HTTPConnectionPool) -> Any:
+            adapter.count_connection()
+            return pool_class._new_conn(pool)
+
+        return type(f"Counting{pool_class.__name__}", (pool_class,), {"_new_conn": _new_conn})
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import os
+import stat
+import tempfile
 from pathlib import Path
 
+from doku_gpt.cache.page_cache import PageCache
 from doku_gpt.validator.path.file_or_parent_validator import FileOrParentValidator
 from doku_gpt.validator.path.path_extension_validator import PathExtensionValidator
 
@@ -13,20 +17,48 @@ class PageAdapter:
 
     @property
     def content(self) -> str:
+        if PageCache.is_enabled():
+            return PageCache.content(self.page_path)
         return self.page_path.read_text(encoding="utf-8")
 
     @content.setter
     def content(self, content: str) -> None:
-        self.page_path.write_text(data=content, encoding="utf-8")
+        self.__write(content)
+        PageCache.store(self.page_path, content)
 
     @property
     def lines(self) -> list[str]:
-        lines = self.content.splitlines()
-        while lines and lines[-1] == "":
-            lines.pop()
-        return lines
+        if PageCache.is_enabled():
+            return PageCache.lines(self.page_path)
+        return self.split_lines(self.content)
 
     @lines.setter
     def lines(self, lines: list[str]) -> None:
         text = "\n".join(lines) + "\n"
-        self.page_path.write_text(text, encoding="utf-8")
+        self.__write(text)
+        PageCache.store(self.page_path, text)
+
+    @staticmethod
+    def split_lines(content: str) -> list[str]:
+        lines = content.splitlines()
+        while lines and lines[-1] == "":
+            lines.pop()
+        return lines
+
+    def __write(self, text: str) -> None:
+        """Replace an existing page through a temporary file in its folder, so a reader never sees it half written."""
+        try:
+            mode = stat.S_IMODE(os.stat(self.page_path).st_mode)
+        except FileNotFoundError:
+            self.page_path.write_text(text, encoding="utf-8")
+            return
+
+        file_descriptor, temporary = tempfile.mkstemp(dir=self.page_path.parent, prefix=f".{self.page_path.name}.")
+        try:
+            with open(file_descriptor, "w", encoding="utf-8") as file:
+                file.write(text)
+            os.chmod(temporary, mode)
+            os.replace(temporary, self.page_path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from doku_gpt.model.http_metadata import HttpMetadata
+
+
+class HttpMetadataCache:
+    """
+    On-disk (sqlite) record of what was learned about external URLs, keyed by kind ('title' for GET, 'exists' for
+    HEAD) and URL: final URL, status, title and the ETag / Last-Modified validators. Entries younger than the TTL are
+    served as they are; older ones are returned as stale so the caller can revalidate them with a conditional request.
+    The cache is disabled (every lookup misses, every store is ignored) until open() is called. A cache opened as
+    'shared' commits every change at once so that other processes using the same file see it.
+    """
+
+    TITLE = "title"
+    EXISTS = "exists"
+    FILE_NAME = ".doku_gpt.http_cache.sqlite"
+    DEFAULT_TTL = 30 * 24 * 60 * 60.0
+    SHARED_TIMEOUT = 30.0
+
+    __SCHEMA = """
+        CREATE TABLE IF NOT EXISTS http_metadata (
+            kind TEXT NOT NULL,
+            url TEXT NOT NULL,
+            final_url TEXT NOT NULL,
+            status INTEGER NOT NULL,
+            value TEXT,
+            etag TEXT,
+            last_modified TEXT,
+            fetched_at REAL NOT NULL,
+            PRIMARY KEY (kind, url)
+        )
+    """
+    __LOCK = threading.RLock()
+    __CONNECTION: sqlite3.Connection | None = None
+    __TTL = DEFAULT_TTL
+    __HITS = 0
+    __REVALIDATED = 0
+    __MISSES = 0
+
+    @classmethod
+    def open(cls, file: Path, ttl: float = DEFAULT_TTL, shared: bool = False) -> None:
+        with cls.__LOCK:
+            cls.close()
+            cls.__TTL = ttl
+            try:
+                if shared:
+                    connection = sqlite3.connect(
+                        file, check_same_thread=False, timeout=cls.SHARED_TIMEOUT, isolation_level=None
+                    )
+                else:
+                    connection = sqlite3.connect(file, check_same_thread=False)
+            except sqlite3.Error:
+                return
+            try:
+                if shared:
+                    connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(cls.__SCHEMA)
+            except sqlite3.Error:
+                connection.close()
+                return
+            cls.__CONNECTION = connection
+
+    @classmethod
+    def close(cls) -> None:
+        with cls.__LOCK:
+            connection = cls.__CONNECTION
+            cls.__CONNECTION = None
+            if connection is None:
+                return
+            try:
+                connection.commit()
+            except sqlite3.Error:
+                pass
+            finally:
+                connection.close()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.__CONNECTION is not None
+
+    @classmethod
+    def get(cls, kind: str, url: str) -> tuple[HttpMetadata | None, bool]:
+        """Return the stored entry (if any) and whether it is still fresh."""
+        with cls.__LOCK:
+            if cls.__CONNECTION is None:
+                return None, False
+            try:
+                row = cls.__CONNECTION.execute(
+                    "SELECT final_url, status, value, etag, last_modified, fetched_at FROM http_metadata "
+                    "WHERE kind = ? AND url = ?",
+                    (kind, url),
+                ).fetchone()
+            except sqlite3.Error:
+                row = None
+
+            if row is None:
+                cls.__MISSES += 1
+                return None, False
+
+            final_url, status, value, etag, last_modified, fetched_at = row
+            entry = HttpMetadata(
+                url=url,
+                final_url=final_url,
+                status=status,
+                value=value,
+                etag=etag,
+                last_modified=last_modified,
+                fetched_at=fetched_at,
+            )
+            fresh = time.time() - fetched_at < cls.__TTL
+            if fresh:
+                cls.__HITS += 1
+            else:
+                cls.__MISSES += 1
+            return entry, fresh
+
+    @classmethod
+    def put(
+        cls,
+        kind: str,
+        url: str,
+        final_url: str,
+        status: int,
+        value: str | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        with cls.__LOCK:
+            if cls.__CONNECTION is None:
+                return
+            try:
+                cls.__CONNECTION.execute(
+                    "INSERT OR REPLACE INTO http_metadata "
+                    "(kind, url, final_url, status, value, etag, last_modified, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (kind, url, final_url, status, value, etag, last_modified, time.time()),
+                )
+            except sqlite3.Error:
+                pass
+
+    @classmethod
+    def touch(cls, kind: str, url: str) -> None:
+        """Mark an entry as fresh again after the server confirmed it did not change."""
+        with cls.__LOCK:
+            if cls.__CONNECTION is None:
+                return
+            try:
+                cls.__CONNECTION.execute(
+                    "UPDATE http_metadata SET fetched_at = ? WHERE kind = ? AND url = ?", (time.time(), kind, url)
+                )
+            except sqlite3.Error:
+                return
+            cls.__REVALIDATED += 1
+
+    @classmethod
+    def statistics(cls) -> dict[str, int]:
+        with cls.__LOCK:
+            entries = 0
+            if cls.__CONNECTION is not None:
+                try:
+                    entries = cls.__CONNECTION.execute("SELECT COUNT(*) FROM http_metadata").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            return {"entries": entries, "hits": cls.__HITS, "revalidated": cls.__REVALIDATED, "misses": cls.__MISSES}
+
+    @classmethod
+    def reset_statistics(cls) -> None:
+        cls.__HITS = 0
+        cls.__REVALIDATED = 0
+        cls.__MISSES = 0
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+
+from doku_gpt.enum.link_type import LinkType
+
+ParsedLinkTag = tuple[LinkType | None, str, str | None, str | None, str | None, str | None]
+
+
+class LinkTagParseCache:
+    """
+    Process wide memo of LinkTagFactory parsing, keyed by the raw link tag text.
+
+    Entries are immutable tuples (link_type, target_prefix, target_suffix, target_fragment, target_query, label) kept in
+    a bounded LRU; the factory builds a new tag from them on every call. Parsing does not depend on the root folder or
+    on the wiki content, so entries never go stale. Only successful parses are kept.
+    """
+
+    MAX_ENTRIES = 16_384
+
+    __ENTRIES: OrderedDict[str, ParsedLinkTag] = OrderedDict()
+    __HITS = 0
+    __MISSES = 0
+
+    @classmethod
+    def get(cls, link_tag: str) -> ParsedLinkTag | None:
+        parsed = cls.__ENTRIES.get(link_tag)
+        if parsed is None:
+            cls.__MISSES += 1
+            return None
+
+        cls.__ENTRIES.move_to_end(link_tag)
+        cls.__HITS += 1
+        return parsed
+
+    @classmethod
+    def put(cls, link_tag: str, parsed: ParsedLinkTag) -> None:
+        cls.__ENTRIES[link_tag] = parsed
+        if len(cls.__ENTRIES) > cls.MAX_ENTRIES:
+            cls.__ENTRIES.popitem(last=False)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.__ENTRIES.clear()
+
+    @classmethod
+    def statistics(cls) -> dict[str, int]:
+        return {"entries": len(cls.__ENTRIES), "hits": cls.__HITS, "misses": cls.__MISSES}
+
+    @classmethod
+    def reset_statistics(cls) -> None:
+        cls.__HITS = 0
+        cls.__MISSES = 0
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+
+class PageCache:
+    """
+    Opt-in memo of decoded pages for PageAdapter.
+
+    An entry holds the text (as read by Path.read_text) and its split lines, and is only served while the file keeps
+    the mtime and size it had when it was read or written, so every access still costs one stat() but never a read.
+    Entries are evicted in LRU order once their estimated size goes over the memory budget.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+    __ENABLED = False
+    __MAX_BYTES = DEFAULT_MAX_BYTES
+    __ENTRIES: OrderedDict[Path, tuple[int, int, str, tuple[str, ...] | None, int]] = OrderedDict()
+    __BYTES = 0
+    __HITS = 0
+    __MISSES = 0
+
+    @classmethod
+    def enable(cls, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        cls.__ENABLED = True
+        cls.__MAX_BYTES = max_bytes
+        cls.__evict()
+
+    @classmethod
+    def disable(cls) -> None:
+        cls.__ENABLED = False
+        cls.clear()
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls.__ENABLED
+
+    @classmethod
+    def content(cls, page_path: Path) -> str:
+        return cls.__entry(page_path)[2]
+
+    @classmethod
+    def lines(cls, page_path: Path) -> list[str]:
+        mtime_ns, size, text, lines, weight = cls.__entry(page_path)
+        if lines is None:
+            split_lines = text.splitlines()
+            while split_lines and split_lines[-1] == "":
+                split_lines.pop()
+            lines = tuple(split_lines)
+            if page_path in cls.__ENTRIES:
+                cls.__ENTRIES[page_path] = (mtime_ns, size, text, lines, weight)
+        return list(lines)
+
+    @classmethod
+    def store(cls, page_path: Path, text: str) -> None:
+        """Record what was just written to 'page_path' so the next read does not go back to the disk."""
+        cls.forget(page_path)
+        # Text mode reads translate '\r', so a text holding one would not be read back as it was written.
+        if not cls.__ENABLED or "\r" in text:
+            return
+
+        try:
+            page_stat = os.stat(page_path)
+        except OSError:
+            return
+        cls.__add(page_path, page_stat, text)
+
+    @classmethod
+    def forget(cls, page_path: Path) -> None:
+        entry = cls.__ENTRIES.pop(page_path, None)
+        if entry is not None:
+            cls.__BYTES -= entry[4]
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.__ENTRIES.clear()
+        cls.__BYTES = 0
+
+    @classmethod
+    def statistics(cls) -> dict[str, int]:
+        return {"entries": len(cls.__ENTRIES), "bytes": cls.__BYTES, "hits": cls.__HITS, "misses": cls.__MISSES}
+
+    @classmethod
+    def reset_statistics(cls) -> None:
+        cls.__HITS = 0
+        cls.__MISSES = 0
+
+    @classmethod
+    def __entry(cls, page_path: Path) -> tuple[int, int, str, tuple[str, ...] | None, int]:
+        page_stat = os.stat(page_path)
+        entry = cls.__ENTRIES.get(page_path)
+        if entry is not None and entry[0] == page_stat.st_mtime_ns and entry[1] == page_stat.st_size:
+            cls.__ENTRIES.move_to_end(page_path)
+            cls.__HITS += 1
+            return entry
+
+        cls.__MISSES += 1
+        cls.forget(page_path)
+        return cls.__add(page_path, page_stat, page_path.read_text(encoding="utf-8"))
+
+    @classmethod
+    def __add(
+        cls, page_path: Path, page_stat: os.stat_result, text: str
+    ) -> tuple[int, int, str, tuple[str, ...] | None, int]:
+        # The split lines roughly double the footprint of the text they come from.
+        entry = (page_stat.st_mtime_ns, page_stat.st_size, text, None, 2 * sys.getsizeof(text))
+        cls.__ENTRIES[page_path] = entry
+        cls.__BYTES += entry[4]
+        cls.__evict()
+        return entry
+
+    @classmethod
+    def __evict(cls) -> None:
+        while cls.__BYTES > cls.__MAX_BYTES and cls.__ENTRIES:
+            _, entry = cls.__ENTRIES.popitem(last=False)
+            cls.__BYTES -= entry[4]
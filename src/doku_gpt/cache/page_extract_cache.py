@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+
+class PageExtractCache:
+    """
+    Memo of the titles and sanitized excerpts extracted from pages, keyed by kind ('title' or 'excerpt'), page path
+    and fragment. An entry is only served while the page keeps the mtime and size it had when the value was
+    extracted. The LRU is bounded and can be saved to / loaded from a JSON file to be reused by the next run.
+    """
+
+    TITLE = "title"
+    EXCERPT = "excerpt"
+    FILE_NAME = ".doku_gpt.extract_cache.json"
+    MAX_ENTRIES = 50_000
+
+    __VERSION = 1
+    __ENTRIES: OrderedDict[tuple[str, str, str], tuple[int, int, str | None]] = OrderedDict()
+    __HITS = 0
+    __MISSES = 0
+
+    @classmethod
+    def get(cls, kind: str, page_path: str | Path, fragment: str | None) -> tuple[bool, str | None]:
+        key = (kind, str(page_path), fragment or "")
+        entry = cls.__ENTRIES.get(key)
+        if entry is not None:
+            version = cls.__version(page_path)
+            if version is not None and entry[:2] == version:
+                cls.__ENTRIES.move_to_end(key)
+                cls.__HITS += 1
+                return True, entry[2]
+            del cls.__ENTRIES[key]
+
+        cls.__MISSES += 1
+        return False, None
+
+    @classmethod
+    def put(cls, kind: str, page_path: str | Path, fragment: str | None, value: str | None) -> None:
+        version = cls.__version(page_path)
+        if version is None:
+            return
+
+        key = (kind, str(page_path), fragment or "")
+        cls.__ENTRIES[key] = (version[0], version[1], value)
+        cls.__ENTRIES.move_to_end(key)
+        if len(cls.__ENTRIES) > cls.MAX_ENTRIES:
+            cls.__ENTRIES.popitem(last=False)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.__ENTRIES.clear()
+
+    @classmethod
+    def statistics(cls) -> dict[str, int]:
+        return {"entries": len(cls.__ENTRIES), "hits": cls.__HITS, "misses": cls.__MISSES}
+
+    @classmethod
+    def reset_statistics(cls) -> None:
+        cls.__HITS = 0
+        cls.__MISSES = 0
+
+    @classmethod
+    def load(cls, file: Path) -> None:
+        try:
+            payload = json.loads(file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(payload, dict) or payload.get("version") != cls.__VERSION:
+            return
+
+        for row in payload.get("entries", []):
+            try:
+                kind, page_path, fragment, mtime_ns, size, value = row
+            except (TypeError, ValueError):
+                continue
+            cls.__ENTRIES[(kind, page_path, fragment)] = (mtime_ns, size, value)
+        while len(cls.__ENTRIES) > cls.MAX_ENTRIES:
+            cls.__ENTRIES.popitem(last=False)
+
+    @classmethod
+    def save(cls, file: Path) -> None:
+        rows = [[*key, *entry] for key, entry in cls.__ENTRIES.items()]
+        temporary_file = file.with_name(file.name + ".tmp")
+        try:
+            temporary_file.write_text(
+                json.dumps({"version": cls.__VERSION, "entries": rows}, ensure_ascii=False), encoding="utf-8"
+            )
+            os.replace(temporary_file, file)
+        except OSError:
+            temporary_file.unlink(missing_ok=True)
+
+    @staticmethod
+    def __version(page_path: str | Path) -> tuple[int, int] | None:
+        try:
+            page_stat = os.stat(page_path)
+        except OSError:
+            return None
+        return page_stat.st_mtime_ns, page_stat.st_size
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+
+class PathResolutionCache:
+    """
+    Process wide memo of Path.resolve().
+
+    Only successful resolutions are kept (a missing path is resolved again next time), in a bounded LRU keyed by the
+    path as given and the strict flag. Code that deletes files or folders must call clear() or forget() so that a
+    strict resolution never outlives the path it points to.
+    """
+
+    MAX_ENTRIES = 65_536
+
+    __ENTRIES: OrderedDict[tuple[str, bool], Path] = OrderedDict()
+    __HITS = 0
+    __MISSES = 0
+
+    @classmethod
+    def resolve(cls, path: str | Path, strict: bool = False) -> Path:
+        key = (str(path), strict)
+        resolved = cls.__ENTRIES.get(key)
+        if resolved is not None:
+            cls.__ENTRIES.move_to_end(key)
+            cls.__HITS += 1
+            return resolved
+
+        cls.__MISSES += 1
+        resolved = Path(path).resolve(strict=strict)
+        cls.__ENTRIES[key] = resolved
+        if len(cls.__ENTRIES) > cls.MAX_ENTRIES:
+            cls.__ENTRIES.popitem(last=False)
+        return resolved
+
+    @classmethod
+    def resolve_existing(cls, path: str | Path) -> Path:
+        """Strict resolve() whose memoized result is checked to still exist, as PathContext does with its stat."""
+        resolved = cls.resolve(path, strict=True)
+        if not os.path.exists(resolved):
+            cls.forget(path)
+            resolved = cls.resolve(path, strict=True)
+        return resolved
+
+    @classmethod
+    def forget(cls, path: str | Path) -> None:
+        for strict in (True, False):
+            cls.__ENTRIES.pop((str(path), strict), None)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.__ENTRIES.clear()
+
+    @classmethod
+    def statistics(cls) -> dict[str, int]:
+        return {"entries": len(cls.__ENTRIES), "hits": cls.__HITS, "misses": cls.__MISSES}
+
+    @classmethod
+    def reset_statistics(cls) -> None:
+        cls.__HITS = 0
+        cls.__MISSES = 0
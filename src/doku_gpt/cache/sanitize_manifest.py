@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from doku_gpt.cache.page_extract_cache import PageExtractCache
+from doku_gpt.enum.link_type import LinkType
+from doku_gpt.extractor.doku_page_extractor import DokuPageExtractor
+from doku_gpt.factory.link_tag_factory import LinkTagFactory
+from doku_gpt.functions import extract_link_tags
+
+
+class SanitizeManifest:
+    """
+    On-disk record of the last sanitize of every page, stored next to '.doku_gpt.json', so that an incremental run
+    only sanitizes the pages whose result could differ.
+
+    A page is kept with the sha256 of its bytes and the pages its links resolved to. For each such target the manifest
+    keeps its mtime and size and, for the links without a label, the title they took from it (the sanitized text holds
+    nothing else of the target). A page is current while its bytes are the same and every target still exists with the
+    same titles; a changed mtime or size only costs a hash or a title extraction. Pages still holding links resolved
+    against their own folder are also sanitized again when pages were added or removed. Titles of external links are
+    not tracked: they are refreshed when the page itself changes.
+    """
+
+    FILE_NAME = ".doku_gpt.sanitize.json"
+
+    __VERSION = 1
+
+    def __init__(self, root_folder: Path, pages: list[Path]) -> None:
+        self.root_folder = root_folder
+        self.file = root_folder.joinpath(self.FILE_NAME)
+        self.__pages: dict[str, dict[str, Any]] = {}
+        self.__tree = hashlib.sha256("\n".join(sorted(self.__key(page) for page in pages)).encode("utf-8")).hexdigest()
+        self.__tree_changed = True
+        self.__dirty = False
+        self.__factory = LinkTagFactory(root_folder=root_folder)
+        self.__load()
+
+    def is_current(self, page_path: Path) -> bool:
+        entry = self.__pages.get(self.__key(page_path))
+        if entry is None:
+            return False
+
+        try:
+            page_stat = os.stat(page_path)
+        except OSError:
+            return False
+        if (page_stat.st_mtime_ns, page_stat.st_size) != (entry["mtime_ns"], entry["size"]):
+            if page_stat.st_size != entry["size"] or self.__hash(page_path) != entry["sha256"]:
+                return False
+            entry["mtime_ns"] = page_stat.st_mtime_ns
+            self.__dirty = True
+
+        if entry["relative"] and self.__tree_changed:
+            return False
+        return all(self.__is_dependency_current(key, dependency) for key, dependency in entry["dependencies"].items())
+
+    def record(self, page_path: Path, dependencies: dict[Path, set[str | None]]) -> None:
+        """
+        Remember a page that was just sanitized and the targets ('page path' -> fragments needing a title) it used.
+        """
+        try:
+            page_stat = os.stat(page_path)
+            sha256 = self.__hash(page_path)
+            recorded = {
+                self.__key(target): self.__dependency(target, fragments) for target, fragments in dependencies.items()
+            }
+        except OSError:
+            self.forget(page_path)
+            return
+
+        self.__pages[self.__key(page_path)] = {
+            "mtime_ns": page_stat.st_mtime_ns,
+            "size": page_stat.st_size,
+            "sha256": sha256,
+            "relative": self.__has_relative_links(page_path),
+            "dependencies": recorded,
+        }
+        self.__dirty = True
+
+    def forget(self, page_path: Path) -> None:
+        if self.__pages.pop(self.__key(page_path), None) is not None:
+            self.__dirty = True
+
+    def save(self) -> None:
+        if not self.__dirty and not self.__tree_changed:
+            return
+
+        payload = {"version": self.__VERSION, "tree": self.__tree, "pages": self.__pages}
+        temporary_file = self.file.with_name(self.file.name + ".tmp")
+        try:
+            temporary_file.write_text(json.dumps(payload, separators=(",", ":"), ensure_ascii=False), encoding="utf-8")
+            os.replace(temporary_file, self.file)
+        except OSError:
+            temporary_file.unlink(missing_ok=True)
+            return
+        self.__dirty = False
+        self.__tree_changed = False
+
+    def __is_dependency_current(self, key: str, dependency: dict[str, Any]) -> bool:
+        target = self.root_folder.joinpath(key)
+        try:
+            target_stat = os.stat(target)
+        except OSError:
+            return False
+        if (target_stat.st_mtime_ns, target_stat.st_size) == (dependency["mtime_ns"], dependency["size"]):
+            return True
+
+        for fragment, title in dependency["titles"]:
+            if self.__title(target, fragment) != title:
+                return False
+        dependency["mtime_ns"] = target_stat.st_mtime_ns
+        dependency["size"] = target_stat.st_size
+        self.__dirty = True
+        return True
+
+    def __dependency(self, target: Path, fragments: set[str | None]) -> dict[str, Any]:
+        target_stat = os.stat(target)
+        titles = [[fragment, self.__title(target, fragment)] for fragment in sorted(fragments, key=lambda f: f or "")]
+        return {"mtime_ns": target_stat.st_mtime_ns, "size": target_stat.st_size, "titles": titles}
+
+    def __has_relative_links(self, page_path: Path) -> bool:
+        for line in page_path.read_text(encoding="utf-8").splitlines():
+            for link_tag in extract_link_tags(line):
+                try:
+                    tag = self.__factory.get(link_tag)
+                except ValueError:
+                    continue
+                if tag.is_internal and tag.link_type is not LinkType.INTERNAL_ABSOLUTE:
+                    return True
+        return False
+
+    def __load(self) -> None:
+        try:
+            payload = json.loads(self.file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(payload, dict) or payload.get("version") != self.__VERSION:
+            return
+
+        pages = payload.get("pages")
+        if isinstance(pages, dict):
+            self.__pages = pages
+        self.__tree_changed = payload.get("tree") != self.__tree
+
+    def __key(self, page_path: Path) -> str:
+        return Path(page_path).relative_to(self.root_folder).as_posix()
+
+    @staticmethod
+    def __hash(page_path: Path) -> str:
+        return hashlib.sha256(page_path.read_bytes()).hexdigest()
+
+    @staticmethod
+    def __title(page_path: Path, fragment: str | None) -> str | None:
+        found, title = PageExtractCache.get(PageExtractCache.TITLE, page_path, fragment)
+        if not found:
+            title = DokuPageExtractor.extract_title(page_path=page_path, fragment=fragment)
+            PageExtractCache.put(PageExtractCache.TITLE, page_path, fragment, title)
+        return title
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, TypeVar
 
 import click
+from rich.console import Console
 
+from doku_gpt.cache.http_metadata_cache import HttpMetadataCache
+from doku_gpt.cache.page_cache import PageCache
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
 from doku_gpt.finder.finder import Finder
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 
 class AbstractFinderCommand:
     @staticmethod
@@ -51,6 +59,37 @@ class AbstractFinderCommand:
         )(func)
         return func
 
+    @staticmethod
+    def offline_option(func: F) -> F:
+        return click.option(
+            "--offline",
+            is_flag=True,
+            default=False,
+            show_default=True,
+            help="Resolve external links from the HTTP cache only; links it knows nothing about are left as they are.",
+        )(func)
+
+    @staticmethod
+    def jobs_option(func: F) -> F:
+        return click.option(
+            "-j",
+            "--jobs",
+            default=1,
+            type=click.IntRange(min=1),
+            show_default=True,
+            help="Number of processes sanitizing pages at the same time.",
+        )(func)
+
+    @staticmethod
+    def incremental_option(func: F) -> F:
+        return click.option(
+            "--incremental",
+            is_flag=True,
+            default=False,
+            show_default=True,
+            help="Only sanitize pages that changed, or whose linked pages changed title, since the last run.",
+        )(func)
+
     @staticmethod
     def _create_finder(root_folder: Path, excluded_folders: tuple[str, ...], excluded_files: tuple[str, ...]) -> Finder:
         default_excluded_folders, default_excluded_files = AbstractFinderCommand._handle_excluded(
@@ -58,9 +97,40 @@ class AbstractFinderCommand:
         )
 
         return Finder(
-            root_folder=root_folder, excluded_folders=default_excluded_folders, excluded_files=default_excluded_files
+            root_folder=root_folder,
+            excluded_folders=default_excluded_folders,
+            excluded_files=default_excluded_files,
+            snapshot=True,
         )
 
+    @staticmethod
+    def _enable_caches() -> None:
+        PageCache.enable()
+
+    @staticmethod
+    def _start_offline(root_folder: Path) -> None:
+        WebPageExtractor.OFFLINE = True
+        cache_file = root_folder.joinpath(HttpMetadataCache.FILE_NAME)
+        if cache_file.is_file():
+            HttpMetadataCache.open(cache_file)
+
+    @staticmethod
+    def _stop_offline(console: Console) -> None:
+        HttpMetadataCache.close()
+        WebPageExtractor.OFFLINE = False
+        AbstractFinderCommand._report_deferred(console)
+
+    @staticmethod
+    def _report_deferred(console: Console) -> None:
+        console.print(f"[yellow]Deferred {WebPageExtractor.deferred()} external links (offline)[/yellow]")
+
+    @staticmethod
+    def _report_timings(console: Console, timings: dict[int, tuple[int, int, float]], skipped: int = 0) -> None:
+        if skipped:
+            console.print(f"[dim]Skipped {skipped} unchanged pages[/dim]")
+        for worker, (pages, sanitized, seconds) in sorted(timings.items()):
+            console.print(f"[dim]Worker {worker}: {pages} pages, {sanitized} sanitized in {seconds:.2f} seconds[/dim]")
+
     @staticmethod
     def _handle_excluded(
         excluded_folders: tuple[str, ...], excluded_files: tuple[str, ...]
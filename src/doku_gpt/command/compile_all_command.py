@@ -9,21 +9,30 @@ from rich.console import Console
 from doku_gpt.command.abstract_finder_command import AbstractFinderCommand
 from doku_gpt.compiler.doku_compiler import DokuCompiler
 from doku_gpt.compiler.markdown_compiler import MarkdownCompiler
-from doku_gpt.sanitizer.root.page_sanitizer import PageSanitizer
+from doku_gpt.sanitizer.root.parallel_page_sanitizer import ParallelPageSanitizer
 
 
 class CompileAllCommand(AbstractFinderCommand):
     @staticmethod
     @click.command()
     @AbstractFinderCommand.common_options
+    @AbstractFinderCommand.offline_option
+    @AbstractFinderCommand.jobs_option
+    @AbstractFinderCommand.incremental_option
     def execute(
         root_folder: Path,
         excluded_folders: tuple[str, ...],
         excluded_files: tuple[str, ...],
         pattern: str = "*",
         verbose: bool = False,
+        offline: bool = False,
+        jobs: int = 1,
+        incremental: bool = False,
     ) -> None:
+        AbstractFinderCommand._enable_caches()
         console = Console()
+        if offline:
+            AbstractFinderCommand._start_offline(root_folder)
 
         console.print(f"[bold]Sanitizing[/bold] {root_folder}")
         t0 = time.perf_counter()
@@ -34,8 +43,13 @@ class CompileAllCommand(AbstractFinderCommand):
             pattern=pattern,
             verbose=verbose,
             console=console,
+            jobs=jobs,
+            offline=offline,
+            incremental=incremental,
         )
         console.print(f"[green]Sanitize phase took {time.perf_counter() - t0:.2f} seconds[/green]")
+        if offline:
+            AbstractFinderCommand._stop_offline(console)
 
         console.print(f"[bold]Compiling Doku[/bold] {root_folder}")
         t1 = time.perf_counter()
@@ -65,6 +79,9 @@ class CompileAllCommand(AbstractFinderCommand):
         pattern: str,
         verbose: bool,
         console: Console,
+        jobs: int,
+        offline: bool,
+        incremental: bool,
     ) -> None:
         finder = CompileAllCommand._create_finder(
             root_folder=root_folder,
@@ -72,11 +89,12 @@ class CompileAllCommand(AbstractFinderCommand):
             excluded_files=excluded_files,
         )
         files = finder.find_files(pattern)
-        for file_path in files:
-            sanitizer = PageSanitizer(root_folder=root_folder, page_path=file_path)
-            was_sanitized = sanitizer.sanitize()
+        sanitizer = ParallelPageSanitizer(root_folder=root_folder, jobs=jobs, offline=offline, incremental=incremental)
+        for file_path, was_sanitized in sanitizer.sanitize(files):
             if was_sanitized and verbose:
                 console.print(f"[blue]Sanitized:[/blue] {file_path}")
+        if verbose:
+            AbstractFinderCommand._report_timings(console, sanitizer.timings, sanitizer.skipped)
 
     @staticmethod
     def __compile_doku(
@@ -19,6 +19,7 @@ class CompileDokuCommand(AbstractFinderCommand):
         pattern: str = "*",
         verbose: bool = False,
     ) -> None:
+        AbstractFinderCommand._enable_caches()
         CompileDokuCommand.__copy(
             root_folder=root_folder, excluded_folders=excluded_folders, excluded_files=excluded_files
         )
@@ -3,8 +3,10 @@ from __future__ import annotations
 from pathlib import Path
 
 import click
+from rich.console import Console
 
 from doku_gpt.command.abstract_finder_command import AbstractFinderCommand
+from doku_gpt.extractor.web_page_prefetcher import WebPagePrefetcher
 from doku_gpt.settings.settings_handler import SettingsHandler
 
 
@@ -12,17 +14,54 @@ class CreateSettingsCommand(AbstractFinderCommand):
     @staticmethod
     @click.command()
     @AbstractFinderCommand.common_options
+    @AbstractFinderCommand.offline_option
+    @click.option(
+        "-w",
+        "--workers",
+        default=WebPagePrefetcher.DEFAULT_WORKERS,
+        type=click.IntRange(min=1),
+        show_default=True,
+        help="Number of external links fetched in parallel (1 fetches them one by one).",
+    )
+    @click.option(
+        "-t",
+        "--http-cache",
+        is_flag=True,
+        default=False,
+        show_default=True,
+        help="Keep the titles and status of external links on disk and revalidate them once they expire.",
+    )
+    @click.option(
+        "--http-cache-days",
+        default=30.0,
+        type=click.FloatRange(min=0),
+        show_default=True,
+        help="Days an external link is trusted without asking the server again.",
+    )
     def execute(
         root_folder: Path,
         excluded_folders: tuple[str, ...],
         excluded_files: tuple[str, ...],
         pattern: str = "*",
         verbose: bool = False,
+        workers: int = WebPagePrefetcher.DEFAULT_WORKERS,
+        http_cache: bool = False,
+        http_cache_days: float = 30.0,
+        offline: bool = False,
     ) -> None:
+        AbstractFinderCommand._enable_caches()
         default_excluded_folders, default_excluded_files = AbstractFinderCommand._handle_excluded(
             excluded_folders=excluded_folders, excluded_files=excluded_files
         )
         handler = SettingsHandler(
-            root_folder=root_folder, excluded_folders=default_excluded_folders, excluded_files=default_excluded_files
+            root_folder=root_folder,
+            excluded_folders=default_excluded_folders,
+            excluded_files=default_excluded_files,
+            workers=workers,
+            http_cache=http_cache,
+            http_cache_ttl=http_cache_days * 24 * 60 * 60,
+            offline=offline,
         )
         handler.create()
+        if offline:
+            AbstractFinderCommand._report_deferred(Console())
@@ -6,20 +6,29 @@ import click
 from rich.console import Console
 
 from doku_gpt.command.abstract_finder_command import AbstractFinderCommand
-from doku_gpt.sanitizer.root.page_sanitizer import PageSanitizer
+from doku_gpt.sanitizer.root.parallel_page_sanitizer import ParallelPageSanitizer
 
 
 class SanitizeNamespaceCommand(AbstractFinderCommand):
     @staticmethod
     @click.command()
     @AbstractFinderCommand.common_options
+    @AbstractFinderCommand.offline_option
+    @AbstractFinderCommand.jobs_option
+    @AbstractFinderCommand.incremental_option
     def execute(
         root_folder: Path,
         excluded_folders: tuple[str, ...],
         excluded_files: tuple[str, ...],
         pattern: str = "*",
         verbose: bool = False,
+        offline: bool = False,
+        jobs: int = 1,
+        incremental: bool = False,
     ) -> None:
+        AbstractFinderCommand._enable_caches()
+        if offline:
+            AbstractFinderCommand._start_offline(root_folder)
         finder = SanitizeNamespaceCommand._create_finder(
             root_folder=root_folder,
             excluded_folders=excluded_folders,
@@ -27,8 +36,12 @@ class SanitizeNamespaceCommand(AbstractFinderCommand):
         )
 
         files = finder.find_files(pattern)
-        for file in files:
-            sanitizer = PageSanitizer(root_folder=root_folder, page_path=file)
-            was_sanitized = sanitizer.sanitize()
+        sanitizer = ParallelPageSanitizer(root_folder=root_folder, jobs=jobs, offline=offline, incremental=incremental)
+        for file, was_sanitized in sanitizer.sanitize(files):
             if was_sanitized and verbose:
                 Console().print(f"Sanitized: {file}")
+        if verbose:
+            AbstractFinderCommand._report_timings(Console(), sanitizer.timings, sanitizer.skipped)
+
+        if offline:
+            AbstractFinderCommand._stop_offline(Console())
@@ -6,6 +6,7 @@ from pathlib import Path, PurePosixPath
 from slugify import slugify
 
 from doku_gpt.abstact_root_folder import AbstractRootFolder
+from doku_gpt.cache.path_resolution_cache import PathResolutionCache
 from doku_gpt.error.invalid_value_error import InvalidValueError
 from doku_gpt.extractor.doku_page_extractor import DokuPageExtractor
 from doku_gpt.finder.finder import Finder
@@ -18,7 +19,7 @@ class IndexCompiler(AbstractRootFolder):
             excluded_folders=self.excluded_folders,
             excluded_files=self.excluded_files,
         )
-        root_path = Path(self.root_folder).resolve()
+        root_path = PathResolutionCache.resolve(self.root_folder)
         folder_paths: list[Path] = finder.find_folders()
 
         children_by_parent = self.__index_children_by_parent(folder_paths=folder_paths, root_path=root_path)
@@ -36,7 +37,7 @@ class IndexCompiler(AbstractRootFolder):
         for absolute_path in folder_paths:
             relative_path = self.__relative_to_path(absolute_path=absolute_path, root_path=root_path)
             code = code_by_relative[relative_path]
-            index_rows.append(self.__build_row(folder=absolute_path.resolve(), code=code))
+            index_rows.append(self.__build_row(folder=PathResolutionCache.resolve(absolute_path), code=code))
 
         index_rows.sort(key=lambda row: self.__natural_key(str(row["index"])))
         return index_rows
@@ -70,7 +71,7 @@ class IndexCompiler(AbstractRootFolder):
             )
 
     def __relative_to_path(self, absolute_path: Path, root_path: Path) -> str:
-        return PurePosixPath(absolute_path.resolve().relative_to(root_path).as_posix()).as_posix()
+        return PurePosixPath(PathResolutionCache.resolve(absolute_path).relative_to(root_path).as_posix()).as_posix()
 
     def __index_parent_of(self, relative_path: str) -> str:
         relative_posix = PurePosixPath(relative_path)
@@ -97,7 +98,7 @@ class IndexCompiler(AbstractRootFolder):
         return {"folder": folder, "file": file_path, "page": page, "title": title, "index": code}
 
     def __fetch_title(self, folder: Path) -> tuple[str | None, str | None]:
-        start_path = folder.joinpath("start.txt").resolve()
+        start_path = PathResolutionCache.resolve(folder.joinpath("start.txt"))
         if DokuPageExtractor.file_exists(start_path):
             title = DokuPageExtractor.extract_title(start_path)
             if title is not None:
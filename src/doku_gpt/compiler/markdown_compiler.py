@@ -6,6 +6,7 @@ from datetime import date
 from pathlib import Path
 
 from doku_gpt.adapter.page_adapter import PageAdapter
+from doku_gpt.cache.path_resolution_cache import PathResolutionCache
 from doku_gpt.error.invalid_path_error import InvalidPathError
 from doku_gpt.error.invalid_value_error import InvalidValueError
 
@@ -27,6 +28,7 @@ class MarkdownCompiler:
                 check=True,
             )
             txt_file.unlink(missing_ok=True)
+            PathResolutionCache.forget(txt_file)
 
     def __add_header(self) -> None:
         md_files = list(self.COMPILE_DESTINATION.glob("gpt_00*.md"))
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import re
-import unicodedata
 from pathlib import Path
 
-from slugify import slugify
-
 from doku_gpt.adapter.page_adapter import PageAdapter
 from doku_gpt.enum.valid_file import ValidFile
 from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.extractor.page_header import PageHeader
+from doku_gpt.extractor.page_header_index import PageHeaderIndex
 from doku_gpt.validator.path.file_validator import FileValidator
 from doku_gpt.validator.path.path_extension_validator import PathExtensionValidator
 
@@ -86,33 +85,28 @@ class DokuPageExtractor:
         # Normalize line endings in-memory for consistent line math.
         content = content.replace("\r\n", "\n").replace("\r", "\n")
 
-        header_match = None
+        body_end_index: int | None = None
         if fragment is None or str(fragment).strip() == "":
             found = cls.__REGEX_TITLE.search(content)
             if not found:
                 return None
-            header_match = found
+            body_start_index = found.end()
+            # The title match is not one of the indexed headers: look for the next header from its end.
+            next_header = cls.__REGEX_HEADERS.search(content, body_start_index)
+            if next_header is not None:
+                body_end_index = next_header.start()
         else:
-            line_number, matched_title = cls.__handle_title_fragment(content, str(fragment))
-            if line_number == -1 or matched_title is None:
-                return None
-            # Locate the concrete match object for the identified header line.
-            for match in cls.__REGEX_HEADERS.finditer(content):
-                title_text = match.group("title").strip()
-                current_line = 1 + content.count("\n", 0, match.start())
-                if current_line == line_number and title_text == matched_title:
-                    header_match = match
-                    break
-            if header_match is None:
+            header_index = PageHeaderIndex.for_content(content)
+            position = cls.__find_header(header_index, str(fragment))
+            if position is None:
                 return None
+            body_start_index = header_index.headers[position].end
+            if position + 1 < len(header_index.headers):
+                body_end_index = header_index.headers[position + 1].start
 
         # Delimit body: from end of this header to start of next header (or EOF).
-        body_start_index = header_match.end()
-        next_header_start = None
-        for match in cls.__REGEX_HEADERS.finditer(content, pos=header_match.end()):
-            next_header_start = match.start()
-            break
-        body_end_index = next_header_start if next_header_start is not None else len(content)
+        if body_end_index is None:
+            body_end_index = len(content)
         body_slice = content[body_start_index:body_end_index]
 
         # Build paragraphs: blocks of non-empty lines separated by blank lines.
@@ -206,6 +200,16 @@ class DokuPageExtractor:
 
     @classmethod
     def __handle_title_fragment(cls, content: str, fragment: str) -> tuple[int, str | None]:
+        header_index = PageHeaderIndex.for_content(content)
+        position = cls.__find_header(header_index, fragment)
+        if position is None:
+            return -1, None
+
+        header = header_index.headers[position]
+        return header.line, header.title
+
+    @classmethod
+    def __find_header(cls, header_index: PageHeaderIndex, fragment: str) -> int | None:
         fragment_clean = str(fragment).strip()
         if fragment_clean.startswith("#"):
             fragment_clean = fragment_clean[1:]
@@ -219,33 +223,12 @@ class DokuPageExtractor:
             fragment_separator = "-"
 
         fragment_tokens_raw = [segment for segment in fragment_clean.split(fragment_separator) if segment]
-        fragment_tokens_norm = [cls.__normalize_number_token(token) for token in fragment_tokens_raw]
-
-        fragment_romanized = cls.__slug_to_tokens(" ".join(fragment_tokens_norm))
-        fragment_deaccent = cls.__slug_to_tokens(cls.__deaccent_only(" ".join(fragment_tokens_norm)))
-
-        best_line = -1
-        best_title = None
+        fragment_tokens_norm = [PageHeader.normalize_number_token(token) for token in fragment_tokens_raw]
 
-        for match in cls.__REGEX_HEADERS.finditer(content):
-            title_text = match.group("title").strip()
-            line_index = 1 + content.count("\n", 0, match.start())
+        fragment_romanized = PageHeader.slug_to_tokens(" ".join(fragment_tokens_norm))
+        fragment_deaccent = PageHeader.slug_to_tokens(PageHeader.deaccent_only(" ".join(fragment_tokens_norm)))
 
-            title_tokens_source = cls.__neutralize_separators(title_text)
-            title_tokens_romanized = cls.__slug_to_tokens(title_tokens_source)
-            title_tokens_deaccent = cls.__slug_to_tokens(cls.__deaccent_only(title_tokens_source))
-
-            if cls.__is_subsequence(fragment_romanized, title_tokens_romanized):
-                best_line = line_index
-                best_title = title_text
-                break
-
-            if cls.__is_subsequence(fragment_deaccent, title_tokens_deaccent):
-                best_line = line_index
-                best_title = title_text
-                break
-
-        return best_line, best_title
+        return header_index.find(romanized_tokens=fragment_romanized, deaccent_tokens=fragment_deaccent)
 
     @classmethod
     def __handle_headers(cls, page_content: str) -> str | None:
@@ -253,48 +236,3 @@ class DokuPageExtractor:
         if not matches:
             return None
         return None
-
-    @staticmethod
-    def __neutralize_separators(value: str) -> str:
-        replaced = value.replace("-", " ").replace("_", " ")
-        collapsed = re.sub(r"\s{2,}", " ", replaced)
-        return collapsed.strip().casefold()
-
-    @staticmethod
-    def __slug_to_tokens(value: str) -> list[str]:
-        slug_as_spaces = slugify(value, separator=" ", lowercase=True)
-        tokens = [token for token in slug_as_spaces.split(" ") if token]
-        normalized_tokens = [DokuPageExtractor.__normalize_number_token(token) for token in tokens]
-        return normalized_tokens
-
-    @staticmethod
-    def __normalize_number_token(token: str) -> str:
-        if token.isdigit():
-            try:
-                number_value = int(token, 10)
-                return str(number_value)
-            except ValueError:
-                return token
-        return token
-
-    @staticmethod
-    def __deaccent_only(value: str) -> str:
-        decomposed = unicodedata.normalize("NFKD", value)
-        without_marks = "".join(character for character in decomposed if not unicodedata.combining(character))
-        return without_marks
-
-    @staticmethod
-    def __is_subsequence(needles: list[str], haystack: list[str]) -> bool:
-        if not needles:
-            return False
-        position = 0
-        for needle in needles:
-            found_index = -1
-            for index in range(position, len(haystack)):
-                if haystack[index] == needle:
-                    found_index = index
-                    break
-            if found_index == -1:
-                return False
-            position = found_index + 1
-        return True
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+
+from slugify import slugify
+
+
+class PageHeader:
+    """
+    One header of a page, as found by the header regex: offsets of the whole match, 1-based line of its start,
+    level (number of '=') and title. The romanized and deaccent-only tokens used for fragment matching are computed
+    on first use and kept.
+    """
+
+    __slots__ = ("__deaccent", "__romanized", "end", "level", "line", "start", "title")
+
+    def __init__(self, start: int, end: int, line: int, level: int, title: str) -> None:
+        self.start = start
+        self.end = end
+        self.line = line
+        self.level = level
+        self.title = title
+        self.__romanized: list[str] | None = None
+        self.__deaccent: list[str] | None = None
+
+    @property
+    def romanized_tokens(self) -> list[str]:
+        if self.__romanized is None:
+            self.__romanized = self.slug_to_tokens(self.neutralize_separators(self.title))
+        return self.__romanized
+
+    @property
+    def deaccent_tokens(self) -> list[str]:
+        if self.__deaccent is None:
+            self.__deaccent = self.slug_to_tokens(self.deaccent_only(self.neutralize_separators(self.title)))
+        return self.__deaccent
+
+    @staticmethod
+    def neutralize_separators(value: str) -> str:
+        replaced = value.replace("-", " ").replace("_", " ")
+        collapsed = re.sub(r"\s{2,}", " ", replaced)
+        return collapsed.strip().casefold()
+
+    @staticmethod
+    def slug_to_tokens(value: str) -> list[str]:
+        slug_as_spaces = slugify(value, separator=" ", lowercase=True)
+        tokens = [token for token in slug_as_spaces.split(" ") if token]
+        return [PageHeader.normalize_number_token(token) for token in tokens]
+
+    @staticmethod
+    def normalize_number_token(token: str) -> str:
+        if token.isdigit():
+            try:
+                return str(int(token, 10))
+            except ValueError:
+                return token
+        return token
+
+    @staticmethod
+    def deaccent_only(value: str) -> str:
+        decomposed = unicodedata.normalize("NFKD", value)
+        return "".join(character for character in decomposed if not unicodedata.combining(character))
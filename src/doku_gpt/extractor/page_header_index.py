@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import re
+from collections import OrderedDict
+
+from doku_gpt.extractor.page_header import PageHeader
+
+
+class PageHeaderIndex:
+    """
+    All headers of one page content, found in a single regex pass with incremental line numbers.
+
+    Indexes are memoized by content, so a page version is indexed once however many fragments point into it.
+    """
+
+    MAX_PAGES = 256
+
+    __REGEX_HEADERS = re.compile(
+        r"^\s*(?P<eq>={1,6})\s+(?P<title>.+?)\s+(?P=eq)\s*$",
+        re.MULTILINE,
+    )
+    __INDEXES: OrderedDict[str, PageHeaderIndex] = OrderedDict()
+
+    def __init__(self, content: str) -> None:
+        self.headers: list[PageHeader] = []
+
+        line = 1
+        previous_start = 0
+        for match in self.__REGEX_HEADERS.finditer(content):
+            line += content.count("\n", previous_start, match.start())
+            previous_start = match.start()
+            self.headers.append(
+                PageHeader(
+                    start=match.start(),
+                    end=match.end(),
+                    line=line,
+                    level=len(match.group("eq")),
+                    title=match.group("title").strip(),
+                )
+            )
+
+    @classmethod
+    def for_content(cls, content: str) -> PageHeaderIndex:
+        index = cls.__INDEXES.get(content)
+        if index is not None:
+            cls.__INDEXES.move_to_end(content)
+            return index
+
+        index = cls(content)
+        cls.__INDEXES[content] = index
+        if len(cls.__INDEXES) > cls.MAX_PAGES:
+            cls.__INDEXES.popitem(last=False)
+        return index
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.__INDEXES.clear()
+
+    def find(self, romanized_tokens: list[str], deaccent_tokens: list[str]) -> int | None:
+        """Return the position of the first header whose tokens hold the given ones in order, or None."""
+        for position, header in enumerate(self.headers):
+            if self.__is_subsequence(romanized_tokens, header.romanized_tokens):
+                return position
+            if self.__is_subsequence(deaccent_tokens, header.deaccent_tokens):
+                return position
+        return None
+
+    @staticmethod
+    def __is_subsequence(needles: list[str], haystack: list[str]) -> bool:
+        if not needles:
+            return False
+        position = 0
+        for needle in needles:
+            found_index = -1
+            for index in range(position, len(haystack)):
+                if haystack[index] == needle:
+                    found_index = index
+                    break
+            if found_index == -1:
+                return False
+            position = found_index + 1
+        return True
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from html.parser import HTMLParser
+
+
+class HeadMetaParser(HTMLParser):
+    """
+    Incremental parser for the head of an HTML document. Fed chunk by chunk, it remembers the 'content' of the first
+    tag carrying each 'property' attribute (and of the first such meta tag) and sets 'done' at </head> or at the first
+    <body> tag, after which everything else is ignored.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.done = False
+        self.__metas: dict[str, str | None] = {}
+        self.__tags: dict[str, str | None] = {}
+
+    def first_meta(self, property: str) -> str | None:
+        return self.__metas.get(property)
+
+    def first_tag(self, property: str) -> str | None:
+        return self.__tags.get(property)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self.done:
+            return
+        if tag == "body":
+            self.done = True
+            return
+
+        values = dict(attrs)
+        property = values.get("property")
+        if property is None:
+            return
+
+        content = values.get("content")
+        self.__tags.setdefault(property, content)
+        if tag == "meta":
+            self.__metas.setdefault(property, content)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "head":
+            self.done = True
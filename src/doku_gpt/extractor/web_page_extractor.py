@@ -1,22 +1,43 @@
 from __future__ import annotations
 
+import codecs
 import re
+import threading
 from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
 from bs4.element import Tag
+from urllib3.exceptions import HTTPError
 
+from doku_gpt.cache.http_metadata_cache import HttpMetadataCache
 from doku_gpt.extractor.normalizer.imdb_title_normalizer import ImdbTitleNormalizer
 from doku_gpt.extractor.normalizer.wikipedia_title_normalizer import WikipediaTitleNormalizer
+from doku_gpt.extractor.parser.head_meta_parser import HeadMetaParser
+from doku_gpt.extractor.web_request_coalescer import WebRequestCoalescer
+from doku_gpt.model.http_metadata import HttpMetadata
+from doku_gpt.registry.http_session_registry import HttpSessionRegistry
 
 
 class WebPageExtractor:
+    # Titles are read from the head of the page as it streams in; False parses the whole page with BeautifulSoup.
+    HEAD_ONLY = True
+    MAX_HEAD_BYTES = 1024 * 1024
+    CHUNK_BYTES = 16 * 1024
+    # An unread remainder up to this size is drained so the connection goes back to the pool instead of being closed.
+    DRAIN_BYTES = 64 * 1024
+    # Nothing is requested: titles and status come from HttpMetadataCache only, whatever their age.
+    OFFLINE = False
+
     __HEADERS = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
     }
+    __GET = "get"
+    __HEAD = "head"
+    __LOCK = threading.Lock()
+    __DEFERRED = 0
 
     @classmethod
     def can_fetch(cls, url: str) -> bool:
@@ -28,22 +49,127 @@ class WebPageExtractor:
         if not cls.can_fetch(url):
             return True
 
-        try:
-            status_code = cls.__head(url).status_code < 400
-            return status_code
-        except requests.RequestException:
-            return False
+        # A page already fetched successfully with GET exists, there is no need to ask again with HEAD.
+        fetched, result = WebRequestCoalescer.result(cls.__GET, url)
+        if fetched and result[1] is not None and result[1] < 400:
+            return True
+
+        exists: bool = WebRequestCoalescer.run(cls.__HEAD, url, lambda: cls.__check_exists(url))
+        return exists
 
     @classmethod
     def extract_title(cls, url: str) -> str | None:
         if not cls.can_fetch(url):
             return None
 
+        title: str | None
+        title, _ = WebRequestCoalescer.run(cls.__GET, url, lambda: cls.__extract_title(url))
+        return title
+
+    @classmethod
+    def is_known(cls, url: str) -> bool:
+        """Whether anything was already learned about the URL, so it can be resolved without the network."""
+        if not cls.OFFLINE or not cls.can_fetch(url):
+            return True
+
+        for kind in (HttpMetadataCache.TITLE, HttpMetadataCache.EXISTS):
+            entry, _ = HttpMetadataCache.get(kind, url)
+            if entry is not None:
+                return True
+        return False
+
+    @classmethod
+    def defer(cls, count: int = 1) -> None:
+        """Count links left unresolved because they could not be checked offline."""
+        with cls.__LOCK:
+            cls.__DEFERRED += count
+
+    @classmethod
+    def deferred(cls) -> int:
+        return cls.__DEFERRED
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the titles, existence checks and deferred links of the previous run."""
+        WebRequestCoalescer.reset()
+        with cls.__LOCK:
+            cls.__DEFERRED = 0
+
+    @classmethod
+    def __check_exists(cls, url: str) -> bool:
+        entry, fresh = HttpMetadataCache.get(HttpMetadataCache.EXISTS, url)
+        if entry is not None and (fresh or cls.OFFLINE):
+            return entry.status < 400
+        if cls.OFFLINE:
+            return False
+
         try:
-            soup = cls.__fetch(url)
+            response = cls.__head(url, cls.__validators(entry))
+        except requests.RequestException:
+            return False
+
+        if entry is not None and response.status_code == 304:
+            HttpMetadataCache.touch(HttpMetadataCache.EXISTS, url)
+            return entry.status < 400
+
+        cls.__store(HttpMetadataCache.EXISTS, url, response, None)
+        return response.status_code < 400
+
+    @classmethod
+    def __extract_title(cls, url: str) -> tuple[str | None, int | None]:
+        entry, fresh = HttpMetadataCache.get(HttpMetadataCache.TITLE, url)
+        if entry is not None and (fresh or cls.OFFLINE):
+            return entry.value, entry.status
+        if cls.OFFLINE:
+            return None, None
+
+        try:
+            response = cls.__fetch(url, cls.__validators(entry))
+            try:
+                if entry is not None and response.status_code == 304:
+                    HttpMetadataCache.touch(HttpMetadataCache.TITLE, url)
+                    return entry.value, entry.status
+
+                if response.status_code >= 400:
+                    cls.__store(HttpMetadataCache.TITLE, url, response, None)
+                    return None, response.status_code
+
+                title = cls.__read_head_title(response) if cls.HEAD_ONLY else cls.__read_title(response)
+            finally:
+                cls.__release(response)
         except requests.exceptions.RequestException:
-            return None
+            return None, None
+
+        cls.__store(HttpMetadataCache.TITLE, url, response, title)
+        return title, response.status_code
+
+    @classmethod
+    def __read_head_title(cls, response: requests.Response) -> str | None:
+        parser = HeadMetaParser()
+        try:
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        read = 0
+        for chunk in response.iter_content(chunk_size=cls.CHUNK_BYTES):
+            parser.feed(decoder.decode(chunk))
+            read += len(chunk)
+            if parser.done or read >= cls.MAX_HEAD_BYTES:
+                break
+        else:
+            parser.feed(decoder.decode(b"", final=True))
+            parser.close()
+
+        for property in ("og:title", "twitter:title"):
+            title = cls.__clean_content(parser.first_meta(property))
+            if title is not None:
+                return title
+
+        return cls.__clean_content(parser.first_tag("title"))
 
+    @classmethod
+    def __read_title(cls, response: requests.Response) -> str | None:
+        soup = BeautifulSoup(response.text or "", "html.parser")
         og_title = cls.__handle_og_title(soup=soup, property="og:title")
         if og_title is not None:
             return og_title
@@ -60,11 +186,7 @@ class WebPageExtractor:
         if not isinstance(og_title, Tag):
             return None
 
-        value = str(og_title.get("content") or "").strip()
-        if value != "":
-            return cls.__clean(value)
-
-        return None
+        return cls.__clean_content(og_title.get("content"))
 
     @classmethod
     def __handle_title(cls, soup: BeautifulSoup) -> str | None:
@@ -72,21 +194,57 @@ class WebPageExtractor:
         if not isinstance(title, Tag):
             return None
 
-        value = str(title.get("content") or "").strip()
+        return cls.__clean_content(title.get("content"))
+
+    @classmethod
+    def __clean_content(cls, content: object) -> str | None:
+        value = str(content or "").strip()
         if value != "":
             return cls.__clean(value)
 
         return None
 
     @classmethod
-    def __head(cls, url: str):
-        return requests.head(url=url.strip(), headers=cls.__HEADERS, allow_redirects=True, timeout=5)
+    def __head(cls, url: str, validators: dict[str, str]) -> requests.Response:
+        return HttpSessionRegistry.get_session().head(
+            url=url.strip(), headers=cls.__HEADERS | validators, allow_redirects=True, timeout=5
+        )
+
+    @classmethod
+    def __fetch(cls, url: str, validators: dict[str, str]) -> requests.Response:
+        return HttpSessionRegistry.get_session().get(url, headers=cls.__HEADERS | validators, timeout=10.0, stream=True)
 
     @classmethod
-    def __fetch(cls, url: str) -> BeautifulSoup:
-        response = requests.get(url, headers=cls.__HEADERS, timeout=10.0)
-        response.raise_for_status()
-        return BeautifulSoup(response.text or "", "html.parser")
+    def __release(cls, response: requests.Response) -> None:
+        try:
+            response.raw.read(cls.DRAIN_BYTES)
+        except (OSError, HTTPError):
+            pass
+        response.close()
+
+    @staticmethod
+    def __validators(entry: HttpMetadata | None) -> dict[str, str]:
+        validators: dict[str, str] = {}
+        if entry is not None and entry.etag:
+            validators["If-None-Match"] = entry.etag
+        if entry is not None and entry.last_modified:
+            validators["If-Modified-Since"] = entry.last_modified
+        return validators
+
+    @staticmethod
+    def __store(kind: str, url: str, response: requests.Response, value: str | None) -> None:
+        # Server errors are usually transient, so they are retried by the next run instead of being remembered.
+        if response.status_code >= 500:
+            return
+        HttpMetadataCache.put(
+            kind=kind,
+            url=url,
+            final_url=response.url or url,
+            status=response.status_code,
+            value=value,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
 
     @classmethod
     def __clean(cls, value: str) -> str | None:
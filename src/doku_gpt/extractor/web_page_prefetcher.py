@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
+
+
+class WebPagePrefetcher:
+    """
+    Fetch the titles and existence of many URLs in parallel through WebPageExtractor, which keeps the results for the
+    rest of the run. At most 'workers' requests are in flight, and at most 'per_host' of them to the same host.
+    """
+
+    DEFAULT_WORKERS = 8
+    DEFAULT_PER_HOST = 2
+
+    def __init__(self, workers: int = DEFAULT_WORKERS, per_host: int = DEFAULT_PER_HOST) -> None:
+        self.workers = max(1, workers)
+        self.per_host = max(1, per_host)
+        self.__lock = threading.Lock()
+        self.__hosts: dict[str, threading.Semaphore] = {}
+
+    def prefetch(self, urls: dict[str, bool]) -> None:
+        """
+        'urls' maps each URL to whether a link needs its title. As in the resolvers, a URL whose title is needed is
+        fetched with GET and only checked with HEAD when no title was found; the others are only checked with HEAD.
+        """
+        fetchable = {url: needs_title for url, needs_title in urls.items() if WebPageExtractor.can_fetch(url)}
+        if not fetchable:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(fetchable))) as executor:
+            for future in [executor.submit(self.__fetch, url, needs_title) for url, needs_title in fetchable.items()]:
+                future.result()
+
+    def __fetch(self, url: str, needs_title: bool) -> None:
+        with self.__host_semaphore(url):
+            title = WebPageExtractor.extract_title(url) if needs_title else None
+            if not title:
+                WebPageExtractor.url_exists(url)
+
+    def __host_semaphore(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc.lower()
+        with self.__lock:
+            semaphore = self.__hosts.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.per_host)
+                self.__hosts[host] = semaphore
+            return semaphore
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from concurrent.futures import CancelledError, Future
+from typing import Any, ClassVar
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+
+
+class WebRequestCoalescer:
+    """
+    Run-scoped table of web requests keyed by kind and normalized URL. The first caller of a key runs the request;
+    concurrent and later callers wait for its future and share the result, so each URL is requested at most once per
+    kind until reset() starts a new run. An interrupted request (KeyboardInterrupt, SystemExit) is only raised in the
+    caller that ran it: the others get a CancelledError and the next caller of the key requests it again.
+    """
+
+    __DEFAULT_PORTS: ClassVar[dict[str, int]] = {"http": 80, "https": 443}
+    __LOCK = threading.Lock()
+    __FUTURES: ClassVar[dict[tuple[str, str], Future[Any]]] = {}
+    __STARTED = 0
+    __SHARED = 0
+
+    @classmethod
+    def run(cls, kind: str, url: str, request: Callable[[], Any]) -> Any:
+        key = (kind, cls.normalize(url))
+        with cls.__LOCK:
+            shared = cls.__FUTURES.get(key)
+            if shared is None:
+                future: Future[Any] = Future()
+                cls.__FUTURES[key] = future
+                cls.__STARTED += 1
+            else:
+                future = shared
+                cls.__SHARED += 1
+
+        if shared is not None:
+            return future.result()
+
+        try:
+            result = request()
+        except Exception as error:
+            future.set_exception(error)
+            raise
+        except BaseException:
+            with cls.__LOCK:
+                cls.__FUTURES.pop(key, None)
+            future.cancel()
+            raise
+        future.set_result(result)
+        return result
+
+    @classmethod
+    def result(cls, kind: str, url: str) -> tuple[bool, Any]:
+        """Return whether a request of this kind was already made for the URL, and its result (waiting if needed)."""
+        with cls.__LOCK:
+            future = cls.__FUTURES.get((kind, cls.normalize(url)))
+        if future is None:
+            return False, None
+        try:
+            return True, future.result()
+        except (requests.RequestException, OSError, CancelledError):
+            return False, None
+
+    @classmethod
+    def normalize(cls, url: str) -> str:
+        """Lower-case scheme and host, drop the default port and the fragment (which is never sent)."""
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        try:
+            port = parts.port
+        except ValueError:
+            return url.strip()
+
+        host = (parts.hostname or "").lower()
+        if ":" in host:
+            host = f"[{host}]"
+        if port is not None and port != cls.__DEFAULT_PORTS.get(scheme):
+            host = f"{host}:{port}"
+        if parts.username is not None or parts.password is not None:
+            host = parts.netloc.rsplit("@", 1)[0] + "@" + host
+        return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+    @classmethod
+    def statistics(cls) -> dict[str, int]:
+        return {"requests": cls.__STARTED, "shared": cls.__SHARED}
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls.__LOCK:
+            cls.__FUTURES = {}
+            cls.__STARTED = 0
+            cls.__SHARED = 0
@@ -4,8 +4,9 @@ import re
 from pathlib import Path
 
 from doku_gpt.abstact_root_folder import AbstractRootFolder
+from doku_gpt.cache.link_tag_parse_cache import LinkTagParseCache, ParsedLinkTag
 from doku_gpt.enum.link_type import LinkType
-from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.model.compact_link_tag import CompactLinkTag
 
 
 class LinkTagFactory(AbstractRootFolder):
@@ -24,9 +25,26 @@ class LinkTagFactory(AbstractRootFolder):
     ):
         super().__init__(root_folder=root_folder)
 
-    def get(self, link_tag: str) -> LinkTag:
-        self.__link_tag: LinkTag = LinkTag()
-        self.__link_tag.attach_root(self.root_folder)
+    def get(self, link_tag: str) -> CompactLinkTag:
+        parsed = LinkTagParseCache.get(link_tag)
+        if parsed is None:
+            parsed = self.__parse(link_tag)
+            LinkTagParseCache.put(link_tag, parsed)
+
+        link_type, target_prefix, target_suffix, target_fragment, target_query, label = parsed
+        result = CompactLinkTag(
+            link_type=link_type,
+            target_prefix=target_prefix,
+            target_suffix=target_suffix,
+            target_fragment=target_fragment,
+            target_query=target_query,
+            label=label,
+        )
+        result.attach_root(self.root_folder)
+        return result
+
+    def __parse(self, link_tag: str) -> ParsedLinkTag:
+        self.__link_tag: CompactLinkTag = CompactLinkTag()
 
         cleaned_link_tag = link_tag.strip().lstrip("[").rstrip("]").strip()
         if "" == cleaned_link_tag:
@@ -39,7 +57,14 @@ class LinkTagFactory(AbstractRootFolder):
 
         self.__extract_target(cleaned_link_tag)
         self.__classify()
-        return self.__link_tag
+        return (
+            self.__link_tag.link_type,
+            self.__link_tag.target_prefix,
+            self.__link_tag.target_suffix,
+            self.__link_tag.target_fragment,
+            self.__link_tag.target_query,
+            self.__link_tag.label,
+        )
 
     def __extract_label(self, link_tag: str) -> str:
         if "|" not in link_tag:
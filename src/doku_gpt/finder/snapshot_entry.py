@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+class SnapshotEntry:
+    """Directory entry restored from a TreeSnapshot; mimics the parts of os.DirEntry used by the Walker."""
+
+    DIRECTORY = "d"
+    FILE = "f"
+    LINK = "l"
+    OTHER = "o"
+
+    __slots__ = ("accessible", "inode", "kind", "mtime_ns", "name", "path", "size")
+
+    def __init__(
+        self,
+        folder: str | Path,
+        name: str,
+        kind: str,
+        size: int,
+        mtime_ns: int,
+        inode: int,
+        accessible: bool,
+    ) -> None:
+        self.name = name
+        self.path = os.path.join(folder, name)
+        self.kind = kind
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.inode = inode
+        self.accessible = accessible
+
+    @classmethod
+    def from_dir_entry(cls, folder: str | Path, entry: os.DirEntry[str]) -> SnapshotEntry:
+        if entry.is_symlink():
+            kind = cls.LINK
+        elif entry.is_dir():
+            kind = cls.DIRECTORY
+        elif entry.is_file():
+            kind = cls.FILE
+        else:
+            kind = cls.OTHER
+
+        stat_result = entry.stat(follow_symlinks=False)
+        accessible = False
+        if kind != cls.LINK and not entry.name.startswith("."):
+            accessible = os.access(entry.path, os.R_OK | os.W_OK)
+
+        return cls(
+            folder=folder,
+            name=entry.name,
+            kind=kind,
+            size=stat_result.st_size,
+            mtime_ns=stat_result.st_mtime_ns,
+            inode=stat_result.st_ino,
+            accessible=accessible,
+        )
+
+    def is_dir(self) -> bool:
+        if self.kind == self.LINK:
+            return os.path.isdir(self.path)
+        return self.kind == self.DIRECTORY
+
+    def is_file(self) -> bool:
+        if self.kind == self.LINK:
+            return os.path.isfile(self.path)
+        return self.kind == self.FILE
+
+    def is_symlink(self) -> bool:
+        return self.kind == self.LINK
+
+    def to_row(self) -> list[str | int | bool]:
+        return [self.name, self.kind, self.size, self.mtime_ns, self.inode, self.accessible]
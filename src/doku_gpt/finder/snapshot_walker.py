@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from doku_gpt.finder.snapshot_entry import SnapshotEntry
+from doku_gpt.finder.tree_snapshot import TreeSnapshot
+from doku_gpt.finder.walker import Walker
+
+
+class SnapshotWalker(Walker):
+    def __init__(
+        self,
+        root_folder: Path,
+        excluded_folders: list[str],
+        excluded_files: list[str],
+        snapshot: TreeSnapshot,
+    ) -> None:
+        super().__init__(root_folder=root_folder, excluded_folders=excluded_folders, excluded_files=excluded_files)
+        self.snapshot = snapshot
+
+    def _scan(self, folder: Path) -> list[SnapshotEntry]:  # type: ignore[override]
+        return self.snapshot.scan(folder)
+
+    def _is_accessible(self, entry: SnapshotEntry) -> bool:  # type: ignore[override]
+        return entry.accessible
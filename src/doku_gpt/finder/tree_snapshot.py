@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from doku_gpt.finder.snapshot_entry import SnapshotEntry
+
+
+class TreeSnapshot:
+    """
+    On-disk listing of the wiki tree, stored next to '.doku_gpt.json'.
+
+    Every directory below the root is kept with its mtime, inode and entries (relative path, kind, size, mtime,
+    inode and accessibility); hidden entries are skipped since the walker never accepts them. A directory is only
+    scanned again when its own mtime or inode changed, so a walk over an unchanged tree costs one stat() per
+    directory. Entry sizes and mtimes reflect the last scan of their directory, and permission changes are only
+    noticed once that directory changes.
+    """
+
+    FILE_NAME = ".doku_gpt.snapshot.json"
+
+    __VERSION = 1
+    # Directories modified this close to the scan are not trusted: a change in the same mtime tick would go unseen.
+    __RACY_WINDOW_NS = 2_000_000_000
+    __SNAPSHOTS: dict[Path, TreeSnapshot] = {}
+
+    def __init__(self, root_folder: Path) -> None:
+        self.root_folder = root_folder
+        self.file = root_folder.joinpath(self.FILE_NAME)
+        self.__directories: dict[str, dict[str, Any]] = {}
+        self.__dirty = False
+        self.__load()
+
+    @classmethod
+    def for_root(cls, root_folder: Path) -> TreeSnapshot:
+        """Return the snapshot shared by every Finder of this root in the current process."""
+        snapshot = cls.__SNAPSHOTS.get(root_folder)
+        if snapshot is None:
+            snapshot = cls(root_folder)
+            cls.__SNAPSHOTS[root_folder] = snapshot
+        return snapshot
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.__SNAPSHOTS.clear()
+
+    def scan(self, folder: Path) -> list[SnapshotEntry]:
+        try:
+            folder_stat = os.stat(folder)
+        except OSError:
+            return []
+
+        key = self.__key(folder)
+        cached = None if key is None else self.__directories.get(key)
+        if (
+            cached is not None
+            and cached["mtime_ns"] == folder_stat.st_mtime_ns
+            and cached["inode"] == folder_stat.st_ino
+        ):
+            return [SnapshotEntry(folder, *row) for row in cached["entries"]]
+
+        scanned_ns = time.time_ns()
+        entries = self.__scan(folder)
+        if key is None:
+            return entries
+
+        self.__forget_removed_children(key=key, entries=entries)
+        if scanned_ns - folder_stat.st_mtime_ns <= self.__RACY_WINDOW_NS:
+            return entries
+
+        rows = [entry.to_row() for entry in entries]
+        if cached is None or cached["entries"] != rows:
+            self.__dirty = True
+        # A changed mtime alone (e.g. the snapshot file itself being rewritten) is kept in memory but does not force
+        # a save, otherwise every run would rewrite the snapshot because of its own previous write.
+        self.__directories[key] = {"mtime_ns": folder_stat.st_mtime_ns, "inode": folder_stat.st_ino, "entries": rows}
+        return entries
+
+    def save(self) -> None:
+        if not self.__dirty:
+            return
+
+        payload = {"version": self.__VERSION, "directories": self.__directories}
+        temporary_file = self.file.with_name(self.file.name + ".tmp")
+        try:
+            temporary_file.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(temporary_file, self.file)
+        except OSError:
+            temporary_file.unlink(missing_ok=True)
+            return
+        self.__dirty = False
+
+    def __load(self) -> None:
+        try:
+            payload = json.loads(self.file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+
+        if not isinstance(payload, dict) or payload.get("version") != self.__VERSION:
+            return
+
+        directories = payload.get("directories")
+        if isinstance(directories, dict):
+            self.__directories = directories
+
+    def __scan(self, folder: Path) -> list[SnapshotEntry]:
+        entries: list[SnapshotEntry] = []
+        try:
+            with os.scandir(folder) as iterator:
+                for entry in iterator:
+                    if entry.name.startswith(".") and not entry.is_symlink():
+                        continue
+                    try:
+                        entries.append(SnapshotEntry.from_dir_entry(folder=folder, entry=entry))
+                    except OSError:
+                        continue
+        except OSError:
+            return []
+        return entries
+
+    def __forget_removed_children(self, key: str, entries: list[SnapshotEntry]) -> None:
+        previous = self.__directories.get(key)
+        if previous is None:
+            return
+
+        current = {entry.name for entry in entries if entry.kind == SnapshotEntry.DIRECTORY}
+        removed = [row[0] for row in previous["entries"] if row[1] == SnapshotEntry.DIRECTORY and row[0] not in current]
+        for name in removed:
+            child_key = f"{key}/{name}" if key else name
+            for stored_key in list(self.__directories):
+                if stored_key == child_key or stored_key.startswith(child_key + "/"):
+                    del self.__directories[stored_key]
+                    self.__dirty = True
+
+    def __key(self, folder: Path) -> str | None:
+        try:
+            relative_folder = folder.relative_to(self.root_folder)
+        except ValueError:
+            return None
+        return "" if relative_folder == Path(".") else relative_folder.as_posix()
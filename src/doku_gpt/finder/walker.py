@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import fnmatch
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.validator.path.file_matches_pattern_validator import FileMatchesPatternValidator
+from doku_gpt.validator.path.file_validator import FileValidator
+from doku_gpt.validator.path.folder_validator import FolderValidator
+from doku_gpt.validator.path.path_context import PathContext
+from doku_gpt.validator.path.path_is_excluded_file_validator import PathIsExcludedFileValidator
+from doku_gpt.validator.path.path_is_excluded_folder_validator import PathIsExcludedFolderValidator
+
+
+class Walker:
+    """
+    Single pass directory walker built on os.scandir.
+
+    Applies the same rules as the Finder validators (type, readable, writable, hidden, excluded folder/file and
+    pattern), but answers them from the DirEntry data: entries below an accepted folder already share its resolved,
+    non-hidden and non-system parent, so they only cost one access() call. Hidden and excluded folders are pruned by
+    name before being scanned. Symbolic links are rare and go through the validators, exactly as before.
+    """
+
+    __ACCESS = os.R_OK | os.W_OK
+
+    def __init__(self, root_folder: Path, excluded_folders: list[str], excluded_files: list[str]) -> None:
+        self.root_folder = root_folder
+        self.excluded_folders = excluded_folders
+        self.excluded_files = excluded_files
+
+    def folders(self, base_folder: Path, pattern: str = "*", recursive: bool = True) -> list[Path]:
+        return [folder for folder, _ in self.__walk_folders(base_folder, pattern=pattern, recursive=recursive)]
+
+    def files(self, base_folder: Path, pattern: str = "*", recursive: bool = False) -> list[Path]:
+        folders: list[tuple[Path, bool]] = [(base_folder, self.__is_allowed(base_folder))]
+        if recursive:
+            folders.extend(self.__walk_folders(base_folder, pattern="*", recursive=True))
+
+        normalized_pattern = pattern.strip()
+        files: list[Path] = []
+        for folder, allowed in folders:
+            files.extend(self.__file_children(folder=folder, allowed=allowed, pattern=normalized_pattern))
+        return files
+
+    def _scan(self, folder: Path) -> list[os.DirEntry[str]]:
+        try:
+            with os.scandir(folder) as iterator:
+                return list(iterator)
+        except OSError:
+            return []
+
+    def _is_accessible(self, entry: os.DirEntry[str]) -> bool:
+        return os.access(entry.path, self.__ACCESS)
+
+    def __walk_folders(self, base_folder: Path, pattern: str, recursive: bool) -> Iterator[tuple[Path, bool]]:
+        prepared_pattern = "*" + pattern.strip().lstrip("*").strip()
+        pending: list[tuple[Path, bool]] = [(base_folder, self.__is_allowed(base_folder))]
+
+        while pending:
+            folder, allowed = pending.pop()
+            for entry in self._scan(folder):
+                if entry.is_symlink():
+                    found = self.__accept_linked_folder(entry)
+                    descend = False
+                else:
+                    found = self.__accept_folder(entry=entry, folder=folder, allowed=allowed)
+                    descend = recursive
+
+                if found is None or not fnmatch.fnmatchcase(str(found), prepared_pattern):
+                    continue
+
+                yield found, True
+                if descend:
+                    pending.append((found, True))
+
+    def __file_children(self, folder: Path, allowed: bool, pattern: str) -> Iterator[Path]:
+        for entry in self._scan(folder):
+            if entry.is_symlink():
+                found = self.__accept_linked_file(entry=entry, pattern=pattern)
+            else:
+                found = self.__accept_file(entry=entry, folder=folder, allowed=allowed, pattern=pattern)
+
+            if found is not None:
+                yield found
+
+    def __accept_folder(self, entry: os.DirEntry[str], folder: Path, allowed: bool) -> Path | None:
+        name = entry.name
+        if not allowed or name.startswith(".") or name in self.excluded_folders:
+            return None
+        if not entry.is_dir() or not self._is_accessible(entry):
+            return None
+        return folder.joinpath(name)
+
+    def __accept_file(self, entry: os.DirEntry[str], folder: Path, allowed: bool, pattern: str) -> Path | None:
+        name = entry.name
+        if not allowed or name.startswith("."):
+            return None
+        if not entry.is_file() or Path(name).stem in self.excluded_files:
+            return None
+        if not fnmatch.fnmatchcase(name, pattern) or not self._is_accessible(entry):
+            return None
+        return folder.joinpath(name)
+
+    def __accept_linked_folder(self, entry: os.DirEntry[str]) -> Path | None:
+        context = PathContext(entry.path)
+        try:
+            FolderValidator.validate_context(context)
+            return PathIsExcludedFolderValidator.validate_context(
+                context=context, excluded_folders=self.excluded_folders, root_folder=self.root_folder
+            )
+        except InvalidPathError:
+            return None
+
+    def __accept_linked_file(self, entry: os.DirEntry[str], pattern: str) -> Path | None:
+        context = PathContext(entry.path)
+        try:
+            file = FileValidator.validate_context(context)
+            PathIsExcludedFolderValidator.validate(
+                folder=file.parent, excluded_folders=self.excluded_folders, root_folder=self.root_folder
+            )
+            PathIsExcludedFileValidator.validate_context(context=context, excluded_files=self.excluded_files)
+            return FileMatchesPatternValidator.validate_context(context=context, pattern=pattern)
+        except InvalidPathError:
+            return None
+
+    def __is_allowed(self, folder: Path) -> bool:
+        try:
+            parts = folder.relative_to(self.root_folder).parts
+        except ValueError:
+            return False
+        return not any(part in self.excluded_folders for part in parts)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import re
 import sys
 from pprint import pprint
 from typing import List, NoReturn
 
+from doku_gpt.tokenizer.link_tag_tokenizer import LinkTagTokenizer
+
 
 @staticmethod
 def dump(object) -> None:
@@ -22,5 +23,4 @@ def dump_die(object) -> NoReturn:
 @staticmethod
 def extract_link_tags(line: str) -> List[str]:
     """Return all link_tags-like paths found inside [[...]] on this line."""
-    compiled = re.compile(r"(?P<token>\[\[(?P<path>[^\]|#]+)(?:#[^\]|]+)?(?:\|[^\]]*)?\]\])")
-    return [path.strip() for path, _ in compiled.findall(line)]
+    return [token.strip() for token, _ in LinkTagTokenizer.NAMESPACE_PATTERN.findall(line)]
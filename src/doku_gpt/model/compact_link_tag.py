@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from doku_gpt.enum.link_status import LinkStatus
+from doku_gpt.enum.link_type import LinkType
+from doku_gpt.model.abstract_link_tag import AbstractLinkTag
+from doku_gpt.model.link_tag import LinkTag
+
+
+class CompactLinkTag(AbstractLinkTag):
+    """
+    Slotted link tag built by LinkTagFactory and changed in place by the resolvers. It has the fields and behaviour of
+    LinkTag without pydantic; to_model() and from_model() convert at the settings file boundary.
+    """
+
+    __slots__ = (
+        "_root_folder",
+        "excerpt",
+        "label",
+        "link_status",
+        "link_type",
+        "resolved",
+        "target_fragment",
+        "target_prefix",
+        "target_query",
+        "target_suffix",
+    )
+    __FIELDS = (
+        "link_status",
+        "link_type",
+        "target_prefix",
+        "target_suffix",
+        "target_fragment",
+        "target_query",
+        "resolved",
+        "label",
+        "excerpt",
+    )
+
+    def __init__(
+        self,
+        link_status: LinkStatus = LinkStatus.NOT_VALIDATED,
+        link_type: LinkType | None = None,
+        target_prefix: str = "",
+        target_suffix: str | None = None,
+        target_fragment: str | None = None,
+        target_query: str | None = None,
+        resolved: str | None = None,
+        label: str | None = None,
+        excerpt: str | None = None,
+    ) -> None:
+        self.link_status = link_status
+        self.link_type = link_type
+        self.target_prefix = target_prefix
+        self.target_suffix = target_suffix
+        self.target_fragment = target_fragment
+        self.target_query = target_query
+        self.resolved = resolved
+        self.label = label
+        self.excerpt = excerpt
+        self._root_folder: Path | None = None
+
+    @classmethod
+    def from_model(cls, model: LinkTag) -> CompactLinkTag:
+        link_tag = cls(**{field: getattr(model, field) for field in cls.__FIELDS})
+        link_tag._root_folder = model._root_folder
+        return link_tag
+
+    def to_model(self) -> LinkTag:
+        model = LinkTag.model_construct(**{field: getattr(self, field) for field in self.__FIELDS})
+        if self._root_folder is not None:
+            model.attach_root(self._root_folder)
+        return model
+
+    def attach_root(self, root_folder: str | Path) -> None:
+        self._root_folder = Path(root_folder)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactLinkTag):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__FIELDS)
+        return f"{type(self).__name__}({fields})"
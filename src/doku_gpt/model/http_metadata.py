@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, ConfigDict
+
+
+class HttpMetadata(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    url: str
+    final_url: str
+    status: int
+    value: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: float = 0.0
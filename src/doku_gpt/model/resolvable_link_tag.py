@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Protocol
+
+from doku_gpt.enum.link_status import LinkStatus
+from doku_gpt.enum.link_type import LinkType
+
+
+class ResolvableLinkTag(Protocol):
+    """
+    What the link tag resolvers read and change on a tag, whether it is a LinkTag or a CompactLinkTag.
+    """
+
+    link_status: LinkStatus
+    link_type: LinkType | None
+    target_prefix: str
+    target_suffix: str | None
+    target_fragment: str | None
+    target_query: str | None
+    resolved: str | None
+    label: str | None
+    excerpt: str | None
+
+    @property
+    def is_external(self) -> bool: ...
+
+    @property
+    def is_internal(self) -> bool: ...
+
+    @property
+    def is_interwiki(self) -> bool: ...
+
+    @property
+    def core(self) -> str: ...
+
+    def attach_root(self, root_folder: str | Path) -> None: ...
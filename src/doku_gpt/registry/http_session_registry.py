@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+
+import requests
+
+from doku_gpt.adapter.counting_http_adapter import CountingHttpAdapter
+
+
+class HttpSessionRegistry:
+    """
+    Process wide requests.Session used for every outgoing HTTP request.
+
+    Connections are kept alive and pooled per host (up to POOL_HOSTS hosts and POOL_PER_HOST connections each, extra
+    requests to a busy host wait for a free connection), so links to the same sites reuse one TCP/TLS handshake.
+    """
+
+    POOL_HOSTS = 32
+    POOL_PER_HOST = 8
+
+    __LOCK = threading.Lock()
+    __SESSION: requests.Session | None = None
+    __ADAPTER: CountingHttpAdapter | None = None
+
+    @classmethod
+    def get_session(cls) -> requests.Session:
+        with cls.__LOCK:
+            if cls.__SESSION is None:
+                cls.__ADAPTER = CountingHttpAdapter(
+                    pool_connections=cls.POOL_HOSTS, pool_maxsize=cls.POOL_PER_HOST, pool_block=True
+                )
+                session = requests.Session()
+                session.mount("http://", cls.__ADAPTER)
+                session.mount("https://", cls.__ADAPTER)
+                cls.__SESSION = session
+            return cls.__SESSION
+
+    @classmethod
+    def statistics(cls) -> dict[str, int]:
+        """Return how many requests were sent, how many connections were opened and how many requests reused one."""
+        adapter = cls.__ADAPTER
+        if adapter is None:
+            return {"requests": 0, "connections": 0, "reused": 0}
+        return {
+            "requests": adapter.requests,
+            "connections": adapter.connections,
+            "reused": max(0, adapter.requests - adapter.connections),
+        }
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls.__LOCK:
+            if cls.__SESSION is not None:
+                cls.__SESSION.close()
+            cls.__SESSION = None
+            cls.__ADAPTER = None
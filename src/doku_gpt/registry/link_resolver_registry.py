@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any
+
+from doku_gpt.enum.link_type import LinkType
+from doku_gpt.error.invalid_value_error import InvalidValueError
+from doku_gpt.resolver.link_tag.external_resolver import ExternalResolver
+from doku_gpt.resolver.link_tag.internal_absolute_resolver import InternalAbsoluteResolver
+from doku_gpt.resolver.link_tag.internal_implicit_resolver import InternalImplicitResolver
+from doku_gpt.resolver.link_tag.internal_prior_resolver import InternalPriorResolver
+from doku_gpt.resolver.link_tag.internal_relative_resolver import InternalRelativeResolver
+from doku_gpt.resolver.link_tag.interwiki_resolver import InterwikiResolver
+
+
+class LinkResolverRegistry:
+    """
+    Resolver class used for each LinkType. A registered class is built with 'root_folder' (and 'context' when it is
+    an AbstractNamespaceResolver) and must provide resolve(link_tag) -> tuple[bool, LinkTag].
+    """
+
+    __DEFAULTS: dict[LinkType, type[Any]] = {
+        LinkType.EXTERNAL: ExternalResolver,
+        LinkType.INTERWIKI: InterwikiResolver,
+        LinkType.INTERNAL: InternalImplicitResolver,
+        LinkType.INTERNAL_ABSOLUTE: InternalAbsoluteResolver,
+        LinkType.INTERNAL_PRIOR: InternalPriorResolver,
+        LinkType.INTERNAL_RELATIVE: InternalRelativeResolver,
+    }
+    __RESOLVERS: dict[LinkType, type[Any]] = dict(__DEFAULTS)
+
+    @classmethod
+    def get(cls, link_type: LinkType | None) -> type[Any]:
+        if link_type is None:
+            raise InvalidValueError("Link type is not set!")
+        return cls.__RESOLVERS[link_type]
+
+    @classmethod
+    def register(cls, link_type: LinkType, resolver_class: type[Any]) -> None:
+        """Use 'resolver_class' for 'link_type' in every Resolver built from now on."""
+        cls.__RESOLVERS[link_type] = resolver_class
+
+    @classmethod
+    def reset(cls) -> None:
+        cls.__RESOLVERS = dict(cls.__DEFAULTS)
@@ -3,10 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 
 from doku_gpt.abstact_root_folder import AbstractRootFolder
+from doku_gpt.cache.page_extract_cache import PageExtractCache
 from doku_gpt.error.invalid_namespace_error import InvalidNamespaceError
 from doku_gpt.error.invalid_path_error import InvalidPathError
 from doku_gpt.extractor.doku_page_extractor import DokuPageExtractor
-from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.model.resolvable_link_tag import ResolvableLinkTag
 from doku_gpt.sanitizer.doku.line.inline_markup_sanitizer import InlineMarkupSanitizer
 from doku_gpt.sanitizer.doku.line.line_break_sanitizer import LinebreakSanitizer
 from doku_gpt.sanitizer.doku.line.link_label_sanitizer import LinkLabelSanitizer
@@ -117,27 +118,34 @@ class AbstractNamespaceResolver(AbstractRootFolder):
 
         return ":" + ":".join(parts)
 
-    def _add_label(self, link_tag: LinkTag, page_path: Path) -> tuple[bool, LinkTag]:
+    def _add_label(self, link_tag: ResolvableLinkTag, page_path: Path) -> tuple[bool, ResolvableLinkTag]:
         if link_tag.label is not None:
             return False, link_tag
 
-        link_tag.label = DokuPageExtractor.extract_title(
-            page_path=page_path,
-            fragment=link_tag.target_fragment,
-        )
+        found, title = PageExtractCache.get(PageExtractCache.TITLE, page_path, link_tag.target_fragment)
+        if not found:
+            title = DokuPageExtractor.extract_title(
+                page_path=page_path,
+                fragment=link_tag.target_fragment,
+            )
+            PageExtractCache.put(PageExtractCache.TITLE, page_path, link_tag.target_fragment, title)
+        link_tag.label = title
         return True, link_tag
 
-    def _add_excerpt(self, link_tag: LinkTag, page_path: Path) -> tuple[bool, LinkTag]:
+    def _add_excerpt(self, link_tag: ResolvableLinkTag, page_path: Path) -> tuple[bool, ResolvableLinkTag]:
         if link_tag.excerpt is not None:
             return False, link_tag
 
-        excerpt = DokuPageExtractor.extract_excerpt(
-            page_path=page_path,
-            fragment=link_tag.target_fragment,
-        )
-        if excerpt is not None:
-            excerpt = InlineMarkupSanitizer.sanitize(excerpt)
-            excerpt = LinkLabelSanitizer.sanitize(excerpt)
-            excerpt = LinebreakSanitizer.sanitize(excerpt)
+        found, excerpt = PageExtractCache.get(PageExtractCache.EXCERPT, page_path, link_tag.target_fragment)
+        if not found:
+            excerpt = DokuPageExtractor.extract_excerpt(
+                page_path=page_path,
+                fragment=link_tag.target_fragment,
+            )
+            if excerpt is not None:
+                excerpt = InlineMarkupSanitizer.sanitize(excerpt)
+                excerpt = LinkLabelSanitizer.sanitize(excerpt)
+                excerpt = LinebreakSanitizer.sanitize(excerpt)
+            PageExtractCache.put(PageExtractCache.EXCERPT, page_path, link_tag.target_fragment, excerpt)
         link_tag.excerpt = excerpt
         return True, link_tag
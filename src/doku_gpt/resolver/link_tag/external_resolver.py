@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 from doku_gpt.abstact_root_folder import AbstractRootFolder
+from doku_gpt.enum.link_status import LinkStatus
 from doku_gpt.extractor.web_page_extractor import WebPageExtractor
-from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.model.resolvable_link_tag import ResolvableLinkTag
 
 
 class ExternalResolver(AbstractRootFolder):
-    def can_resolve(self, link_tag: LinkTag) -> bool:
+    def can_resolve(self, link_tag: ResolvableLinkTag) -> bool:
         return link_tag.is_external
 
-    def resolve(self, link_tag: LinkTag) -> tuple[bool, LinkTag]:
+    def resolve(self, link_tag: ResolvableLinkTag) -> tuple[bool, ResolvableLinkTag]:
         if not self.can_resolve(link_tag):
             return False, link_tag
 
@@ -17,6 +18,12 @@ class ExternalResolver(AbstractRootFolder):
         if not core_url or not WebPageExtractor.can_fetch(core_url):
             return False, link_tag
 
+        # Offline, a link nothing is known about can be neither confirmed nor rejected: it is left for an online run.
+        if not WebPageExtractor.is_known(core_url):
+            link_tag.link_status = LinkStatus.NOT_VALIDATED
+            WebPageExtractor.defer()
+            return False, link_tag
+
         url_valid = False
 
         if link_tag.label is None:
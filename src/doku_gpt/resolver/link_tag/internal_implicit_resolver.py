@@ -6,12 +6,12 @@ from doku_gpt.enum.link_status import LinkStatus
 from doku_gpt.enum.link_type import LinkType
 from doku_gpt.error.invalid_namespace_error import InvalidNamespaceError
 from doku_gpt.error.invalid_path_error import InvalidPathError
-from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.model.resolvable_link_tag import ResolvableLinkTag
 from doku_gpt.resolver.link_tag.abstract_namespace_resolver import AbstractNamespaceResolver
 
 
 class InternalImplicitResolver(AbstractNamespaceResolver):
-    def can_resolve(self, link_tag: LinkTag) -> bool:
+    def can_resolve(self, link_tag: ResolvableLinkTag) -> bool:
         if not link_tag.is_internal:
             return False
         if (
@@ -22,7 +22,7 @@ class InternalImplicitResolver(AbstractNamespaceResolver):
             return False
         return True
 
-    def resolve(self, link_tag: LinkTag) -> tuple[bool, LinkTag]:
+    def resolve(self, link_tag: ResolvableLinkTag) -> tuple[bool, ResolvableLinkTag]:
         if not self.can_resolve(link_tag):
             return False, link_tag
 
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
 from doku_gpt.abstact_root_folder import AbstractRootFolder
+from doku_gpt.enum.link_status import LinkStatus
 from doku_gpt.extractor.web_page_extractor import WebPageExtractor
-from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.model.resolvable_link_tag import ResolvableLinkTag
 from doku_gpt.registry.interwiki_map_registry import InterwikiMapRegistry
 
 
 class InterwikiResolver(AbstractRootFolder):
-    def can_resolve(self, link_tag: LinkTag) -> bool:
+    def can_resolve(self, link_tag: ResolvableLinkTag) -> bool:
         return link_tag.is_interwiki
 
-    def resolve(self, link_tag: LinkTag) -> tuple[bool, LinkTag]:
+    def resolve(self, link_tag: ResolvableLinkTag) -> tuple[bool, ResolvableLinkTag]:
         if not self.can_resolve(link_tag):
             return False, link_tag
 
         url = InterwikiMapRegistry.get(link_tag.target_prefix, link_tag.target_suffix)
 
+        # Offline, a link nothing is known about can be neither confirmed nor rejected: it is left for an online run.
+        if not WebPageExtractor.is_known(url):
+            link_tag.link_status = LinkStatus.NOT_VALIDATED
+            WebPageExtractor.defer()
+            return False, link_tag
+
         url_valid = False
 
         if link_tag.label is None:
@@ -1,51 +1,49 @@
 from __future__ import annotations
 
-import copy
+from pathlib import Path
+from typing import Any, TypeVar
 
 from doku_gpt.enum.link_type import LinkType
-from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.model.resolvable_link_tag import ResolvableLinkTag
+from doku_gpt.registry.link_resolver_registry import LinkResolverRegistry
 from doku_gpt.resolver.link_tag.abstract_namespace_resolver import AbstractNamespaceResolver
-from doku_gpt.resolver.link_tag.external_resolver import ExternalResolver
-from doku_gpt.resolver.link_tag.internal_absolute_resolver import InternalAbsoluteResolver
-from doku_gpt.resolver.link_tag.internal_implicit_resolver import InternalImplicitResolver
-from doku_gpt.resolver.link_tag.internal_prior_resolver import InternalPriorResolver
-from doku_gpt.resolver.link_tag.internal_relative_resolver import InternalRelativeResolver
-from doku_gpt.resolver.link_tag.interwiki_resolver import InterwikiResolver
+
+LinkTagT = TypeVar("LinkTagT", bound=ResolvableLinkTag)
 
 
 class Resolver(AbstractNamespaceResolver):
-    def can_resolve(self, link_tag: LinkTag) -> bool:
+    """
+    Hand a link tag to the resolver registered for its type in LinkResolverRegistry. One instance of each resolver is
+    built on first use and kept, following the context of this resolver.
+
+    The tag is resolved in place: resolvers only change the tags they resolve, so it is not copied first.
+    """
+
+    def __init__(
+        self,
+        root_folder: str | Path,
+        context: str | Path | None = None,
+    ):
+        super().__init__(root_folder=root_folder, context=context)
+        self.__resolvers: dict[LinkType | None, Any] = {}
+
+    def can_resolve(self, link_tag: ResolvableLinkTag) -> bool:
         return True
 
-    def resolve(self, link_tag: LinkTag) -> tuple[bool, LinkTag]:
-        resolved_tag = copy.copy(link_tag)
-
-        if resolved_tag.is_interwiki:
-            interwiki_resolver = InterwikiResolver(root_folder=self.root_folder)
-            result, resolved_tag = interwiki_resolver.resolve(resolved_tag)
-            return (True, resolved_tag) if result is True else (False, link_tag)
-
-        if resolved_tag.is_external:
-            external_resolver = ExternalResolver(root_folder=self.root_folder)
-            result, resolved_tag = external_resolver.resolve(resolved_tag)
-            return (True, resolved_tag) if result is True else (False, link_tag)
-
-        if LinkType.INTERNAL_ABSOLUTE == resolved_tag.link_type:
-            absolute_resolver = InternalAbsoluteResolver(root_folder=self.root_folder, context=self.context)
-            result, resolved_tag = absolute_resolver.resolve(resolved_tag)
-            return (True, resolved_tag) if result is True else (False, link_tag)
-
-        if LinkType.INTERNAL_PRIOR == resolved_tag.link_type:
-            prior_resolver = InternalPriorResolver(root_folder=self.root_folder, context=self.context)
-            result, resolved_tag = prior_resolver.resolve(resolved_tag)
-            return (True, resolved_tag) if result is True else (False, link_tag)
-
-        if LinkType.INTERNAL_RELATIVE == resolved_tag.link_type:
-            relative_resolver = InternalRelativeResolver(root_folder=self.root_folder, context=self.context)
-            result, resolved_tag = relative_resolver.resolve(resolved_tag)
-            return (True, resolved_tag) if result is True else (False, link_tag)
-
-        # Fallback: implicit
-        implicit_resolver = InternalImplicitResolver(root_folder=self.root_folder, context=self.context)
-        result, resolved_tag = implicit_resolver.resolve(resolved_tag)
+    def resolve(self, link_tag: LinkTagT) -> tuple[bool, LinkTagT]:
+        resolver = self.__get_resolver(link_tag.link_type)
+        result, resolved_tag = resolver.resolve(link_tag)
         return (True, resolved_tag) if result is True else (False, link_tag)
+
+    def __get_resolver(self, link_type: LinkType | None) -> Any:
+        resolver = self.__resolvers.get(link_type)
+        if resolver is None:
+            resolver_class = LinkResolverRegistry.get(link_type)
+            if issubclass(resolver_class, AbstractNamespaceResolver):
+                resolver = resolver_class(root_folder=self.root_folder, context=self.context)
+            else:
+                resolver = resolver_class(root_folder=self.root_folder)
+            self.__resolvers[link_type] = resolver
+        elif isinstance(resolver, AbstractNamespaceResolver) and resolver.context != self.context:
+            resolver.context = self.context
+        return resolver
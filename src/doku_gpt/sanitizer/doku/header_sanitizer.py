@@ -6,7 +6,7 @@ from doku_gpt.extractor.doku_page_extractor import FileValidator
 
 
 class HeaderSanitizer:
-    def sanitize(self, root_folder: str | Path, page: str | Path) -> str:
+    def sanitize(self, root_folder: str | Path, page: str | Path, first_line: str | None = None) -> str:
         root_folder = FolderValidator.validate(root_folder)
         page = FileValidator.validate(page)
 
@@ -14,8 +14,9 @@ class HeaderSanitizer:
         parts = PurePosixPath(relative_path.as_posix()).parts
         context = " › ".join(parts[:-1])
 
-        adapter = PageAdapter(page)
-        first_line = adapter.lines[0].strip()
+        if first_line is None:
+            first_line = PageAdapter(page).lines[0]
+        first_line = first_line.strip()
 
         if not first_line.startswith("="):
             raise ValueError(f"First line of '{page}' must start with '='")
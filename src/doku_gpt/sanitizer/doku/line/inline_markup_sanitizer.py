@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
+from typing import ClassVar
 
+from doku_gpt.adapter.page_adapter import PageAdapter
 from doku_gpt.sanitizer.doku.line.bold_sanitizer import BoldSanitizer
 from doku_gpt.sanitizer.doku.line.box_sanitizer import BoxSanitizer
 from doku_gpt.sanitizer.doku.line.deleted_sanitizer import DeletedSanitizer
@@ -30,13 +32,208 @@ class InlineMarkupSanitizer:
         UnderlineSanitizer,
     )
 
+    # Every construct of _PIPELINE but the header, in the same order, as the alternatives of one pattern.
+    _SINGLE_PASS = (
+        BoldSanitizer.CLEAN,
+        BoxSanitizer.OPEN,
+        BoxSanitizer.CLOSE,
+        DeletedSanitizer.CLEAN,
+        ItalicSanitizer.CLEAN,
+        MediaSanitizer.MEDIA,
+        MonospaceSanitizer.CLEAN,
+        PluginSanitizer.PLUGIN,
+        SubscriptSanitizer.CLEAN,
+        SuperscriptSanitizer.CLEAN,
+        UnderlineSanitizer.CLEAN,
+    )
+    # Anything that could still start a construct once the single pass is done.
+    _TRIGGER = re.compile(r"\*\*|//|__|''|</?(?:box|del|sub|sup)|\{\{|~~", flags=re.IGNORECASE)
+    # What a line must contain for each _PIPELINE sanitizer to change anything in it.
+    _ROUTES: ClassVar[dict[type, re.Pattern[str]]] = {
+        BoldSanitizer: re.compile(r"\*\*"),
+        BoxSanitizer: re.compile(r"</?box", flags=re.IGNORECASE),
+        DeletedSanitizer: re.compile(r"<del", flags=re.IGNORECASE),
+        HeaderSanitizer: re.compile(r"\A="),
+        ItalicSanitizer: re.compile(r"//"),
+        MediaSanitizer: re.compile(r"\{\{"),
+        MonospaceSanitizer: re.compile(r"''"),
+        PluginSanitizer: re.compile(r"~~"),
+        SubscriptSanitizer: re.compile(r"<sub", flags=re.IGNORECASE),
+        SuperscriptSanitizer: re.compile(r"<sup", flags=re.IGNORECASE),
+        UnderlineSanitizer: re.compile(r"__"),
+    }
+
+    # What marks a line of a page that sanitize() does not return as it is (the tags of _TRIGGER after a "<"), and the
+    # line breaks of str.splitlines() but "\n".
+    __MARKS = ("**", "//", "__", "''", "{{", "~~", "<", "\n=")
+    __TAG = re.compile(r"</?(?:box|del|sub|sup)", flags=re.IGNORECASE)
+    __OTHER_LINE_BREAK = re.compile(r"[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+    __DELIMITERS = frozenset("*/_'~<>{}=")
+    __engine: re.Pattern[str] | None = None
+    # Group of every alternative of the engine -> its pattern and the group of its kept text (None when removed).
+    __alternatives: ClassVar[dict[int | None, tuple[re.Pattern[str], int | None]]] = {}
+    __LINES = 0
+    __SKIPPED = 0
+    __SINGLE_PASS = 0
+    __PIPELINE = 0
+    __SKIPPED_RUNS = 0
+
     @classmethod
     def sanitize(cls, line: str, normalize_space: bool = False) -> str:
+        """
+        Strip every construct in one scan, nested ones through their kept text. The line goes through the _PIPELINE
+        until nothing changes instead when the scan could disagree with it: some markup is left (unpaired, crossed,
+        touching other markup or formed by what was removed) or the line is a header with non ASCII or emptied text.
+        There, each sanitizer only runs while the line holds what it matches (see _ROUTES). Lines holding no markup
+        at all are returned as they are ('skipped' in statistics()).
+        """
+        cls.__LINES += 1
+        if cls._TRIGGER.search(line) is None and not line.startswith("="):
+            cls.__SKIPPED += 1
+        else:
+            line = cls.__sanitize(line)
+
+        if normalize_space:
+            line = re.sub(r"\s{2,}", " ", line).strip()
+        return line
+
+    @classmethod
+    def sanitize_page(cls, page: str) -> str:
+        """
+        Sanitize every line of a page as PageAdapter.split_lines() gives them and join them back with a final newline.
+        A page broken by newlines only is scanned once for the lines that could hold markup, the others are kept as
+        they are.
+        """
+        if cls.__OTHER_LINE_BREAK.search(page) is not None:
+            return "\n".join(cls.sanitize(line) for line in PageAdapter.split_lines(page)) + "\n"
+
+        page = page.rstrip("\n")
+        parts: list[str] = []
+        position = 0
+        marked = cls.__marked_lines(page)
+        for start in marked:
+            end = page.find("\n", start)
+            if end < 0:
+                end = len(page)
+            parts.append(page[position:start])
+            parts.append(cls.sanitize(page[start:end]))
+            position = end
+        parts.append(page[position:])
+
+        unmarked = (page.count("\n") + 1 if page else 0) - len(marked)
+        cls.__LINES += unmarked
+        cls.__SKIPPED += unmarked
+        return "".join(parts) + "\n"
+
+    @classmethod
+    def __marked_lines(cls, page: str) -> list[int]:
+        """Start of every line of the page that sanitize() would not return as it is, found with str.find()."""
+        starts: set[int] = set()
+        for mark in cls.__MARKS:
+            position = page.find(mark)
+            while position >= 0:
+                if mark == "\n=":
+                    starts.add(position + 1)
+                elif mark != "<" or cls.__TAG.match(page, position) is not None:
+                    starts.add(page.rfind("\n", 0, position) + 1)
+                position = page.find(mark, position + 1)
+        if page.startswith("="):
+            starts.add(0)
+        return sorted(starts)
+
+    @classmethod
+    def statistics(cls) -> dict[str, int]:
+        return {
+            "lines": cls.__LINES,
+            "skipped": cls.__SKIPPED,
+            "single_pass": cls.__SINGLE_PASS,
+            "pipeline": cls.__PIPELINE,
+            "skipped_runs": cls.__SKIPPED_RUNS,
+        }
+
+    @classmethod
+    def reset_statistics(cls) -> None:
+        cls.__LINES = 0
+        cls.__SKIPPED = 0
+        cls.__SINGLE_PASS = 0
+        cls.__PIPELINE = 0
+        cls.__SKIPPED_RUNS = 0
+
+    @classmethod
+    def __sanitize(cls, line: str) -> str:
+        stripped = cls.__strip(line)
+        if cls._TRIGGER.search(stripped) is None:
+            if not stripped.startswith("="):
+                cls.__SINGLE_PASS += 1
+                return stripped
+
+            header = HeaderSanitizer.HEADER.match(stripped)
+            if line.isascii() and (header is None or header.group("text").strip()):
+                cls.__SINGLE_PASS += 1
+                return HeaderSanitizer.sanitize(stripped)
+
+        cls.__PIPELINE += 1
+        return cls.__fixed_point(line)
+
+    @classmethod
+    def __fixed_point(cls, line: str) -> str:
         prev = None
         while prev != line:
             prev = line
             for s in cls._PIPELINE:
+                if cls._ROUTES[s].search(line) is None:
+                    cls.__SKIPPED_RUNS += 1
+                    continue
                 line = s.sanitize(line)
-        if normalize_space:
-            line = re.sub(r"\s{2,}", " ", line).strip()
         return line
+
+    @classmethod
+    def __strip(cls, text: str) -> str:
+        engine = cls.__engine if cls.__engine is not None else cls.__compile()
+        return engine.sub(cls.__replace, text)
+
+    @classmethod
+    def __replace(cls, match: re.Match[str]) -> str:
+        # Returning the markup as it was sends the line to the _PIPELINE. That is needed when it touches other markup,
+        # removes other markup along with it (inside a tag or a file name) or keeps a text that changed so much that it
+        # would not match any more: a _PIPELINE sanitizer running before this one could act differently there.
+        pattern, kept = cls.__alternatives[match.lastindex]
+        line = match.string
+        start, end = match.span()
+        if start > 0 and line[start - 1] in cls.__DELIMITERS or end < len(line) and line[end] in cls.__DELIMITERS:
+            return match.group(0)
+
+        if kept is None or match.start(kept) < 0:
+            if cls._TRIGGER.search(line, start + 1, end - 1) is not None:
+                return match.group(0)
+            return ""
+
+        kept_start, kept_end = match.span(kept)
+        if (
+            cls._TRIGGER.search(line, start + 1, kept_start - 1) is not None
+            or cls._TRIGGER.search(line, kept_end + 1, end - 1) is not None
+        ):
+            return match.group(0)
+
+        text = match.group(kept)
+        if pattern is MediaSanitizer.MEDIA:
+            text = text.strip()
+        stripped = cls.__strip(text)
+        if stripped != text and pattern.fullmatch(line[start:kept_start] + stripped + line[kept_end:end]) is None:
+            return match.group(0)
+        return stripped
+
+    @classmethod
+    def __compile(cls) -> re.Pattern[str]:
+        sources = []
+        alternatives: dict[int | None, tuple[re.Pattern[str], int | None]] = {}
+        group = 1
+        for pattern in cls._SINGLE_PASS:
+            flags = ("i" if pattern.flags & re.IGNORECASE else "") + ("s" if pattern.flags & re.DOTALL else "")
+            sources.append(f"((?{flags}:{pattern.pattern}))" if flags else f"({pattern.pattern})")
+            alternatives[group] = (pattern, group + 1 if pattern.groups else None)
+            group += pattern.groups + 1
+        # Python tries every alternative at every position: look for the first character of one before.
+        engine = re.compile("(?=[*<{/'~_])(?:" + "|".join(sources) + ")")
+        cls.__alternatives, cls.__engine = alternatives, engine
+        return engine
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import re
 from pathlib import Path
 from typing import List
 
 from doku_gpt.abstact_root_folder import AbstractRootFolder
 from doku_gpt.factory.link_tag_factory import LinkTagFactory
-from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.model.compact_link_tag import CompactLinkTag
 from doku_gpt.settings.settings_handler import SettingsHandler
+from doku_gpt.tokenizer.link_tag_tokenizer import LinkTagTokenizer
 
 
 class LinkTagSanitizer(AbstractRootFolder):
@@ -20,13 +20,14 @@ class LinkTagSanitizer(AbstractRootFolder):
     or a title derived from the target, and skips the excerpt annotation.
     """
 
-    LINK_PATTERN = re.compile(r"\[\[[^\]]+]]")
+    LINK_PATTERN = LinkTagTokenizer.LINK_PATTERN
 
     def __init__(self, root_folder: str | Path):
         super().__init__(root_folder=root_folder)
         self.__seen_targets: set[str] = set()
-        self.__settings: dict[str, LinkTag] = {}
+        self.__settings: dict[str, CompactLinkTag] = {}
         self._factory: LinkTagFactory = LinkTagFactory(root_folder=self.root_folder)
+        self.__tokenizer: LinkTagTokenizer = LinkTagTokenizer(self.LINK_PATTERN)
 
     def sanitize(self, page: str) -> str:
         if not self.__settings:
@@ -42,17 +43,27 @@ class LinkTagSanitizer(AbstractRootFolder):
                 sanitized_lines.append(line)
                 continue
 
-            tags_in_line = self.LINK_PATTERN.findall(line)
-            for raw_tag in tags_in_line:
-                link_tag = self._factory.get(raw_tag)
-                replacement = self.__fetch_label_or_excerpt(link_tag=link_tag)
-                line = line.replace(raw_tag, replacement, 1)
+            tokens = self.__tokenizer.tokenize(line)
+            if not tokens:
+                sanitized_lines.append(line)
+                continue
+
+            raw_tags = [token.group(0) for token in tokens]
+            replacements = [self.__fetch_label_or_excerpt(link_tag=self._factory.get(raw_tag)) for raw_tag in raw_tags]
+
+            # A replacement without brackets cannot form or hide another tag, so every str.replace(raw_tag, ..., 1)
+            # would hit the tag's own span: the line is rebuilt in one pass. Otherwise keep replacing in order.
+            if all(replacement and "[" not in replacement and "]" not in replacement for replacement in replacements):
+                line = self.__tokenizer.rewrite(line, tokens, replacements)
+            else:
+                for raw_tag, replacement in zip(raw_tags, replacements):
+                    line = line.replace(raw_tag, replacement, 1)
 
             sanitized_lines.append(line)
 
         return "".join(sanitized_lines)
 
-    def __fetch_label_or_excerpt(self, link_tag: LinkTag) -> str:
+    def __fetch_label_or_excerpt(self, link_tag: CompactLinkTag) -> str:
         default_return: str = link_tag.label or link_tag.target
 
         found_setting = self.__settings.get(link_tag.target)
@@ -1,75 +1,113 @@
 from __future__ import annotations
 
-import copy
+from pathlib import Path
 
-from doku_gpt.enum.link_type import LinkType
 from doku_gpt.factory.link_tag_factory import LinkTagFactory
-from doku_gpt.functions import extract_link_tags
-from doku_gpt.resolver.link_tag.external_resolver import ExternalResolver
-from doku_gpt.resolver.link_tag.internal_absolute_resolver import InternalAbsoluteResolver
-from doku_gpt.resolver.link_tag.internal_implicit_resolver import InternalImplicitResolver
-from doku_gpt.resolver.link_tag.internal_prior_resolver import InternalPriorResolver
-from doku_gpt.resolver.link_tag.internal_relative_resolver import InternalRelativeResolver
-from doku_gpt.resolver.link_tag.interwiki_resolver import InterwikiResolver
+from doku_gpt.resolver.link_tag.resolver import Resolver
 from doku_gpt.sanitizer.root.abstract_root_sanitizer import AbstractRootSanitizer
+from doku_gpt.tokenizer.link_tag_tokenizer import LinkTagTokenizer
 
 
 class LineNamespaceSanitizer(AbstractRootSanitizer):
+    def __init__(self, root_folder: str | Path, page_path: str | Path):
+        super().__init__(root_folder=root_folder, page_path=page_path)
+        # Built once per page (on first use) instead of once per link: every constructor validates the root again.
+        self.__factory: LinkTagFactory | None = None
+        self.__resolver: Resolver | None = None
+        self.__tokenizer: LinkTagTokenizer = LinkTagTokenizer(LinkTagTokenizer.NAMESPACE_PATTERN)
+        # Every link tag of the page is resolved once, however often it is repeated.
+        self.__sanitized: dict[str, str] = {}
+        # Pages the internal links resolved to, with the fragments whose title became a label.
+        self.dependencies: dict[Path, set[str | None]] = {}
+
     def sanitize(self, line: str) -> tuple[bool, str]:
         """Find link_tags inside a line, clean them, and return the updated line."""
-        to_sanitize = str(line)
-        namespaces = extract_link_tags(to_sanitize)
-        for namespace in namespaces:
-            sanitized = self.__sanitize_link_tag(namespace)
-            to_sanitize = self.__replace_link_tag(to_sanitize, namespace, sanitized)
+        tokens = self.__tokenizer.tokenize(line)
+        if not tokens:
+            return False, line
+
+        namespaces = [token.group("token") for token in tokens]
+        sanitized = [self.__sanitize_link_tag(namespace) for namespace in namespaces]
+
+        if all(self.__is_rewritable(old, new) for old, new in zip(namespaces, sanitized)):
+            replacements = [self.__final_value(namespace, namespaces, sanitized) for namespace in namespaces]
+            to_sanitize = self.__tokenizer.rewrite(line, tokens, replacements)
+        else:
+            to_sanitize = line
+            for namespace, new in zip(namespaces, sanitized):
+                to_sanitize = self.__replace_link_tag(to_sanitize, namespace, new)
         return line != to_sanitize, to_sanitize
 
+    def sanitize_text(self, text: str) -> str | None:
+        """
+        Sanitize all lines of a page in one pass over its text. Return None when the page has to be sanitized line by
+        line to get the same result: a tag spanning lines, a replacement that is not a plain tag, or a replacement that
+        is itself another tag of the page.
+        """
+        tokens = self.__tokenizer.tokenize(text)
+        if not tokens:
+            return text
+
+        namespaces = [token.group("token") for token in tokens]
+        if any(len(namespace.splitlines()) != 1 for namespace in namespaces):
+            return None
+
+        sanitized = {namespace: self.__sanitize_link_tag(namespace) for namespace in dict.fromkeys(namespaces)}
+        for old, new in sanitized.items():
+            if not self.__is_rewritable(old, new) or len(new.splitlines()) != 1:
+                return None
+            if new != old and new in sanitized:
+                return None
+
+        return self.__tokenizer.rewrite(text, tokens, [sanitized[namespace] for namespace in namespaces])
+
     def __sanitize_link_tag(self, link_tag: str) -> str:
         """Sanitize a given link_tag."""
-        factory = LinkTagFactory(root_folder=self.root_folder)
-        tag = factory.get(link_tag)
-        resolved_tag = copy.copy(tag)
-
-        if resolved_tag.is_external:
-            external_resolver = ExternalResolver(root_folder=self.root_folder)
-            result, resolved_tag = external_resolver.resolve(resolved_tag)
-            if result is True:
-                return resolved_tag.link_tag
-            return tag.link_tag
-
-        if resolved_tag.is_interwiki:
-            interwiki_resolver = InterwikiResolver(root_folder=self.root_folder)
-            result, resolved_tag = interwiki_resolver.resolve(resolved_tag)
-            if result is True:
-                return resolved_tag.link_tag
-            return tag.link_tag
-
-        if LinkType.INTERNAL_ABSOLUTE == resolved_tag.link_type:
-            absolute_resolver = InternalAbsoluteResolver(root_folder=self.root_folder, context=self.page_path)
-            result, resolved_tag = absolute_resolver.resolve(resolved_tag)
-            if result is True:
-                return resolved_tag.link_tag
-            return tag.link_tag
-
-        if LinkType.INTERNAL_PRIOR == resolved_tag.link_type:
-            prior_resolver = InternalPriorResolver(root_folder=self.root_folder, context=self.page_path)
-            result, resolved_tag = prior_resolver.resolve(resolved_tag)
-            if result is True:
-                return resolved_tag.link_tag
-            return tag.link_tag
-
-        if LinkType.INTERNAL_RELATIVE == resolved_tag.link_type:
-            relative_resolver = InternalRelativeResolver(root_folder=self.root_folder, context=self.page_path)
-            result, resolved_tag = relative_resolver.resolve(resolved_tag)
-            if result is True:
-                return resolved_tag.link_tag
-            return tag.link_tag
-
-        implicit_resolver = InternalImplicitResolver(root_folder=self.root_folder, context=self.page_path)
-        result, resolved_tag = implicit_resolver.resolve(resolved_tag)
-        if result is True:
-            return resolved_tag.link_tag
-        return tag.link_tag
+        sanitized = self.__sanitized.get(link_tag)
+        if sanitized is not None:
+            return sanitized
+
+        if self.__factory is None or self.__resolver is None:
+            self.__factory = LinkTagFactory(root_folder=self.root_folder)
+            self.__resolver = Resolver(root_folder=self.root_folder, context=self.page_path)
+
+        tag = self.__factory.get(link_tag)
+        needs_title = tag.label is None
+        resolved, resolved_tag = self.__resolver.resolve(tag)
+        if resolved and resolved_tag.is_internal:
+            self.__add_dependency(resolved_tag.target_prefix, resolved_tag.target_fragment, needs_title)
+        sanitized = resolved_tag.link_tag
+        self.__sanitized[link_tag] = sanitized
+        return sanitized
+
+    def __add_dependency(self, namespace: str, fragment: str | None, needs_title: bool) -> None:
+        parts = [segment for segment in namespace.split(":") if segment]
+        fragments = self.dependencies.setdefault(self.root_folder.joinpath(*parts).with_suffix(".txt"), set())
+        if needs_title:
+            fragments.add(fragment)
+
+    @staticmethod
+    def __is_rewritable(old: str, new: str) -> bool:
+        """
+        Whether replacing the link spans gives the same line as the global str.replace() of __replace_link_tag: the
+        tag must be replaced as written and neither the tag nor its replacement may hold brackets of their own, so no
+        replacement can create or cut another tag.
+        """
+        inner = old[2:-2]
+        if inner != inner.strip() or "[" in inner:
+            return False
+        if not new.startswith("[[") or not new.endswith("]]"):
+            return False
+        return "[" not in new[2:-2] and "]" not in new[2:-2]
+
+    @staticmethod
+    def __final_value(namespace: str, namespaces: list[str], sanitized: list[str]) -> str:
+        """Follow the replacements in order, as a later one also replaces the output of an earlier one."""
+        value = namespace
+        for old, new in zip(namespaces, sanitized):
+            if value == old:
+                value = new
+        return value
 
     def __replace_link_tag(self, line: str, old: str, new: str) -> str:
         """Replace an old link_tag with a new one in a given line."""
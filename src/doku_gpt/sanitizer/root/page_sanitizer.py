@@ -1,24 +1,46 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from doku_gpt.adapter.page_adapter import PageAdapter
 from doku_gpt.sanitizer.root.abstract_root_sanitizer import AbstractRootSanitizer
 from doku_gpt.sanitizer.root.line_namespace_sanitizer import LineNamespaceSanitizer
 
 
 class PageSanitizer(AbstractRootSanitizer):
+    # Sanitize the whole page text in one pass, falling back to line by line when the page needs it.
+    PAGE_MODE = True
+
+    def __init__(self, root_folder: str | Path, page_path: str | Path):
+        super().__init__(root_folder=root_folder, page_path=page_path)
+        self.dependencies: dict[Path, set[str | None]] = {}
+
     def sanitize(self) -> bool:
         adapter = PageAdapter(self.page_path)
-        has_sanitized_lines = False
-        sanitize_lines = []
         sanitizer: LineNamespaceSanitizer = LineNamespaceSanitizer(
             root_folder=self.root_folder, page_path=self.page_path
         )
+        self.dependencies = sanitizer.dependencies
 
+        if self.PAGE_MODE:
+            content = adapter.content
+            if "[[" not in content:
+                return False
+
+            sanitized = sanitizer.sanitize_text(content)
+            if sanitized is not None:
+                if sanitized == content:
+                    return False
+                adapter.lines = PageAdapter.split_lines(sanitized)
+                return True
+
+        has_sanitized_lines = False
+        sanitize_lines = []
         for line in adapter.lines:
-            was_sanitized, sanitized = sanitizer.sanitize(line)
+            was_sanitized, sanitized_line = sanitizer.sanitize(line)
             if not has_sanitized_lines and was_sanitized:
                 has_sanitized_lines = True
-            sanitize_lines.append(sanitized)
+            sanitize_lines.append(sanitized_line)
 
         if has_sanitized_lines:
             adapter.lines = sanitize_lines
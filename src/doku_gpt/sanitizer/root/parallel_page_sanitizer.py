@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from doku_gpt.abstact_root_folder import AbstractRootFolder
+from doku_gpt.cache.http_metadata_cache import HttpMetadataCache
+from doku_gpt.cache.page_cache import PageCache
+from doku_gpt.cache.sanitize_manifest import SanitizeManifest
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
+from doku_gpt.sanitizer.root.page_sanitizer import PageSanitizer
+
+
+class ParallelPageSanitizer(AbstractRootFolder):
+    """
+    Run PageSanitizer over many pages, in 'jobs' worker processes when jobs > 1.
+
+    Workers are spawned (not forked), so each starts with its own page and path caches and HTTP session. What they
+    learn about external links goes through one temporary HttpMetadataCache file for this run, opened as shared, so
+    the results do not depend on 'jobs'. Offline, the workers only read the root folder file, as a sequential run does.
+    'timings' maps each worker process to the pages it handled, how many it changed and the seconds it spent.
+
+    An incremental run skips the pages the SanitizeManifest of the root folder holds as current ('skipped' counts
+    them) and records the others once they are sanitized, except pages with links deferred offline. The manifest is
+    only saved when every page succeeded.
+    """
+
+    CHUNK_SIZE = 4
+
+    def __init__(
+        self, root_folder: str | Path, jobs: int = 1, offline: bool = False, incremental: bool = False
+    ) -> None:
+        super().__init__(root_folder=root_folder)
+        self.jobs = max(1, jobs)
+        self.offline = offline
+        self.incremental = incremental
+        self.timings: dict[int, tuple[int, int, float]] = {}
+        self.skipped = 0
+
+    def sanitize(self, files: list[Path]) -> Iterator[tuple[Path, bool]]:
+        """Yield every sanitized page with whether it was changed, in the order of 'files'."""
+        self.timings.clear()
+        self.skipped = 0
+        manifest: SanitizeManifest | None = None
+        if self.incremental:
+            manifest = SanitizeManifest(root_folder=self.root_folder, pages=files)
+            stale = [page_path for page_path in files if not manifest.is_current(page_path)]
+            self.skipped = len(files) - len(stale)
+            files = stale
+
+        for page_path, was_sanitized, deferred, dependencies in self.__sanitize(files):
+            if manifest is not None:
+                if deferred:
+                    manifest.forget(page_path)
+                else:
+                    manifest.record(page_path, dependencies)
+            yield page_path, was_sanitized
+
+        if manifest is not None:
+            manifest.save()
+
+    def __sanitize(self, files: list[Path]) -> Iterator[tuple[Path, bool, int, dict[Path, set[str | None]]]]:
+        if self.jobs == 1 or len(files) < 2:
+            for page_path in files:
+                page_path, was_sanitized, worker, seconds, deferred, dependencies = self._sanitize_page(
+                    self.root_folder, page_path
+                )
+                self.__record(worker, was_sanitized, seconds)
+                yield page_path, was_sanitized, deferred, dependencies
+            return
+
+        temporary_folder: str | None = None
+        cache_file: Path | None = None
+        if self.offline:
+            root_cache_file = self.root_folder.joinpath(HttpMetadataCache.FILE_NAME)
+            if root_cache_file.is_file():
+                cache_file = root_cache_file
+        else:
+            temporary_folder = tempfile.mkdtemp(prefix="doku_gpt_")
+            cache_file = Path(temporary_folder).joinpath(HttpMetadataCache.FILE_NAME)
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(files)),
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self._start_worker,
+                initargs=(self.offline, cache_file),
+            ) as executor:
+                results = executor.map(
+                    self._sanitize_page, [self.root_folder] * len(files), files, chunksize=self.CHUNK_SIZE
+                )
+                for page_path, was_sanitized, worker, seconds, deferred, dependencies in results:
+                    self.__record(worker, was_sanitized, seconds)
+                    if deferred:
+                        WebPageExtractor.defer(deferred)
+                    yield page_path, was_sanitized, deferred, dependencies
+        finally:
+            if temporary_folder is not None:
+                shutil.rmtree(temporary_folder, ignore_errors=True)
+
+    @staticmethod
+    def _start_worker(offline: bool, cache_file: Path | None) -> None:
+        PageCache.enable()
+        WebPageExtractor.OFFLINE = offline
+        if cache_file is not None:
+            HttpMetadataCache.open(cache_file, shared=not offline)
+
+    @staticmethod
+    def _sanitize_page(
+        root_folder: Path, page_path: Path
+    ) -> tuple[Path, bool, int, float, int, dict[Path, set[str | None]]]:
+        deferred = WebPageExtractor.deferred()
+        start = time.perf_counter()
+        sanitizer = PageSanitizer(root_folder=root_folder, page_path=page_path)
+        was_sanitized = sanitizer.sanitize()
+        seconds = time.perf_counter() - start
+        deferred = WebPageExtractor.deferred() - deferred
+        return page_path, was_sanitized, os.getpid(), seconds, deferred, sanitizer.dependencies
+
+    def __record(self, worker: int, was_sanitized: bool, seconds: float) -> None:
+        pages, sanitized, total = self.timings.get(worker, (0, 0, 0.0))
+        self.timings[worker] = (pages + 1, sanitized + int(was_sanitized), total + seconds)
@@ -5,10 +5,17 @@ from pathlib import Path
 
 from doku_gpt.abstact_root_folder import AbstractRootFolder
 from doku_gpt.adapter.page_adapter import PageAdapter
+from doku_gpt.cache.http_metadata_cache import HttpMetadataCache
+from doku_gpt.cache.page_extract_cache import PageExtractCache
+from doku_gpt.error.invalid_interwiki_error import InvalidInterwikiError
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
+from doku_gpt.extractor.web_page_prefetcher import WebPagePrefetcher
 from doku_gpt.factory.link_tag_factory import LinkTagFactory
 from doku_gpt.finder.finder import Finder
 from doku_gpt.functions import extract_link_tags
+from doku_gpt.model.compact_link_tag import CompactLinkTag
 from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.registry.interwiki_map_registry import InterwikiMapRegistry
 from doku_gpt.resolver.link_tag.resolver import Resolver
 
 
@@ -18,12 +25,24 @@ class SettingsHandler(AbstractRootFolder):
         root_folder: str | Path,
         excluded_folders: list[str] | None = None,
         excluded_files: list[str] | None = None,
+        extract_cache: bool = False,
+        workers: int = WebPagePrefetcher.DEFAULT_WORKERS,
+        http_cache: bool = False,
+        http_cache_ttl: float = HttpMetadataCache.DEFAULT_TTL,
+        offline: bool = False,
     ):
         super().__init__(root_folder=root_folder, excluded_folders=excluded_folders, excluded_files=excluded_files)
-        self.__link_tags: dict[str, LinkTag] = {}
+        self.extract_cache = extract_cache
+        self.workers = workers
+        self.http_cache = http_cache
+        self.http_cache_ttl = http_cache_ttl
+        self.offline = offline
+        self.__link_tags: dict[str, CompactLinkTag] = {}
         self.__factory: LinkTagFactory = LinkTagFactory(root_folder)
         self.__resolver = Resolver(root_folder)
         self.__file = self.root_folder.joinpath(".doku_gpt.json")
+        self.__extract_cache_file = self.root_folder.joinpath(PageExtractCache.FILE_NAME)
+        self.__http_cache_file = self.root_folder.joinpath(HttpMetadataCache.FILE_NAME)
         self.__adapter: PageAdapter = PageAdapter(self.__file)
 
     def create(self) -> None:
@@ -34,13 +53,20 @@ class SettingsHandler(AbstractRootFolder):
         self.__save()
 
     def update(self) -> None:
-        """Load current map (if any), rescan pages, and merge updates."""
+        """
+        Load current map (if any), rescan pages, and merge updates.
+        With 'extract_cache', titles and excerpts extracted by the previous update are reused for unchanged pages.
+        """
         self.__link_tags = {}
         self.__load()
+        if self.extract_cache:
+            PageExtractCache.load(self.__extract_cache_file)
         self.__scan_and_merge()
         self.__save()
+        if self.extract_cache:
+            PageExtractCache.save(self.__extract_cache_file)
 
-    def load(self) -> dict[str, LinkTag]:
+    def load(self) -> dict[str, CompactLinkTag]:
         """
         Load the current .doku_gpt.json file (if any) and return link tags.
         """
@@ -49,11 +75,29 @@ class SettingsHandler(AbstractRootFolder):
         return self.__link_tags
 
     def __scan_and_merge(self) -> None:
+        use_http_cache = self.http_cache or (self.offline and self.__http_cache_file.is_file())
+        if use_http_cache:
+            HttpMetadataCache.open(self.__http_cache_file, ttl=self.http_cache_ttl)
+        WebPageExtractor.OFFLINE = self.offline
+        try:
+            self.__scan_and_merge_pages()
+        finally:
+            WebPageExtractor.OFFLINE = False
+            if use_http_cache:
+                HttpMetadataCache.close()
+
+    def __scan_and_merge_pages(self) -> None:
+        WebPageExtractor.reset()
         finder = self.__create_finder()
         files = finder.find_files("*.txt")
-        for file in files:
-            adapter = PageAdapter(file)
-            self.__create_file(adapter)
+        pages = [self.__extract_page_link_tags(PageAdapter(file)) for file in files]
+
+        # Fetch every external and interwiki target up front, in parallel; the resolvers then find them memoized.
+        if self.workers > 1 and not self.offline:
+            WebPagePrefetcher(workers=self.workers).prefetch(self.__collect_web_urls(pages))
+
+        for page_path, link_tags in pages:
+            self.__create_file(page_path=page_path, link_tags=link_tags)
 
     def __load(self) -> None:
         if not self.__file.exists():
@@ -73,27 +117,51 @@ class SettingsHandler(AbstractRootFolder):
                 tag = LinkTag.model_validate(data)
             except AttributeError:
                 tag = LinkTag.parse_obj(data)
-            self.__link_tags[target] = tag
+            self.__link_tags[target] = CompactLinkTag.from_model(tag)
 
     def __save(self) -> None:
         serializable = {
-            key: tag.model_dump(mode="json", by_alias=True, exclude_none=True) for key, tag in self.__link_tags.items()
+            key: tag.to_model().model_dump(mode="json", by_alias=True, exclude_none=True)
+            for key, tag in self.__link_tags.items()
         }
         self.__adapter.content = json.dumps(serializable, indent=2, ensure_ascii=False, sort_keys=True)
 
-    def __create_file(self, adapter: PageAdapter) -> None:
+    def __extract_page_link_tags(self, adapter: PageAdapter) -> tuple[Path, list[CompactLinkTag]]:
+        link_tags: list[CompactLinkTag] = []
         for line in adapter.lines:
-            link_tags = extract_link_tags(line)
-            for link_tag in link_tags:
-                tag = self.__factory.get(link_tag)
-                self.__resolver.context = adapter.page_path
-                resolved, resolved_tag = self.__resolver.resolve(tag)
-                if not resolved:
+            for link_tag in extract_link_tags(line):
+                link_tags.append(self.__factory.get(link_tag))
+        return adapter.page_path, link_tags
+
+    def __collect_web_urls(self, pages: list[tuple[Path, list[CompactLinkTag]]]) -> dict[str, bool]:
+        urls: dict[str, bool] = {}
+        for _, link_tags in pages:
+            for tag in link_tags:
+                if tag.is_external:
+                    url = (tag.core or "").strip()
+                elif tag.is_interwiki:
+                    try:
+                        url = InterwikiMapRegistry.get(tag.target_prefix, tag.target_suffix)
+                    except InvalidInterwikiError:
+                        continue
+                else:
                     continue
-                target = resolved_tag.target
-                existing = self.__link_tags.get(target)
-                if existing is None or not existing.is_valid:
-                    self.__link_tags[target] = resolved_tag
+                urls[url] = urls.get(url, False) or tag.label is None
+        return urls
+
+    def __create_file(self, page_path: Path, link_tags: list[CompactLinkTag]) -> None:
+        if not link_tags:
+            return
+
+        self.__resolver.context = page_path
+        for tag in link_tags:
+            resolved, resolved_tag = self.__resolver.resolve(tag)
+            if not resolved:
+                continue
+            target = resolved_tag.target
+            existing = self.__link_tags.get(target)
+            if existing is None or not existing.is_valid:
+                self.__link_tags[target] = resolved_tag
 
     def __create_finder(self) -> Finder:
         default_excluded_folders: list[str] = ["playground", "wiki", "old_content"]
@@ -108,4 +176,5 @@ class SettingsHandler(AbstractRootFolder):
             root_folder=self.root_folder,
             excluded_folders=self.excluded_folders,
             excluded_files=self.excluded_files,
+            snapshot=True,
         )
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import re
+
+
+class LinkTagTokenizer:
+    """
+    Find the link tags of a line in one scan and rebuild the line around them with a single join, instead of calling
+    str.replace() once per link.
+
+    NAMESPACE_PATTERN matches the tags rewritten by LineNamespaceSanitizer and collected by SettingsHandler,
+    LINK_PATTERN every [[...]] replaced by LinkTagSanitizer.
+    """
+
+    NAMESPACE_PATTERN = re.compile(r"(?P<token>\[\[(?P<path>[^\]|#]+)(?:#[^\]|]+)?(?:\|[^\]]*)?\]\])")
+    LINK_PATTERN = re.compile(r"\[\[[^\]]+]]")
+
+    def __init__(self, pattern: re.Pattern[str]) -> None:
+        self.pattern = pattern
+
+    def tokenize(self, line: str) -> list[re.Match[str]]:
+        if "[[" not in line:
+            return []
+        return list(self.pattern.finditer(line))
+
+    @staticmethod
+    def rewrite(line: str, tokens: list[re.Match[str]], replacements: list[str]) -> str:
+        """Return the line with every token span replaced by the replacement at the same index."""
+        parts: list[str] = []
+        position = 0
+        for token, replacement in zip(tokens, replacements):
+            parts.append(line[position : token.start()])
+            parts.append(replacement)
+            position = token.end()
+        parts.append(line[position:])
+        return "".join(parts)
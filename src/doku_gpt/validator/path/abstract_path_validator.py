@@ -5,6 +5,7 @@ from pathlib import Path
 from typing import NoReturn
 
 from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.validator.path.path_context import PathContext
 
 
 class AbstractPathValidator(ABC):
@@ -15,18 +16,14 @@ class AbstractPathValidator(ABC):
 
     @classmethod
     def _normalize_path(cls, path: str | Path) -> Path:
-        original_path = Path(str(path).strip())
-
-        try:
-            return original_path.resolve(strict=True)
-        except FileNotFoundError:
-            parent_path = original_path.parent
-            try:
-                parent_path.resolve(strict=True)
-            except FileNotFoundError:
-                cls._raise_error(path=original_path, suffix="does not exist!")
-
-        return original_path.resolve(strict=False)
+        return cls._normalize_context(PathContext(path))
+
+    @classmethod
+    def _normalize_context(cls, context: PathContext) -> Path:
+        if context.resolved is None:
+            cls._raise_error(path=context.original, suffix="does not exist!")
+
+        return context.resolved
 
     @classmethod
     def _raise_error(cls, path: str | Path, suffix: str) -> NoReturn:
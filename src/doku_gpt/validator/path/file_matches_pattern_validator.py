@@ -4,13 +4,18 @@ import fnmatch
 from pathlib import Path
 
 from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.validator.path.path_context import PathContext
 from doku_gpt.validator.path.path_is_file_validator import PathIsFileValidator
 
 
 class FileMatchesPatternValidator:
     @classmethod
     def validate(cls, file: str | Path, pattern: str) -> Path:
-        file_path = PathIsFileValidator.validate(file)
+        return cls.validate_context(context=PathContext(file), pattern=pattern)
+
+    @classmethod
+    def validate_context(cls, context: PathContext, pattern: str) -> Path:
+        file_path = PathIsFileValidator.validate_context(context)
         normalized_pattern = pattern.strip()
 
         if not fnmatch.fnmatchcase(file_path.name, normalized_pattern):
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from doku_gpt.validator.path.abstract_path_validator import AbstractPathValidator
+from doku_gpt.validator.path.path_context import PathContext
 from doku_gpt.validator.path.path_exists_validator import PathExistsValidator
 from doku_gpt.validator.path.path_is_file_validator import PathIsFileValidator
 from doku_gpt.validator.path.path_is_not_hidden_validator import PathIsNotHiddenValidator
@@ -14,11 +15,14 @@ from doku_gpt.validator.path.path_is_writable_validator import PathIsWritableVal
 class FileValidator(AbstractPathValidator):
     @classmethod
     def validate(cls, path: str | Path) -> Path:
-        path = PathExistsValidator.validate(path)
-        path = PathIsFileValidator.validate(path)
-        path = PathIsNotSystemPathValidator.validate(path)
-        path = PathIsIsReadableValidator.validate(path)
-        path = PathIsWritableValidator.validate(path)
-        path = PathIsNotHiddenValidator.validate(path)
+        return cls.validate_context(PathContext(path))
 
-        return path
+    @classmethod
+    def validate_context(cls, context: PathContext) -> Path:
+        PathExistsValidator.validate_context(context)
+        PathIsFileValidator.validate_context(context)
+        PathIsNotSystemPathValidator.validate_context(context)
+        PathIsIsReadableValidator.validate_context(context)
+        PathIsWritableValidator.validate_context(context)
+
+        return PathIsNotHiddenValidator.validate_context(context)
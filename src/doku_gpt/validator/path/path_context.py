@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+from doku_gpt.cache.path_resolution_cache import PathResolutionCache
+
+
+class PathContext:
+    """
+    A path resolved and stat'ed once, shared by a chain of validators.
+
+    'resolved' follows the rules of AbstractPathValidator._normalize_path: the strict resolution when the path exists,
+    the non strict one when only its parent exists and None otherwise. Resolutions go through PathResolutionCache and
+    an existing path is always stat'ed, which also catches a memoized resolution of a path deleted since. Type, access
+    and hidden checks are computed on first use and cached, so a chain of validators costs a single stat.
+    """
+
+    __slots__ = ("__access", "__hidden", "__stat", "__stat_done", "exists", "original", "resolved")
+
+    def __init__(self, path: str | Path) -> None:
+        self.original = Path(str(path).strip())
+        self.exists = True
+        self.__stat: os.stat_result | None = None
+        self.__stat_done = False
+        self.__access: dict[int, bool] = {}
+        self.__hidden: bool | None = None
+
+        self.resolved: Path | None = self.__resolve()
+        if self.exists and self.__path_stat() is None:
+            # The memoized resolution may point to a path deleted since: resolve it again from the file system.
+            PathResolutionCache.forget(self.original)
+            self.exists = True
+            self.__stat_done = False
+            self.resolved = self.__resolve()
+
+    @property
+    def is_file(self) -> bool:
+        path_stat = self.__path_stat()
+        return path_stat is not None and stat.S_ISREG(path_stat.st_mode)
+
+    @property
+    def is_dir(self) -> bool:
+        path_stat = self.__path_stat()
+        return path_stat is not None and stat.S_ISDIR(path_stat.st_mode)
+
+    @property
+    def is_hidden(self) -> bool:
+        if self.__hidden is None:
+            parts = () if self.resolved is None else self.resolved.parts
+            self.__hidden = any(part.startswith(".") and part not in (".", "..") for part in parts)
+        return self.__hidden
+
+    def has_access(self, mode: int) -> bool:
+        if mode not in self.__access:
+            self.__access[mode] = self.resolved is not None and os.access(self.resolved, mode)
+        return self.__access[mode]
+
+    def __resolve(self) -> Path | None:
+        try:
+            return PathResolutionCache.resolve(self.original, strict=True)
+        except FileNotFoundError:
+            self.exists = False
+
+        try:
+            PathResolutionCache.resolve(self.original.parent, strict=True)
+        except FileNotFoundError:
+            return None
+        return PathResolutionCache.resolve(self.original, strict=False)
+
+    def __path_stat(self) -> os.stat_result | None:
+        if not self.__stat_done:
+            self.__stat_done = True
+            if self.exists and self.resolved is not None:
+                try:
+                    self.__stat = os.stat(self.resolved)
+                except (OSError, ValueError):
+                    self.__stat = None
+        return self.__stat
@@ -3,14 +3,16 @@ from __future__ import annotations
 from pathlib import Path
 
 from doku_gpt.validator.path.abstract_path_validator import AbstractPathValidator
+from doku_gpt.validator.path.path_context import PathContext
 
 
 class PathExistsValidator(AbstractPathValidator):
     @classmethod
     def validate(cls, path: str | Path) -> Path:
-        to_validade = Path(str(path).strip())
-        try:
-            to_validade = to_validade.resolve(strict=True)  # exige que o path exista
-        except FileNotFoundError:
-            cls._raise_error(path=to_validade, suffix="does not exist!")
-        return to_validade
+        return cls.validate_context(PathContext(path))
+
+    @classmethod
+    def validate_context(cls, context: PathContext) -> Path:
+        if not context.exists:
+            cls._raise_error(path=context.original, suffix="does not exist!")
+        return cls._normalize_context(context)
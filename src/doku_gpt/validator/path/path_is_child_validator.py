@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from doku_gpt.cache.path_resolution_cache import PathResolutionCache
 from doku_gpt.error.invalid_path_error import InvalidPathError
 
 
@@ -12,17 +13,17 @@ class PathIsChildValidator:
         child_path = Path(str(child).strip())
 
         try:
-            parent_resolved = parent_path.resolve(strict=True)
+            parent_resolved = PathResolutionCache.resolve_existing(parent_path)
         except FileNotFoundError:
             raise InvalidPathError(f"The path '{parent_path}' is not a valid parent since it does not exist!")
 
         relation_check_path: Path
         try:
-            child_resolved = child_path.resolve(strict=True)
+            child_resolved = PathResolutionCache.resolve_existing(child_path)
             relation_check_path = child_resolved
         except FileNotFoundError:
             try:
-                relation_check_path = child_path.parent.resolve(strict=True)
+                relation_check_path = PathResolutionCache.resolve_existing(child_path.parent)
             except FileNotFoundError:
                 raise InvalidPathError(f"The path '{child_path}' is not a valid child since it does not exist!")
 
@@ -31,4 +32,4 @@ class PathIsChildValidator:
         except ValueError:
             raise InvalidPathError(f"The path '{child_path}' is not a child of '{parent_path}'!")
 
-        return child_path.resolve(strict=False)
+        return PathResolutionCache.resolve(child_path, strict=False)
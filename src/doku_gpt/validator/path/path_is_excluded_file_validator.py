@@ -3,13 +3,18 @@ from __future__ import annotations
 from pathlib import Path
 
 from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.validator.path.path_context import PathContext
 from doku_gpt.validator.path.path_is_file_validator import PathIsFileValidator
 
 
 class PathIsExcludedFileValidator:
     @classmethod
     def validate(cls, file: str | Path, excluded_files: list[str]) -> Path:
-        file = PathIsFileValidator.validate(file)
+        return cls.validate_context(context=PathContext(file), excluded_files=excluded_files)
+
+    @classmethod
+    def validate_context(cls, context: PathContext, excluded_files: list[str]) -> Path:
+        file = PathIsFileValidator.validate_context(context)
 
         if file.with_suffix("").name in excluded_files:
             raise InvalidPathError(f"The given file '{file}' is excluded!")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.validator.path.path_context import PathContext
 from doku_gpt.validator.path.path_is_child_validator import PathIsChildValidator
 from doku_gpt.validator.path.path_is_folder_validator import PathIsFolderValidator
 
@@ -10,8 +11,16 @@ from doku_gpt.validator.path.path_is_folder_validator import PathIsFolderValidat
 class PathIsExcludedFolderValidator:
     @classmethod
     def validate(cls, folder: str | Path, excluded_folders: list[str], root_folder: str | Path | None = None) -> Path:
-        folder = PathIsFolderValidator.validate(folder)
-        to_validate = folder.resolve()
+        return cls.validate_context(
+            context=PathContext(folder), excluded_folders=excluded_folders, root_folder=root_folder
+        )
+
+    @classmethod
+    def validate_context(
+        cls, context: PathContext, excluded_folders: list[str], root_folder: str | Path | None = None
+    ) -> Path:
+        folder = PathIsFolderValidator.validate_context(context)
+        to_validate = folder
 
         if root_folder is not None:
             root_folder = PathIsFolderValidator.validate(root_folder)
@@ -3,17 +3,18 @@ from __future__ import annotations
 from pathlib import Path
 
 from doku_gpt.validator.path.abstract_path_validator import AbstractPathValidator
+from doku_gpt.validator.path.path_context import PathContext
 
 
 class PathIsFileValidator(AbstractPathValidator):
     @classmethod
     def validate(cls, path: str | Path) -> Path:
-        try:
-            path = cls._normalize_path(path=path)
-        except FileNotFoundError:
-            cls._raise_error(path=path, suffix="does not exist!")
+        return cls.validate_context(PathContext(path))
 
-        if not path.is_file():
+    @classmethod
+    def validate_context(cls, context: PathContext) -> Path:
+        path = cls._normalize_context(context)
+        if not context.is_file:
             cls._raise_error(path=path, suffix="is not a file!")
 
         return path
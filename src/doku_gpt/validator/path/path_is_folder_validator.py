@@ -3,16 +3,18 @@ from __future__ import annotations
 from pathlib import Path
 
 from doku_gpt.validator.path.abstract_path_validator import AbstractPathValidator
+from doku_gpt.validator.path.path_context import PathContext
 
 
 class PathIsFolderValidator(AbstractPathValidator):
     @classmethod
     def validate(cls, path: str | Path) -> Path:
-        try:
-            path = cls._normalize_path(path=path)
-        except FileNotFoundError:
-            cls._raise_error(path=path, suffix="does not exist!")
-        if not path.is_dir():
+        return cls.validate_context(PathContext(path))
+
+    @classmethod
+    def validate_context(cls, context: PathContext) -> Path:
+        path = cls._normalize_context(context)
+        if not context.is_dir:
             cls._raise_error(path=path, suffix="is not a directory!")
 
         return path
@@ -3,15 +3,18 @@ from __future__ import annotations
 from pathlib import Path
 
 from doku_gpt.validator.path.abstract_path_validator import AbstractPathValidator
+from doku_gpt.validator.path.path_context import PathContext
 
 
 class PathIsNotHiddenValidator(AbstractPathValidator):
     @classmethod
     def validate(cls, path: str | Path) -> Path:
-        path = cls._normalize_path(path)
+        return cls.validate_context(PathContext(path))
 
-        for segment in path.parts:
-            if segment.startswith(".") and segment not in (".", ".."):
-                cls._raise_error(path=path, suffix="is hidden!")
+    @classmethod
+    def validate_context(cls, context: PathContext) -> Path:
+        path = cls._normalize_context(context)
+        if context.is_hidden:
+            cls._raise_error(path=path, suffix="is hidden!")
 
         return path
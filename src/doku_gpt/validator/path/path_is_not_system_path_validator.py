@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 
 from doku_gpt.validator.path.abstract_path_validator import AbstractPathValidator
+from doku_gpt.validator.path.path_context import PathContext
 
 
 class PathIsNotSystemPathValidator(AbstractPathValidator):
@@ -30,7 +31,11 @@ class PathIsNotSystemPathValidator(AbstractPathValidator):
 
     @classmethod
     def validate(cls, path: str | Path) -> Path:
-        path = cls._normalize_path(path)
+        return cls.validate_context(PathContext(path))
+
+    @classmethod
+    def validate_context(cls, context: PathContext) -> Path:
+        path = cls._normalize_context(context)
         if path == Path("/"):
             cls._raise_error(path=path, suffix="is not allowed!")
 
@@ -4,13 +4,18 @@ import os
 from pathlib import Path
 
 from doku_gpt.validator.path.abstract_path_validator import AbstractPathValidator
+from doku_gpt.validator.path.path_context import PathContext
 
 
 class PathIsWritableValidator(AbstractPathValidator):
     @classmethod
     def validate(cls, path: str | Path) -> Path:
-        path = cls._normalize_path(path)
-        if not os.access(path, os.W_OK):
+        return cls.validate_context(PathContext(path))
+
+    @classmethod
+    def validate_context(cls, context: PathContext) -> Path:
+        path = cls._normalize_context(context)
+        if not context.has_access(os.W_OK):
             cls._raise_error(path=path, suffix="is not writable!")
 
         return path
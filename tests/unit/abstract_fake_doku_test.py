@@ -4,6 +4,8 @@ import shutil
 import unittest
 from pathlib import Path
 
+from doku_gpt.cache.path_resolution_cache import PathResolutionCache
+
 
 class AbstractFakeDokuTest(unittest.TestCase):
     @property
@@ -56,6 +58,7 @@ class AbstractFakeDokuTest(unittest.TestCase):
     def tearDown(self):
         if self.tmp_root.exists():
             shutil.rmtree(self.tmp_root, ignore_errors=True)
+        PathResolutionCache.clear()
 
     def _copy_folder_fake_data(self) -> None:
         source_path = self.fake_doku
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import sqlite3
+
+from doku_gpt.cache.http_metadata_cache import HttpMetadataCache
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
+from doku_gpt.registry.http_session_registry import HttpSessionRegistry
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+from tests.unit.local_http_server import LocalHttpServer
+
+
+class TestHttpMetadataCache(AbstractFakeDokuTest):
+    __PAGE = '<html><head><meta property="og:title" content="Cached page"></head><body></body></html>'
+
+    def setUp(self):
+        super().setUp()
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        HttpMetadataCache.reset_statistics()
+        self.cache_file = self.tmp_root.joinpath(HttpMetadataCache.FILE_NAME)
+        self.server = LocalHttpServer(routes={"/page": (200, self.__PAGE), "/other": (200, self.__PAGE)}).start()
+
+    def tearDown(self):
+        HttpMetadataCache.close()
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        self.server.stop()
+        super().tearDown()
+
+    def test_disabled(self):
+        HttpMetadataCache.put(HttpMetadataCache.TITLE, "https://example.com", "https://example.com", 200, "Title")
+        self.assertFalse(HttpMetadataCache.is_enabled())
+        self.assertEqual((None, False), HttpMetadataCache.get(HttpMetadataCache.TITLE, "https://example.com"))
+
+    def test_get_put(self):
+        HttpMetadataCache.open(self.cache_file)
+        url = "https://example.com/a"
+        HttpMetadataCache.put(HttpMetadataCache.TITLE, url, "https://example.com/b", 200, "Title", etag='"1"')
+
+        entry, fresh = HttpMetadataCache.get(HttpMetadataCache.TITLE, url)
+        self.assertTrue(fresh)
+        self.assertEqual(
+            ("https://example.com/b", 200, "Title", '"1"'), (entry.final_url, entry.status, entry.value, entry.etag)
+        )
+        self.assertEqual((None, False), HttpMetadataCache.get(HttpMetadataCache.EXISTS, url))
+        self.assertEqual({"entries": 1, "hits": 1, "revalidated": 0, "misses": 1}, HttpMetadataCache.statistics())
+
+    def test_expired_entry_is_stale(self):
+        HttpMetadataCache.open(self.cache_file, ttl=0)
+        HttpMetadataCache.put(HttpMetadataCache.EXISTS, "https://example.com", "https://example.com", 404)
+        entry, fresh = HttpMetadataCache.get(HttpMetadataCache.EXISTS, "https://example.com")
+        self.assertEqual(404, entry.status)
+        self.assertFalse(fresh)
+
+    def test_persisted_between_runs(self):
+        HttpMetadataCache.open(self.cache_file)
+        HttpMetadataCache.put(HttpMetadataCache.TITLE, "https://example.com", "https://example.com", 200, "Começo")
+        HttpMetadataCache.close()
+
+        HttpMetadataCache.open(self.cache_file)
+        entry, _ = HttpMetadataCache.get(HttpMetadataCache.TITLE, "https://example.com")
+        self.assertEqual("Começo", entry.value)
+
+    def test_shared_changes_are_visible_at_once(self):
+        HttpMetadataCache.open(self.cache_file, shared=True)
+        HttpMetadataCache.put(HttpMetadataCache.TITLE, "https://example.com", "https://example.com", 200, "Shared")
+
+        connection = sqlite3.connect(self.cache_file)
+        try:
+            row = connection.execute("SELECT value FROM http_metadata WHERE url = 'https://example.com'").fetchone()
+        finally:
+            connection.close()
+        self.assertEqual(("Shared",), row)
+
+    def test_corrupt_file(self):
+        self.cache_file.write_text("not a database" * 100, encoding="utf-8")
+        HttpMetadataCache.open(self.cache_file)
+        self.assertFalse(HttpMetadataCache.is_enabled())
+
+    def test_warm_run_makes_no_request(self):
+        url = self.server.url("/page")
+        other_url = self.server.url("/other")
+        HttpMetadataCache.open(self.cache_file)
+        self.assertEqual("Cached page", WebPageExtractor.extract_title(url))
+        self.assertTrue(WebPageExtractor.url_exists(other_url))
+        HttpMetadataCache.close()
+
+        WebPageExtractor.reset()
+        HttpMetadataCache.open(self.cache_file)
+        self.assertEqual("Cached page", WebPageExtractor.extract_title(url))
+        self.assertTrue(WebPageExtractor.url_exists(other_url))
+        self.assertEqual([("GET", "/page"), ("HEAD", "/other")], self.server.requests)
+
+    def test_expired_entry_is_revalidated(self):
+        url = self.server.url("/page")
+        HttpMetadataCache.open(self.cache_file, ttl=0)
+        self.assertEqual("Cached page", WebPageExtractor.extract_title(url))
+
+        WebPageExtractor.reset()
+        self.server.routes["/page"] = (200, self.__PAGE)
+        self.assertEqual("Cached page", WebPageExtractor.extract_title(url))
+        self.assertEqual(2, len(self.server.requests))
+        self.assertEqual(1, HttpMetadataCache.statistics()["revalidated"])
+
+    def test_changed_page_is_fetched_again(self):
+        url = self.server.url("/page")
+        HttpMetadataCache.open(self.cache_file, ttl=0)
+        self.assertEqual("Cached page", WebPageExtractor.extract_title(url))
+
+        WebPageExtractor.reset()
+        self.server.routes["/page"] = (200, self.__PAGE.replace("Cached page", "New title"))
+        self.assertEqual("New title", WebPageExtractor.extract_title(url))
+        self.assertEqual(0, HttpMetadataCache.statistics()["revalidated"])
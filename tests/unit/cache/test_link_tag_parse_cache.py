@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from doku_gpt.cache.link_tag_parse_cache import LinkTagParseCache
+from doku_gpt.enum.link_status import LinkStatus
+from doku_gpt.enum.link_type import LinkType
+from doku_gpt.factory.link_tag_factory import LinkTagFactory
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestLinkTagParseCache(AbstractFakeDokuTest):
+    def setUp(self):
+        super().setUp()
+        LinkTagParseCache.clear()
+        LinkTagParseCache.reset_statistics()
+
+    def tearDown(self):
+        LinkTagParseCache.clear()
+        LinkTagParseCache.reset_statistics()
+        super().tearDown()
+
+    def test_parse_is_memoized(self):
+        factory = LinkTagFactory(root_folder=self.tmp_root)
+        first = factory.get("[[:one:two:start?do=edit#top|Start]]")
+        second = factory.get("[[:one:two:start?do=edit#top|Start]]")
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(LinkType.INTERNAL_ABSOLUTE, second.link_type)
+        self.assertEqual(("do=edit", "top", "Start"), (second.target_query, second.target_fragment, second.label))
+        self.assertEqual({"entries": 1, "hits": 1, "misses": 1}, LinkTagParseCache.statistics())
+
+    def test_cached_tags_are_independent(self):
+        factory = LinkTagFactory(root_folder=self.tmp_root)
+        first = factory.get("[[imdb>tt0105695|Unforgiven]]")
+        first.resolved = "https://www.imdb.com/title/tt0105695/"
+        first.link_status = LinkStatus.VALID
+        first.label = "Changed"
+
+        second = factory.get("[[imdb>tt0105695|Unforgiven]]")
+        self.assertIsNone(second.resolved)
+        self.assertEqual(LinkStatus.NOT_VALIDATED, second.link_status)
+        self.assertEqual("Unforgiven", second.label)
+
+    def test_root_folder_is_not_cached(self):
+        LinkTagFactory(root_folder=self.tmp_root).get("[[:two:start]]")
+        link_tag = LinkTagFactory(root_folder=self.folder_valid).get("[[:two:start]]")
+        self.assertEqual(self.folder_valid, link_tag._root_folder)
+
+    def test_invalid_tag_is_not_memoized(self):
+        factory = LinkTagFactory(root_folder=self.tmp_root)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                factory.get("[[ | label ]]")
+
+        self.assertEqual({"entries": 0, "hits": 0, "misses": 2}, LinkTagParseCache.statistics())
+
+    def test_bounded(self):
+        max_entries = LinkTagParseCache.MAX_ENTRIES
+        LinkTagParseCache.MAX_ENTRIES = 2
+        try:
+            factory = LinkTagFactory(root_folder=self.tmp_root)
+            for name in ("one", "two", "three"):
+                factory.get(f"[[{name}]]")
+        finally:
+            LinkTagParseCache.MAX_ENTRIES = max_entries
+
+        self.assertEqual(2, LinkTagParseCache.statistics()["entries"])
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import os
+
+from doku_gpt.adapter.page_adapter import PageAdapter
+from doku_gpt.cache.page_cache import PageCache
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestPageCache(AbstractFakeDokuTest):
+    def setUp(self):
+        super().setUp()
+        PageCache.enable()
+        PageCache.reset_statistics()
+
+    def tearDown(self):
+        PageCache.disable()
+        super().tearDown()
+
+    def test_content_is_read_once(self):
+        adapter = PageAdapter(self.file_valid)
+        self.assertEqual(self.file_valid.read_text(encoding="utf-8"), adapter.content)
+        self.assertEqual(adapter.content.splitlines(), adapter.lines)
+        self.assertEqual(1, PageCache.statistics()["misses"])
+        self.assertEqual(2, PageCache.statistics()["hits"])
+
+    def test_setters_update_the_cache(self):
+        adapter = PageAdapter(self.file_valid)
+        adapter.lines = ["====== Title ======", "", "Body", "", ""]
+        self.assertEqual(["====== Title ======", "", "Body"], PageAdapter(self.file_valid).lines)
+
+        adapter.content = "changed\n"
+        self.assertEqual("changed\n", PageAdapter(self.file_valid).content)
+        self.assertEqual(0, PageCache.statistics()["misses"])
+
+    def test_external_change_is_read_again(self):
+        adapter = PageAdapter(self.file_valid)
+        adapter.content = "first\n"
+
+        self.file_valid.write_text("second, longer\n", encoding="utf-8")
+        self.assertEqual("second, longer\n", adapter.content)
+
+    def test_same_size_change_with_new_mtime_is_read_again(self):
+        adapter = PageAdapter(self.file_valid)
+        adapter.content = "aaaa\n"
+        page_stat = os.stat(self.file_valid)
+
+        self.file_valid.write_text("bbbb\n", encoding="utf-8")
+        os.utime(self.file_valid, ns=(page_stat.st_atime_ns, page_stat.st_mtime_ns + 1_000_000))
+        self.assertEqual("bbbb\n", adapter.content)
+
+    def test_memory_budget(self):
+        PageCache.enable(max_bytes=1)
+        PageAdapter(self.file_valid).content
+        self.assertEqual(0, PageCache.statistics()["entries"])
+
+    def test_disabled_reads_from_disk(self):
+        PageCache.disable()
+        PageAdapter(self.file_valid).content
+        self.assertEqual(0, PageCache.statistics()["entries"])
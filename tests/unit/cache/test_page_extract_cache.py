@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from doku_gpt.cache.page_extract_cache import PageExtractCache
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestPageExtractCache(AbstractFakeDokuTest):
+    def setUp(self):
+        super().setUp()
+        PageExtractCache.clear()
+        PageExtractCache.reset_statistics()
+
+    def tearDown(self):
+        PageExtractCache.clear()
+        super().tearDown()
+
+    def test_get_put(self):
+        self.assertEqual((False, None), PageExtractCache.get(PageExtractCache.TITLE, self.file_valid, "intro"))
+
+        PageExtractCache.put(PageExtractCache.TITLE, self.file_valid, "intro", "Intro")
+        PageExtractCache.put(PageExtractCache.EXCERPT, self.file_valid, "intro", None)
+        self.assertEqual((True, "Intro"), PageExtractCache.get(PageExtractCache.TITLE, self.file_valid, "intro"))
+        self.assertEqual((True, None), PageExtractCache.get(PageExtractCache.EXCERPT, self.file_valid, "intro"))
+        self.assertEqual((False, None), PageExtractCache.get(PageExtractCache.TITLE, self.file_valid, None))
+        self.assertEqual({"entries": 2, "hits": 2, "misses": 2}, PageExtractCache.statistics())
+
+    def test_changed_page_is_not_served(self):
+        PageExtractCache.put(PageExtractCache.TITLE, self.file_valid, None, "Start")
+        self.file_valid.write_text("====== Changed title ======\n", encoding="utf-8")
+        self.assertEqual((False, None), PageExtractCache.get(PageExtractCache.TITLE, self.file_valid, None))
+        self.assertEqual(0, PageExtractCache.statistics()["entries"])
+
+    def test_missing_page_is_not_stored(self):
+        PageExtractCache.put(PageExtractCache.TITLE, self.file_invalid, None, "Missing")
+        self.assertEqual(0, PageExtractCache.statistics()["entries"])
+
+    def test_bounded(self):
+        max_entries = PageExtractCache.MAX_ENTRIES
+        PageExtractCache.MAX_ENTRIES = 2
+        try:
+            for fragment in ("one", "two", "three"):
+                PageExtractCache.put(PageExtractCache.TITLE, self.file_valid, fragment, fragment)
+        finally:
+            PageExtractCache.MAX_ENTRIES = max_entries
+
+        self.assertEqual((False, None), PageExtractCache.get(PageExtractCache.TITLE, self.file_valid, "one"))
+        self.assertEqual((True, "three"), PageExtractCache.get(PageExtractCache.TITLE, self.file_valid, "three"))
+
+    def test_save_and_load(self):
+        cache_file = self.tmp_root.joinpath(PageExtractCache.FILE_NAME)
+        PageExtractCache.put(PageExtractCache.EXCERPT, self.file_valid, "intro", "Começo")
+        PageExtractCache.save(cache_file)
+        PageExtractCache.clear()
+
+        PageExtractCache.load(cache_file)
+        self.assertEqual((True, "Começo"), PageExtractCache.get(PageExtractCache.EXCERPT, self.file_valid, "intro"))
+
+    def test_load_corrupt_file(self):
+        cache_file = self.tmp_root.joinpath(PageExtractCache.FILE_NAME)
+        cache_file.write_text("[1, 2", encoding="utf-8")
+        PageExtractCache.load(cache_file)
+        self.assertEqual(0, PageExtractCache.statistics()["entries"])
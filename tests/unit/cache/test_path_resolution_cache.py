@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from doku_gpt.cache.path_resolution_cache import PathResolutionCache
+from doku_gpt.validator.path.file_validator import FileValidator
+from doku_gpt.validator.path.path_context import PathContext
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestPathResolutionCache(AbstractFakeDokuTest):
+    def setUp(self):
+        super().setUp()
+        PathResolutionCache.clear()
+        PathResolutionCache.reset_statistics()
+
+    def test_resolve_is_memoized(self):
+        link = self.tmp_root.joinpath("link.txt")
+        link.symlink_to(self.file_valid)
+
+        self.assertEqual(self.file_valid, PathResolutionCache.resolve(link, strict=True))
+        self.assertEqual(self.file_valid, PathResolutionCache.resolve(link, strict=True))
+        self.assertEqual({"entries": 1, "hits": 1, "misses": 1}, PathResolutionCache.statistics())
+
+    def test_missing_path_is_not_memoized(self):
+        for _ in range(2):
+            with self.assertRaises(FileNotFoundError):
+                PathResolutionCache.resolve(self.file_invalid, strict=True)
+
+        self.assertEqual({"entries": 0, "hits": 0, "misses": 2}, PathResolutionCache.statistics())
+
+    def test_forget(self):
+        PathResolutionCache.resolve(self.file_valid, strict=True)
+        PathResolutionCache.resolve(self.file_valid, strict=False)
+        PathResolutionCache.forget(self.file_valid)
+        self.assertEqual(0, PathResolutionCache.statistics()["entries"])
+
+    def test_bounded(self):
+        max_entries = PathResolutionCache.MAX_ENTRIES
+        PathResolutionCache.MAX_ENTRIES = 2
+        try:
+            for name in ("one", "two", "two/three"):
+                PathResolutionCache.resolve(self.tmp_root.joinpath(name), strict=True)
+        finally:
+            PathResolutionCache.MAX_ENTRIES = max_entries
+
+        self.assertEqual(2, PathResolutionCache.statistics()["entries"])
+
+    def test_validator_chain_resolves_once(self):
+        FileValidator.validate(self.file_valid)
+        FileValidator.validate(self.file_valid)
+        self.assertEqual(1, PathResolutionCache.statistics()["misses"])
+
+    def test_deleted_path_is_resolved_again(self):
+        self.assertTrue(PathContext(self.file_valid).exists)
+        self.file_valid.unlink()
+        self.assertFalse(PathContext(self.file_valid).exists)
+
+    def test_resolve_existing(self):
+        self.assertEqual(self.file_valid, PathResolutionCache.resolve_existing(self.file_valid))
+        self.file_valid.unlink()
+        with self.assertRaises(FileNotFoundError):
+            PathResolutionCache.resolve_existing(self.file_valid)
+        self.assertEqual(0, PathResolutionCache.statistics()["entries"])
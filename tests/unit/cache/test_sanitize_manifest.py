@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from doku_gpt.cache.sanitize_manifest import SanitizeManifest
+from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.sanitizer.root.parallel_page_sanitizer import ParallelPageSanitizer
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestSanitizeManifest(AbstractFakeDokuTest):
+    def setUp(self):
+        super().setUp()
+        self.folder = self.tmp_root.joinpath("inc")
+        self.folder.mkdir()
+        self.page_a = self.__write("a.txt", "====== A ======\n\nSee [[.b]].\n")
+        self.page_b = self.__write("b.txt", "====== B ======\n\nBody.\n")
+        self.page_c = self.__write("c.txt", "====== C ======\n\nSee [[ b ]] and [[.b|Bee]].\n")
+
+    def test_first_run_records_every_page(self):
+        self.assertEqual([self.page_a, self.page_b, self.page_c], self.__run())
+        self.assertTrue(self.tmp_root.joinpath(SanitizeManifest.FILE_NAME).is_file())
+        self.assertEqual("====== A ======\n\nSee [[:inc:b|B]].\n", self.page_a.read_text())
+
+    def test_unchanged_pages_are_skipped(self):
+        self.__run()
+        sanitizer = ParallelPageSanitizer(root_folder=self.tmp_root, incremental=True)
+        self.assertEqual([], [page for page, _ in sanitizer.sanitize(self.__pages())])
+        self.assertEqual(3, sanitizer.skipped)
+
+    def test_touched_page_with_same_bytes_is_skipped(self):
+        self.__run()
+        self.page_a.write_text(self.page_a.read_text())
+        self.assertEqual([], self.__run())
+
+    def test_changed_page_is_sanitized(self):
+        self.__run()
+        self.page_c.write_text(self.page_c.read_text() + "More.\n")
+        self.assertEqual([self.page_c], self.__run())
+
+    def test_changed_title_of_linked_page(self):
+        self.__run()
+        self.page_b.write_text("====== Bee ======\n\nBody.\n")
+        self.assertEqual([self.page_a, self.page_b, self.page_c], self.__run())
+
+    def test_changed_body_of_linked_page(self):
+        self.__run()
+        self.page_b.write_text("====== B ======\n\nAnother body.\n")
+        self.assertEqual([self.page_b], self.__run())
+        self.assertEqual([], self.__run())
+
+    def test_removed_linked_page(self):
+        self.__run()
+        self.page_b.unlink()
+        with self.assertRaises(InvalidPathError):
+            self.__run()
+
+    def test_added_page_resanitizes_pages_with_relative_links(self):
+        self.__run()
+        self.__write("d.txt", "====== D ======\n")
+        self.assertEqual([self.page_c, self.folder.joinpath("d.txt")], self.__run())
+        self.assertEqual([], self.__run())
+
+    def __run(self) -> list[Path]:
+        sanitizer = ParallelPageSanitizer(root_folder=self.tmp_root, incremental=True)
+        return [page for page, _ in sanitizer.sanitize(self.__pages())]
+
+    def __pages(self) -> list[Path]:
+        return sorted(self.folder.glob("*.txt"))
+
+    def __write(self, name: str, content: str) -> Path:
+        page = self.folder.joinpath(name)
+        page.write_text(content, encoding="utf-8")
+        return page
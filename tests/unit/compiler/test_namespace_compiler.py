@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from doku_gpt.compiler.namespace_compiler import NamespaceCompiler
+from doku_gpt.finder.finder import Finder
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestNamespaceCompiler(AbstractFakeDokuTest):
+    def test_render(self):
+        content = self.__compiler().render()
+
+        self.assertTrue(content.startswith("====== two › Else ======\n"))
+        self.assertIn("\n\n====== two › three › Start ======\n", content)
+        self.assertNotIn("Secret", content)
+        self.assertTrue(self.file_valid.is_file())
+
+    def test_render_given_files(self):
+        files = Finder(root_folder=self.tmp_root).find_files("*.txt")
+        self.assertEqual(self.__compiler().render(), self.__compiler().render(files))
+
+    def __compiler(self) -> NamespaceCompiler:
+        return NamespaceCompiler(namespace_folder=self.folder_valid, root_folder=self.tmp_root)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import unittest
+
+from doku_gpt.extractor.parser.head_meta_parser import HeadMetaParser
+
+
+class TestHeadMetaParser(unittest.TestCase):
+    __PAGE = (
+        "<!DOCTYPE html><html><head>"
+        '<link property="og:title" href="/x">'
+        '<meta property="og:title" content="Caf&eacute; &amp; bar">'
+        '<meta property="og:title" content="Second">'
+        '<meta name="description" content="Ignored">'
+        '<meta property="title" content="Plain">'
+        "</head><body>"
+        '<meta property="twitter:title" content="Body">'
+        "</body></html>"
+    )
+
+    def test_first_values(self):
+        parser = HeadMetaParser()
+        parser.feed(self.__PAGE)
+        self.assertTrue(parser.done)
+        self.assertEqual("Café & bar", parser.first_meta("og:title"))
+        self.assertIsNone(parser.first_tag("og:title"))
+        self.assertEqual("Plain", parser.first_meta("title"))
+        self.assertIsNone(parser.first_meta("twitter:title"))
+
+    def test_fed_in_chunks(self):
+        parser = HeadMetaParser()
+        for index in range(0, len(self.__PAGE), 7):
+            parser.feed(self.__PAGE[index : index + 7])
+            if parser.done:
+                break
+        self.assertEqual("Café & bar", parser.first_meta("og:title"))
+        self.assertEqual("Plain", parser.first_tag("title"))
+
+    def test_body_without_head(self):
+        parser = HeadMetaParser()
+        parser.feed('<meta property="og:title" content="Top"><body><meta property="title" content="Body">')
+        self.assertTrue(parser.done)
+        self.assertEqual("Top", parser.first_meta("og:title"))
+        self.assertIsNone(parser.first_tag("title"))
+
+    def test_not_done_without_end_of_head(self):
+        parser = HeadMetaParser()
+        parser.feed('<html><head><meta property="og:title" content="Open"')
+        self.assertFalse(parser.done)
+        self.assertIsNone(parser.first_meta("og:title"))
+        parser.feed(">")
+        self.assertEqual("Open", parser.first_meta("og:title"))
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import unittest
+
+from doku_gpt.extractor.page_header import PageHeader
+from doku_gpt.extractor.page_header_index import PageHeaderIndex
+
+
+class TestPageHeaderIndex(unittest.TestCase):
+    __CONTENT = (
+        "====== Título Principal ======\n"
+        "\n"
+        "Texto.\n"
+        "\n"
+        "\n"
+        "===== Coração de Pedra #001 =====\n"
+        "Mais texto.\n"
+        "== Linha_do_tempo =="
+    )
+
+    def test_headers(self):
+        index = PageHeaderIndex(self.__CONTENT)
+        self.assertEqual(
+            [(1, 6, "Título Principal"), (4, 5, "Coração de Pedra #001"), (8, 2, "Linha_do_tempo")],
+            [(header.line, header.level, header.title) for header in index.headers],
+        )
+
+    def test_offsets(self):
+        index = PageHeaderIndex(self.__CONTENT)
+        for header in index.headers:
+            self.assertIn(header.title, self.__CONTENT[header.start : header.end])
+
+    def test_tokens(self):
+        header = PageHeaderIndex(self.__CONTENT).headers[1]
+        self.assertEqual(["coracao", "de", "pedra", "1"], header.romanized_tokens)
+        self.assertEqual(["coracao", "de", "pedra", "1"], header.deaccent_tokens)
+
+    def test_find(self):
+        index = PageHeaderIndex(self.__CONTENT)
+        self.assertEqual(1, index.find(["pedra", "1"], ["pedra", "1"]))
+        self.assertEqual(2, index.find(["linha", "tempo"], ["linha", "tempo"]))
+        self.assertIsNone(index.find(["tempo", "linha"], ["tempo", "linha"]))
+        self.assertIsNone(index.find([], []))
+
+    def test_for_content_is_memoized(self):
+        PageHeaderIndex.clear()
+        self.assertIs(PageHeaderIndex.for_content(self.__CONTENT), PageHeaderIndex.for_content(self.__CONTENT))
+        self.assertIsNot(
+            PageHeaderIndex.for_content(self.__CONTENT), PageHeaderIndex.for_content(self.__CONTENT + "\n")
+        )
+
+    def test_number_token(self):
+        self.assertEqual("1", PageHeader.normalize_number_token("001"))
+        self.assertEqual("a01", PageHeader.normalize_number_token("a01"))
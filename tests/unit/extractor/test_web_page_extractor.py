@@ -3,6 +3,8 @@ from __future__ import annotations
 import unittest
 
 from doku_gpt.extractor.web_page_extractor import WebPageExtractor
+from doku_gpt.registry.http_session_registry import HttpSessionRegistry
+from tests.unit.local_http_server import LocalHttpServer
 
 
 class TestisFile(unittest.TestCase):
@@ -37,3 +39,45 @@ class TestisFile(unittest.TestCase):
     def test_fetch_title_04(self):
         url = "https://en.wikipedia.org/wiki/Robert_Redford"
         self.assertEqual("Robert Redford", WebPageExtractor.extract_title(url))
+
+
+class TestHeadOnlyTitle(unittest.TestCase):
+    __PAGES = {
+        "/og": '<html><head><meta property="og:title" content="  Open   Graph "></head><body></body></html>',
+        "/twitter": '<html><head><meta property="og:title" content=""><meta property="twitter:title" content="Tw">'
+        "</head></html>",
+        "/title": '<html><head><span property="title" content="From span"></span></head></html>',
+        "/wiki": '<html><head><meta property="og:title" content="Robert Redford – Wikipédia, a enciclopédia livre">'
+        "</head></html>",
+        "/none": "<html><head><title>Not a property</title></head><body>" + "x" * 200_000 + "</body></html>",
+        "/unclosed": '<html><meta property="og:title" content="No head">',
+    }
+
+    def setUp(self):
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        routes = {path: (200, body) for path, body in self.__PAGES.items()}
+        self.server = LocalHttpServer(routes=routes).start()
+
+    def tearDown(self):
+        WebPageExtractor.HEAD_ONLY = True
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        self.server.stop()
+
+    def test_head_only_matches_full_parse(self):
+        for path in self.__PAGES:
+            with self.subTest(path=path):
+                WebPageExtractor.HEAD_ONLY = True
+                WebPageExtractor.reset()
+                head_only = WebPageExtractor.extract_title(self.server.url(path))
+
+                WebPageExtractor.HEAD_ONLY = False
+                WebPageExtractor.reset()
+                self.assertEqual(WebPageExtractor.extract_title(self.server.url(path)), head_only)
+
+    def test_titles(self):
+        self.assertEqual("Open Graph", WebPageExtractor.extract_title(self.server.url("/og")))
+        self.assertEqual("Tw", WebPageExtractor.extract_title(self.server.url("/twitter")))
+        self.assertEqual("From span", WebPageExtractor.extract_title(self.server.url("/title")))
+        self.assertIsNone(WebPageExtractor.extract_title(self.server.url("/none")))
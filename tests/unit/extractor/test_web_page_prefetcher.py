@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import unittest
+
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
+from doku_gpt.extractor.web_page_prefetcher import WebPagePrefetcher
+from doku_gpt.registry.http_session_registry import HttpSessionRegistry
+from tests.unit.local_http_server import LocalHttpServer
+
+
+class TestWebPagePrefetcher(unittest.TestCase):
+    __PAGE = '<html><head><meta property="og:title" content="Page {}"></head><body></body></html>'
+
+    def setUp(self):
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        routes = {f"/page/{i}": (200, self.__PAGE.format(i)) for i in range(8)}
+        self.server = LocalHttpServer(routes=routes, delay=0.05).start()
+
+    def tearDown(self):
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        self.server.stop()
+
+    def test_prefetch_limits_requests_per_host(self):
+        urls = {self.server.url(f"/page/{i}"): True for i in range(8)}
+        WebPagePrefetcher(workers=8, per_host=2).prefetch(urls)
+
+        self.assertEqual(8, len(self.server.requests))
+        self.assertLessEqual(self.server.max_active, 2)
+
+    def test_prefetched_results_are_reused(self):
+        title_url = self.server.url("/page/1")
+        head_url = self.server.url("/page/2")
+        missing_url = self.server.url("/missing")
+        WebPagePrefetcher(workers=4).prefetch({title_url: True, head_url: False, missing_url: True})
+        served = len(self.server.requests)
+
+        self.assertEqual("Page 1", WebPageExtractor.extract_title(title_url))
+        self.assertTrue(WebPageExtractor.url_exists(head_url))
+        self.assertIsNone(WebPageExtractor.extract_title(missing_url))
+        self.assertFalse(WebPageExtractor.url_exists(missing_url))
+        self.assertEqual(served, len(self.server.requests))
+
+    def test_head_only_when_title_is_not_needed(self):
+        WebPagePrefetcher().prefetch({self.server.url("/page/3"): False})
+        self.assertEqual([("HEAD", "/page/3")], self.server.requests)
+
+    def test_reset_forgets_results(self):
+        url = self.server.url("/page/4")
+        WebPagePrefetcher().prefetch({url: False})
+        WebPageExtractor.reset()
+        WebPageExtractor.url_exists(url)
+        self.assertEqual([("HEAD", "/page/4"), ("HEAD", "/page/4")], self.server.requests)
+
+    def test_unfetchable_urls_are_skipped(self):
+        WebPagePrefetcher().prefetch({"mailto:someone@example.com": True, "ftp://example.com/file": False})
+        self.assertEqual([], self.server.requests)
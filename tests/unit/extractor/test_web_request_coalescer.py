@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+import requests
+
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
+from doku_gpt.extractor.web_request_coalescer import WebRequestCoalescer
+from doku_gpt.registry.http_session_registry import HttpSessionRegistry
+from tests.unit.local_http_server import LocalHttpServer
+
+
+class TestWebRequestCoalescer(unittest.TestCase):
+    __PAGE = '<html><head><meta property="og:title" content="Shared"></head></html>'
+
+    def setUp(self):
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        routes = {"/page": (200, self.__PAGE), "/empty": (200, "<html></html>")}
+        self.server = LocalHttpServer(routes=routes, delay=0.05).start()
+
+    def tearDown(self):
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        self.server.stop()
+
+    def test_normalize(self):
+        self.assertEqual("https://example.com/", WebRequestCoalescer.normalize(" HTTPS://Example.COM:443 "))
+        self.assertEqual(
+            "http://example.com:8080/a?b=1", WebRequestCoalescer.normalize("http://example.com:8080/a?b=1#c")
+        )
+        self.assertEqual("https://example.com/A", WebRequestCoalescer.normalize("https://example.com/A"))
+
+    def test_run_once_per_key(self):
+        calls = []
+        release = threading.Event()
+
+        def request():
+            calls.append(1)
+            release.wait(1)
+            return "value"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(WebRequestCoalescer.run, "get", f"https://example.com/#{index}", request)
+                for index in range(4)
+            ]
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(["value"] * 4, results)
+        self.assertEqual(1, len(calls))
+        self.assertEqual({"requests": 1, "shared": 3}, WebRequestCoalescer.statistics())
+
+    def test_error_is_shared(self):
+        def request():
+            raise requests.ConnectionError("failed")
+
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                WebRequestCoalescer.run("get", "https://example.com", request)
+        self.assertEqual((False, None), WebRequestCoalescer.result("get", "https://example.com"))
+
+    def test_interrupt_is_not_shared(self):
+        release = threading.Event()
+
+        def interrupted():
+            release.wait(1)
+            raise KeyboardInterrupt
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            owner = executor.submit(WebRequestCoalescer.run, "get", "https://example.com", interrupted)
+            waiter = executor.submit(WebRequestCoalescer.run, "get", "https://example.com", interrupted)
+            while WebRequestCoalescer.statistics()["shared"] < 1:
+                time.sleep(0.01)
+            release.set()
+
+            with self.assertRaises(KeyboardInterrupt):
+                owner.result()
+            with self.assertRaises(CancelledError):
+                waiter.result()
+
+        self.assertEqual((False, None), WebRequestCoalescer.result("get", "https://example.com"))
+        self.assertEqual("value", WebRequestCoalescer.run("get", "https://example.com", lambda: "value"))
+
+    def test_title_then_exists_is_one_request(self):
+        url = self.server.url("/page")
+        self.assertEqual("Shared", WebPageExtractor.extract_title(url))
+        self.assertEqual("Shared", WebPageExtractor.extract_title(url.upper().replace("/PAGE", "/page") + "#top"))
+        self.assertTrue(WebPageExtractor.url_exists(url))
+        self.assertEqual([("GET", "/page")], self.server.requests)
+
+    def test_title_not_found_still_reuses_get(self):
+        url = self.server.url("/empty")
+        self.assertIsNone(WebPageExtractor.extract_title(url))
+        self.assertTrue(WebPageExtractor.url_exists(url))
+        self.assertEqual([("GET", "/empty")], self.server.requests)
+
+    def test_failed_get_falls_back_to_head(self):
+        url = self.server.url("/missing")
+        self.assertIsNone(WebPageExtractor.extract_title(url))
+        self.assertFalse(WebPageExtractor.url_exists(url))
+        self.assertFalse(WebPageExtractor.url_exists(url))
+        self.assertEqual([("GET", "/missing"), ("HEAD", "/missing")], self.server.requests)
+
+    def test_concurrent_callers_share_one_request(self):
+        url = self.server.url("/page")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            titles = list(executor.map(WebPageExtractor.extract_title, [url] * 8))
+        self.assertEqual(["Shared"] * 8, titles)
+        self.assertEqual([("GET", "/page")], self.server.requests)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from doku_gpt.finder.finder import Finder
+from doku_gpt.finder.tree_snapshot import TreeSnapshot
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestTreeSnapshot(AbstractFakeDokuTest):
+    __OLD_MTIME_NS = 1_000_000_000_000_000_000
+
+    def setUp(self):
+        super().setUp()
+        TreeSnapshot.reset()
+        self.__age_folders()
+
+    def tearDown(self):
+        TreeSnapshot.reset()
+        super().tearDown()
+
+    def test_same_result_as_plain_finder(self):
+        finder = Finder(root_folder=self.tmp_root, snapshot=True)
+        plain_finder = Finder(root_folder=self.tmp_root)
+        self.assertEqual(plain_finder.find_files(), finder.find_files())
+        self.assertEqual(plain_finder.find_folders(), finder.find_folders())
+
+    def test_snapshot_is_saved_hidden(self):
+        finder = Finder(root_folder=self.tmp_root, snapshot=True)
+        files = finder.find_files()
+        self.assertTrue(self.tmp_root.joinpath(TreeSnapshot.FILE_NAME).is_file())
+        self.assertNotIn(self.tmp_root.joinpath(TreeSnapshot.FILE_NAME), files)
+
+    def test_unchanged_folder_is_read_from_snapshot(self):
+        Finder(root_folder=self.tmp_root, snapshot=True).find_files()
+        TreeSnapshot.reset()
+
+        # Creating a file without touching the folder mtime is invisible to a reloaded snapshot.
+        added_file = self.tmp_root.joinpath("one/added.txt")
+        added_file.write_text("added")
+        self.__age_folders()
+        self.assertNotIn(added_file, Finder(root_folder=self.tmp_root, snapshot=True).find_files())
+
+    def test_changed_folder_is_scanned_again(self):
+        Finder(root_folder=self.tmp_root, snapshot=True).find_files()
+        TreeSnapshot.reset()
+
+        added_file = self.tmp_root.joinpath("one/added.txt")
+        added_file.write_text("added")
+        self.assertIn(added_file, Finder(root_folder=self.tmp_root, snapshot=True).find_files())
+
+    def test_removed_folder_is_forgotten(self):
+        finder = Finder(root_folder=self.tmp_root, snapshot=True)
+        finder.find_files()
+
+        for file in self.tmp_root.joinpath("two/three").iterdir():
+            file.unlink()
+        self.tmp_root.joinpath("two/three").rmdir()
+        folders = finder.find_folders()
+        self.assertEqual([self.tmp_root.joinpath("one"), self.tmp_root.joinpath("two")], folders)
+
+    def test_corrupt_snapshot_is_ignored(self):
+        self.tmp_root.joinpath(TreeSnapshot.FILE_NAME).write_text("{not json")
+        finder = Finder(root_folder=self.tmp_root, snapshot=True)
+        self.assertEqual(Finder(root_folder=self.tmp_root).find_files(), finder.find_files())
+
+    def __age_folders(self) -> None:
+        folders: list[Path] = [self.tmp_root]
+        for current_folder, children, _ in os.walk(self.tmp_root):
+            folders.extend(Path(current_folder).joinpath(child) for child in children)
+        for folder in folders:
+            os.utime(folder, ns=(self.__OLD_MTIME_NS, self.__OLD_MTIME_NS))
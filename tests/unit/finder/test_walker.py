@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from doku_gpt.finder.walker import Walker
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestWalker(AbstractFakeDokuTest):
+    def test_folders(self):
+        walker = self.__create_walker()
+        folders = walker.folders(self.tmp_root)
+        self.assertEqual(
+            [self.tmp_root.joinpath("one"), self.tmp_root.joinpath("two"), self.tmp_root.joinpath("two/three")],
+            sorted(folders),
+        )
+
+    def test_folders_not_recursive(self):
+        walker = self.__create_walker()
+        folders = walker.folders(self.tmp_root, recursive=False)
+        self.assertEqual([self.tmp_root.joinpath("one"), self.tmp_root.joinpath("two")], sorted(folders))
+
+    def test_folders_excluded_are_pruned(self):
+        walker = self.__create_walker(excluded_folders=["two"])
+        folders = walker.folders(self.tmp_root)
+        self.assertEqual([self.tmp_root.joinpath("one")], folders)
+
+    def test_files(self):
+        walker = self.__create_walker()
+        files = walker.files(self.tmp_root, recursive=True)
+        self.assertEqual(12, len(files))
+        self.assertNotIn(self.file_secret, files)
+
+    def test_files_children(self):
+        walker = self.__create_walker(excluded_files=["end"])
+        files = walker.files(self.folder_valid, pattern="*.txt")
+        self.assertEqual([self.tmp_root.joinpath("two/else.txt"), self.file_valid], sorted(files))
+
+    def test_files_linked_folder(self):
+        self.tmp_root.joinpath("link").symlink_to(self.tmp_root.joinpath("two/three"))
+        walker = self.__create_walker()
+        folders = walker.folders(self.tmp_root)
+        files = walker.files(self.tmp_root, pattern="start*", recursive=True)
+        self.assertEqual(2, folders.count(self.tmp_root.joinpath("two/three")))
+        self.assertEqual(2, files.count(self.tmp_root.joinpath("two/three/start.txt")))
+
+    def __create_walker(
+        self,
+        excluded_folders: list[str] | None = None,
+        excluded_files: list[str] | None = None,
+    ) -> Walker:
+        return Walker(
+            root_folder=self.tmp_root,
+            excluded_folders=excluded_folders or [],
+            excluded_files=excluded_files or [],
+        )
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class LocalHttpServer:
+    """
+    Keep-alive HTTP/1.1 server on 127.0.0.1 for tests that must not reach the network.
+    'routes' maps a path to (status, body); unknown paths answer 404. Served paths are recorded in 'requests' and the
+    highest number of requests handled at the same time in 'max_active'. Successful answers carry an ETag and a
+    request whose If-None-Match matches it is answered 304.
+    """
+
+    def __init__(self, routes: dict[str, tuple[int, str]], delay: float = 0.0) -> None:
+        self.routes = routes
+        self.delay = delay
+        self.requests: list[tuple[str, str]] = []
+        self.active = 0
+        self.max_active = 0
+        self.__lock = threading.Lock()
+        self.__server = ThreadingHTTPServer(("127.0.0.1", 0), self.__handler())
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        return self.base_url + path
+
+    def start(self) -> LocalHttpServer:
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+        self.__thread.join()
+
+    def record(self, method: str, path: str) -> None:
+        with self.__lock:
+            self.requests.append((method, path))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+
+    def done(self) -> None:
+        with self.__lock:
+            self.active -= 1
+
+    def __handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle(self) -> None:
+                # Clients may drop a connection without reading the whole answer.
+                try:
+                    super().handle()
+                except ConnectionError:
+                    pass
+
+            def do_HEAD(self) -> None:
+                self.__answer(send_body=False)
+
+            def do_GET(self) -> None:
+                self.__answer(send_body=True)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+            def __answer(self, send_body: bool) -> None:
+                server.record(self.command, self.path)
+                try:
+                    self.__respond(send_body)
+                finally:
+                    server.done()
+
+            def __respond(self, send_body: bool) -> None:
+                if server.delay:
+                    threading.Event().wait(server.delay)
+
+                status, body = server.routes.get(self.path, (404, "<html><head><title>Not found</title></head></html>"))
+                payload = body.encode("utf-8")
+                etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+                if status == 200 and self.headers.get("If-None-Match") == etag:
+                    status, payload = 304, b""
+                self.send_response(status)
+                if 300 <= status < 400 and status != 304:
+                    self.send_header("Location", body)
+                    payload = b""
+                if status in (200, 304):
+                    self.send_header("ETag", etag)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(payload)
+
+        return Handler
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+from doku_gpt.enum.link_status import LinkStatus
+from doku_gpt.enum.link_type import LinkType
+from doku_gpt.error.invalid_value_error import InvalidValueError
+from doku_gpt.model.compact_link_tag import CompactLinkTag
+from doku_gpt.model.link_tag import LinkTag
+
+
+class TestCompactLinkTag(unittest.TestCase):
+    def __init__(self, methodName="runTest"):
+        super().__init__(methodName)
+        self.__root_folder: Path = Path("/tmp/fake_doku")
+        self.__fields: list[dict] = [
+            {
+                "link_type": LinkType.INTERNAL_ABSOLUTE,
+                "target_prefix": ":one:two:start",
+                "target_query": "do=edit",
+                "target_fragment": "section",
+                "resolved": "one/two/start.txt",
+                "label": "Start",
+            },
+            {
+                "link_type": LinkType.EXTERNAL,
+                "target_prefix": "https://example.com/page",
+                "target_query": "some=thing",
+                "target_fragment": "previous",
+                "resolved": "https://example.com/page?some=thing#previous",
+            },
+            {
+                "link_status": LinkStatus.VALID,
+                "link_type": LinkType.INTERWIKI,
+                "target_prefix": "wp",
+                "target_suffix": "Python",
+                "resolved": "https://en.wikipedia.org/wiki/Python",
+                "label": "Python",
+            },
+            {"link_type": LinkType.INTERNAL_RELATIVE, "target_prefix": ".page"},
+        ]
+
+    def test_has_no_instance_dict(self):
+        link_tag = CompactLinkTag()
+        self.assertFalse(hasattr(link_tag, "__dict__"))
+        with self.assertRaises(AttributeError):
+            link_tag.unknown = "value"
+
+    def test_properties_match_link_tag(self):
+        properties = ["is_external", "is_internal", "is_interwiki", "is_valid", "target", "core", "content", "link_tag"]
+        for fields in self.__fields:
+            with self.subTest(link_type=fields["link_type"]):
+                model = LinkTag(**fields)
+                compact = CompactLinkTag(**fields)
+                model.attach_root(self.__root_folder)
+                compact.attach_root(self.__root_folder)
+                for name in properties + ["path", "relative_path", "url"]:
+                    self.assertEqual(self.__outcome(model, name), self.__outcome(compact, name), name)
+
+    def test_round_trip(self):
+        for fields in self.__fields:
+            with self.subTest(link_type=fields["link_type"]):
+                model = LinkTag(**fields)
+                model.attach_root(self.__root_folder)
+                compact = CompactLinkTag.from_model(model)
+
+                self.assertEqual(CompactLinkTag(**fields), compact)
+                self.assertEqual(model, compact.to_model())
+                self.assertEqual(self.__outcome(model, "path"), self.__outcome(compact.to_model(), "path"))
+                self.assertEqual(
+                    model.model_dump(mode="json", by_alias=True, exclude_none=True),
+                    compact.to_model().model_dump(mode="json", by_alias=True, exclude_none=True),
+                )
+
+    def test_equality(self):
+        self.assertEqual(CompactLinkTag(target_prefix="page"), CompactLinkTag(target_prefix="page"))
+        self.assertNotEqual(CompactLinkTag(target_prefix="page"), CompactLinkTag(target_prefix="other"))
+        self.assertNotEqual(CompactLinkTag(target_prefix="page"), LinkTag(target_prefix="page"))
+
+    @staticmethod
+    def __outcome(link_tag: LinkTag | CompactLinkTag, name: str) -> object:
+        try:
+            return getattr(link_tag, name)
+        except (InvalidValueError, AttributeError, ValueError) as error:
+            return type(error), str(error)
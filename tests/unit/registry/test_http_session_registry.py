@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import unittest
+
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
+from doku_gpt.registry.http_session_registry import HttpSessionRegistry
+from tests.unit.local_http_server import LocalHttpServer
+
+
+class TestHttpSessionRegistry(unittest.TestCase):
+    __PAGE = '<html><head><meta property="og:title" content="Local  page"></head><body></body></html>'
+
+    def setUp(self):
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        self.server = LocalHttpServer(
+            routes={"/page": (200, self.__PAGE), "/other": (200, self.__PAGE), "/moved": (301, "/page")}
+        ).start()
+
+    def tearDown(self):
+        HttpSessionRegistry.reset()
+        WebPageExtractor.reset()
+        self.server.stop()
+
+    def test_session_is_shared(self):
+        self.assertIs(HttpSessionRegistry.get_session(), HttpSessionRegistry.get_session())
+
+    def test_connection_is_reused(self):
+        self.assertEqual("Local page", WebPageExtractor.extract_title(self.server.url("/page")))
+        self.assertTrue(WebPageExtractor.url_exists(self.server.url("/other")))
+        self.assertFalse(WebPageExtractor.url_exists(self.server.url("/missing")))
+
+        self.assertEqual({"requests": 3, "connections": 1, "reused": 2}, HttpSessionRegistry.statistics())
+
+    def test_redirect_is_followed_on_the_same_connection(self):
+        self.assertTrue(WebPageExtractor.url_exists(self.server.url("/moved")))
+        self.assertEqual([("HEAD", "/moved"), ("HEAD", "/page")], self.server.requests)
+        self.assertEqual(1, HttpSessionRegistry.statistics()["connections"])
+
+    def test_reset(self):
+        WebPageExtractor.url_exists(self.server.url("/page"))
+        HttpSessionRegistry.reset()
+        self.assertEqual({"requests": 0, "connections": 0, "reused": 0}, HttpSessionRegistry.statistics())
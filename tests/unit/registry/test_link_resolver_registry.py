@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from doku_gpt.enum.link_type import LinkType
+from doku_gpt.error.invalid_value_error import InvalidValueError
+from doku_gpt.factory.link_tag_factory import LinkTagFactory
+from doku_gpt.model.link_tag import LinkTag
+from doku_gpt.registry.link_resolver_registry import LinkResolverRegistry
+from doku_gpt.resolver.link_tag.external_resolver import ExternalResolver
+from doku_gpt.resolver.link_tag.internal_implicit_resolver import InternalImplicitResolver
+from doku_gpt.resolver.link_tag.resolver import Resolver
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class FakeExternalResolver:
+    instances = 0
+
+    def __init__(self, root_folder):
+        FakeExternalResolver.instances += 1
+        self.root_folder = root_folder
+
+    def resolve(self, link_tag: LinkTag) -> tuple[bool, LinkTag]:
+        link_tag.label = "Fake"
+        link_tag.resolved = link_tag.core
+        return True, link_tag
+
+
+class TestLinkResolverRegistry(AbstractFakeDokuTest):
+    def setUp(self):
+        super().setUp()
+        LinkResolverRegistry.reset()
+        FakeExternalResolver.instances = 0
+
+    def tearDown(self):
+        LinkResolverRegistry.reset()
+        super().tearDown()
+
+    def test_defaults(self):
+        self.assertIs(ExternalResolver, LinkResolverRegistry.get(LinkType.EXTERNAL))
+        self.assertIs(InternalImplicitResolver, LinkResolverRegistry.get(LinkType.INTERNAL))
+        with self.assertRaises(InvalidValueError):
+            LinkResolverRegistry.get(None)
+
+    def test_register(self):
+        LinkResolverRegistry.register(LinkType.EXTERNAL, FakeExternalResolver)
+        resolver = Resolver(root_folder=self.tmp_root, context=self.file_valid)
+        for url in ("https://example.com/a", "https://example.com/b"):
+            result, resolved = resolver.resolve(self.__get_link_tag(f"[[{url}]]"))
+            self.assertTrue(result)
+            self.assertEqual(f"[[{url}|Fake]]", resolved.link_tag)
+        self.assertEqual(1, FakeExternalResolver.instances)
+
+        LinkResolverRegistry.reset()
+        self.assertIs(ExternalResolver, LinkResolverRegistry.get(LinkType.EXTERNAL))
+
+    def test_resolver_follows_context(self):
+        resolver = Resolver(root_folder=self.tmp_root, context=self.file_valid)
+        _, resolved = resolver.resolve(self.__get_link_tag("[[else]]"))
+        self.assertEqual(":two:else", resolved.target_prefix)
+
+        resolver.context = self.tmp_root.joinpath("two/three/start.txt")
+        _, resolved = resolver.resolve(self.__get_link_tag("[[else]]"))
+        self.assertEqual(":two:three:else", resolved.target_prefix)
+
+    def __get_link_tag(self, link_tag: str) -> LinkTag:
+        factory = LinkTagFactory(self.tmp_root)
+        return factory.get(link_tag)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from doku_gpt.cache.http_metadata_cache import HttpMetadataCache
+from doku_gpt.enum.link_status import LinkStatus
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
 from doku_gpt.factory.link_tag_factory import LinkTagFactory
 from doku_gpt.model.link_tag import LinkTag
 from doku_gpt.resolver.link_tag.external_resolver import ExternalResolver
@@ -26,6 +29,39 @@ class TestExternalResolver(AbstractFakeDokuTest):
         self.assertEqual("Power Rangers", resolved.label)
         self.assertEqual("https://www.imdb.com/title/tt0106064", resolved.resolved)
 
+    def test_offline_unknown_link_is_deferred(self):
+        resolver = ExternalResolver(self.tmp_root)
+        link_tag = self.__get_link_tag("[[https://offline.invalid/page]]")
+        WebPageExtractor.reset()
+        WebPageExtractor.OFFLINE = True
+        try:
+            result, resolved = resolver.resolve(link_tag)
+        finally:
+            WebPageExtractor.OFFLINE = False
+
+        self.assertFalse(result)
+        self.assertEqual(LinkStatus.NOT_VALIDATED, resolved.link_status)
+        self.assertIsNone(resolved.label)
+        self.assertEqual(1, WebPageExtractor.deferred())
+
+    def test_offline_cached_link_is_resolved(self):
+        url = "https://offline.invalid/cached"
+        resolver = ExternalResolver(self.tmp_root)
+        WebPageExtractor.reset()
+        HttpMetadataCache.open(self.tmp_root.joinpath(HttpMetadataCache.FILE_NAME), ttl=0)
+        HttpMetadataCache.put(HttpMetadataCache.TITLE, url, url, 200, "Cached title")
+        WebPageExtractor.OFFLINE = True
+        try:
+            result, resolved = resolver.resolve(self.__get_link_tag(f"[[{url}]]"))
+        finally:
+            WebPageExtractor.OFFLINE = False
+            HttpMetadataCache.close()
+
+        self.assertTrue(result)
+        self.assertEqual("Cached title", resolved.label)
+        self.assertEqual(url, resolved.resolved)
+        self.assertEqual(0, WebPageExtractor.deferred())
+
     def __get_link_tag(self, link_tag: str = "[[https://www.imdb.com/title/tt0106064]]") -> LinkTag:
         factory = LinkTagFactory(self.tmp_root)
         return factory.get(link_tag)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from doku_gpt.enum.link_status import LinkStatus
+from doku_gpt.extractor.web_page_extractor import WebPageExtractor
 from doku_gpt.factory.link_tag_factory import LinkTagFactory
 from doku_gpt.model.link_tag import LinkTag
 from doku_gpt.resolver.link_tag.interwiki_resolver import InterwikiResolver
@@ -27,6 +29,19 @@ class TestInterwikiResolver(AbstractFakeDokuTest):
         self.assertEqual("Power Rangers", resolved.label)
         self.assertEqual("https://www.imdb.com/title/tt0106064", resolved.resolved)
 
+    def test_offline_unknown_link_is_deferred(self):
+        resolver = InterwikiResolver(self.tmp_root)
+        WebPageExtractor.reset()
+        WebPageExtractor.OFFLINE = True
+        try:
+            result, resolved = resolver.resolve(self.__get_link_tag("[[imdb>tt0000000]]"))
+        finally:
+            WebPageExtractor.OFFLINE = False
+
+        self.assertFalse(result)
+        self.assertEqual(LinkStatus.NOT_VALIDATED, resolved.link_status)
+        self.assertEqual(1, WebPageExtractor.deferred())
+
     def __get_link_tag(self, link_tag: str = "[[imdb>tt0106064]]") -> LinkTag:
         factory = LinkTagFactory(self.tmp_root)
         return factory.get(link_tag)
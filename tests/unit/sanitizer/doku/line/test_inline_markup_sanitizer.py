@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import random
 import unittest
 
+from doku_gpt.adapter.page_adapter import PageAdapter
 from doku_gpt.sanitizer.doku.line.inline_markup_sanitizer import InlineMarkupSanitizer
 
 
@@ -9,5 +11,93 @@ class TestInlineMarkupSanitizer(unittest.TestCase):
     TO_SANITIZE = "DokuWiki supports **bold**, //italic//, __underlined__ and ''monospaced'' texts. But, of course you can **__//''combine''//__** all these. You can use <sub>subscript</sub>, <sup>superscript</sup>, and <del>deleted</del> as well."
     LINE = "DokuWiki supports bold, italic, underlined and monospaced texts. But, of course you can combine all these. You can use subscript, superscript, and deleted as well."
 
+    # Runs, crossed and unpaired markup, markup formed by what is removed, headers to normalize.
+    PARTS = (
+        "**a**",
+        "//i//",
+        "__u__",
+        "''m''",
+        "<del>d</del>",
+        "<SUB x>s</sub>",
+        "<box t|X>",
+        "</box >",
+        "{{x.png|C}}",
+        "{{a.png}}",
+        "~~NOTOC~~",
+        "**",
+        "*",
+        "//",
+        "/",
+        "__",
+        "_",
+        "''",
+        "'",
+        "<sup>",
+        "</sup>",
+        "{{",
+        "}}",
+        "~~",
+        "<",
+        ">",
+        "|",
+        "=",
+        "  ",
+        "a",
+        "\n",
+        "http://x.y",
+        "ä",
+        "＊",
+        "\u200b",
+    )
+
     def test_sanitize(self) -> None:
         self.assertEqual(self.LINE, InlineMarkupSanitizer.sanitize(self.TO_SANITIZE))
+
+    def test_sanitize_header(self) -> None:
+        self.assertEqual("== Bold title ==", InlineMarkupSanitizer.sanitize("==  **Bold**  title =="))
+        self.assertEqual("=  =", InlineMarkupSanitizer.sanitize("= ~~NOTOC~~ ="))
+
+    def test_statistics(self) -> None:
+        InlineMarkupSanitizer.reset_statistics()
+        self.assertEqual("No markup here.", InlineMarkupSanitizer.sanitize("No markup here."))
+        self.assertEqual("Some bold.", InlineMarkupSanitizer.sanitize("Some **bold**."))
+        self.assertEqual("abc", InlineMarkupSanitizer.sanitize("**a//b**c//"))
+
+        statistics = InlineMarkupSanitizer.statistics()
+        self.assertEqual(3, statistics["lines"])
+        self.assertEqual(1, statistics["skipped"])
+        self.assertEqual(1, statistics["single_pass"])
+        self.assertEqual(1, statistics["pipeline"])
+        self.assertGreater(statistics["skipped_runs"], 0)
+
+    def test_sanitize_like_the_pipeline(self) -> None:
+        generator = random.Random(5)
+        for _ in range(3000):
+            line = "".join(generator.choices(self.PARTS, k=generator.randint(1, 12)))
+            if generator.random() < 0.3:
+                line = f"{'=' * generator.randint(1, 4)} {line} {'=' * generator.randint(1, 4)}"
+            with self.subTest(line=line):
+                self.assertEqual(self.__pipeline(line), InlineMarkupSanitizer.sanitize(line))
+
+    def test_sanitize_page(self) -> None:
+        page = "== Title ==\n**bold**\n\n plain\n\n"
+        self.assertEqual("== Title ==\nbold\n\n plain\n", InlineMarkupSanitizer.sanitize_page(page))
+        self.assertEqual("\n", InlineMarkupSanitizer.sanitize_page(""))
+
+    def test_sanitize_page_like_every_line(self) -> None:
+        generator = random.Random(9)
+        parts = (*self.PARTS, "== H ==", "\n", "\n\n", "\x0c", "\u2028")
+        for _ in range(1000):
+            page = "".join(generator.choices(parts, k=generator.randint(0, 30)))
+            with self.subTest(page=page):
+                expected = "\n".join(InlineMarkupSanitizer.sanitize(line) for line in PageAdapter.split_lines(page))
+                self.assertEqual(expected + "\n", InlineMarkupSanitizer.sanitize_page(page))
+
+    @staticmethod
+    def __pipeline(line: str) -> str:
+        prev = None
+        while prev != line:
+            prev = line
+            for s in InlineMarkupSanitizer._PIPELINE:
+                line = s.sanitize(line)
+        return line
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from doku_gpt.resolver.link_tag.resolver import Resolver
+from doku_gpt.sanitizer.root.page_sanitizer import PageSanitizer
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestPageSanitizer(AbstractFakeDokuTest):
+    def tearDown(self):
+        PageSanitizer.PAGE_MODE = True
+        super().tearDown()
+
+    def test_page_mode_matches_line_mode(self):
+        pages = {
+            "repeated": "====== Start ======\n\n[[end]] [[end]] [[.else|Else]]\n\n[[end]]\n\n\n",
+            "unchanged": "  * [[:two:end|End]]\n",
+            "spaced": "  * [[ end ]] [[end]]\r\n  * [[.else]]\n",
+            "multiline": "  * [[end|End\n]] [[end]]\n",
+        }
+        for name, content in pages.items():
+            with self.subTest(page=name):
+                results = []
+                for page_mode in (False, True):
+                    self.file_valid.write_text(content, encoding="utf-8")
+                    PageSanitizer.PAGE_MODE = page_mode
+                    changed = PageSanitizer(root_folder=self.tmp_root, page_path=self.file_valid).sanitize()
+                    results.append((changed, self.file_valid.read_text(encoding="utf-8")))
+                self.assertEqual(results[0], results[1])
+
+    def test_repeated_links_are_resolved_once(self):
+        self.file_valid.write_text("[[end]]\n" * 50 + "[[.else]] [[end]]\n", encoding="utf-8")
+        calls = []
+        resolve = Resolver.resolve
+
+        def counting_resolve(resolver, link_tag):
+            calls.append(link_tag.target_prefix)
+            return resolve(resolver, link_tag)
+
+        Resolver.resolve = counting_resolve
+        try:
+            self.assertTrue(PageSanitizer(root_folder=self.tmp_root, page_path=self.file_valid).sanitize())
+        finally:
+            Resolver.resolve = resolve
+
+        self.assertEqual(["end", ".else"], calls)
+        self.assertEqual(
+            "[[:two:end|End]]\n" * 50 + "[[:two:else|Else]] [[:two:end|End]]\n", self.file_valid.read_text()
+        )
+
+    def test_page_without_links_is_not_written(self):
+        self.file_valid.write_text("No links here.\n\n\n", encoding="utf-8")
+        self.assertFalse(PageSanitizer(root_folder=self.tmp_root, page_path=self.file_valid).sanitize())
+        self.assertEqual("No links here.\n\n\n", self.file_valid.read_text(encoding="utf-8"))
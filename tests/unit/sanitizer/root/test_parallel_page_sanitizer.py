@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import shutil
+
+from doku_gpt.cache.http_metadata_cache import HttpMetadataCache
+from doku_gpt.sanitizer.root.parallel_page_sanitizer import ParallelPageSanitizer
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestParallelPageSanitizer(AbstractFakeDokuTest):
+    __PAGES = ["else.txt", "start.txt", "one/start.txt", "two/else.txt", "two/start.txt", "two/three/start.txt"]
+
+    def test_jobs_match_sequential_run(self):
+        copy_root = self.tmp_root.parent.joinpath("fake_doku_sequential")
+        shutil.rmtree(copy_root, ignore_errors=True)
+        shutil.copytree(self.tmp_root, copy_root)
+        try:
+            sequential = ParallelPageSanitizer(root_folder=copy_root, jobs=1)
+            expected = [
+                (path.relative_to(copy_root), changed)
+                for path, changed in sequential.sanitize([copy_root.joinpath(page) for page in self.__PAGES])
+            ]
+
+            parallel = ParallelPageSanitizer(root_folder=self.tmp_root, jobs=3)
+            result = [
+                (path.relative_to(self.tmp_root), changed)
+                for path, changed in parallel.sanitize([self.tmp_root.joinpath(page) for page in self.__PAGES])
+            ]
+
+            self.assertEqual(expected, result)
+            for page in self.__PAGES:
+                self.assertEqual(copy_root.joinpath(page).read_text(), self.tmp_root.joinpath(page).read_text())
+            self.assertEqual(len(self.__PAGES), sum(pages for pages, _, _ in parallel.timings.values()))
+            self.assertEqual(4, sum(sanitized for _, sanitized, _ in parallel.timings.values()))
+        finally:
+            shutil.rmtree(copy_root, ignore_errors=True)
+
+    def test_online_jobs_leave_the_root_cache_alone(self):
+        cache_file = self.tmp_root.joinpath(HttpMetadataCache.FILE_NAME)
+        HttpMetadataCache.open(cache_file)
+        HttpMetadataCache.close()
+        content = cache_file.read_bytes()
+
+        parallel = ParallelPageSanitizer(root_folder=self.tmp_root, jobs=3)
+        list(parallel.sanitize([self.tmp_root.joinpath(page) for page in self.__PAGES]))
+
+        self.assertEqual(content, cache_file.read_bytes())
+        self.assertEqual(
+            [HttpMetadataCache.FILE_NAME],
+            [path.name for path in self.tmp_root.iterdir() if path.name.startswith(HttpMetadataCache.FILE_NAME)],
+        )
+
+    def test_written_pages_keep_their_mode(self):
+        self.file_valid.chmod(0o640)
+        result = list(ParallelPageSanitizer(root_folder=self.tmp_root).sanitize([self.file_valid]))
+
+        self.assertEqual([(self.file_valid, True)], result)
+        self.assertEqual(0o640, self.file_valid.stat().st_mode & 0o777)
+        self.assertEqual([], [path.name for path in self.folder_valid.iterdir() if path.name.startswith(".start.txt")])
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import random
+import unittest
+from collections.abc import Callable
+
+from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.error.invalid_value_error import InvalidValueError
+from doku_gpt.factory.link_tag_factory import LinkTagFactory
+from doku_gpt.functions import extract_link_tags
+from doku_gpt.resolver.link_tag.resolver import Resolver
+from doku_gpt.sanitizer.doku.link_tag_sanitizer import LinkTagSanitizer
+from doku_gpt.sanitizer.root.line_namespace_sanitizer import LineNamespaceSanitizer
+from doku_gpt.tokenizer.link_tag_tokenizer import LinkTagTokenizer
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestLinkTagTokenizer(unittest.TestCase):
+    def test_tokenize(self):
+        tokenizer = LinkTagTokenizer(LinkTagTokenizer.NAMESPACE_PATTERN)
+        tokens = tokenizer.tokenize("See [[start]] and [[:two:end#top|End]].")
+        self.assertEqual(["[[start]]", "[[:two:end#top|End]]"], [token.group(0) for token in tokens])
+        self.assertEqual([], tokenizer.tokenize("No link [here] at all."))
+
+    def test_rewrite(self):
+        tokenizer = LinkTagTokenizer(LinkTagTokenizer.LINK_PATTERN)
+        line = "[[one]] and [[two|Two]], [[one]]\n"
+        tokens = tokenizer.tokenize(line)
+        self.assertEqual("1 and 2, 3\n", tokenizer.rewrite(line, tokens, ["1", "2", "3"]))
+        self.assertEqual(line, tokenizer.rewrite(line, [], []))
+
+    def test_extract_link_tags(self):
+        self.assertEqual(["[[start]]", "[[else|Else]]"], extract_link_tags("  * [[start]] [[else|Else]]"))
+
+
+class TestLinkTagTokenizerDifferential(AbstractFakeDokuTest):
+    """Compare the single pass sanitizers with the str.replace() loops they replaced, on random lines."""
+
+    __NAMESPACE_PARTS = (
+        "[[start]]",
+        "[[ start ]]",
+        "[[else|Else]]",
+        "[[:two:end]]",
+        "[[..:end]]",
+        "[[.three:start#x|T]]",
+        "[[[start]]",
+        "[[:two:start|Start]]",
+        "[[:two:start]]",
+        "[[end|[x]]",
+        "[",
+        "]",
+        "]]",
+        "|",
+        " text ",
+    )
+    __LINK_PARTS = ("[[one]]", "[[two|Two]]", "[[one|[x]]", "[[[[three]]", "[[ four ]]", "[[a>b|B]]", "[", "]", " ")
+
+    def test_line_namespace_sanitizer(self):
+        page_path = self.file_valid
+        generator = random.Random(7)
+        for _ in range(400):
+            line = "".join(generator.choices(self.__NAMESPACE_PARTS, k=generator.randint(1, 6)))
+            with self.subTest(line=line):
+                sanitizer = LineNamespaceSanitizer(root_folder=self.tmp_root, page_path=page_path)
+                expected = self.__outcome(self.__legacy_line_namespace, page_path, line)
+                self.assertEqual(expected, self.__outcome(sanitizer.sanitize, line))
+
+    def test_link_tag_sanitizer(self):
+        generator = random.Random(11)
+        for _ in range(400):
+            page = "".join(generator.choices(self.__LINK_PARTS, k=generator.randint(1, 8))) + "\n"
+            with self.subTest(page=page):
+                sanitizer = LinkTagSanitizer(root_folder=self.tmp_root)
+                expected = self.__outcome(self.__legacy_link_tag, page)
+                self.assertEqual(expected, self.__outcome(sanitizer.sanitize, page))
+
+    def __legacy_line_namespace(self, page_path, line: str) -> tuple[bool, str]:
+        factory = LinkTagFactory(root_folder=self.tmp_root)
+        resolver = Resolver(root_folder=self.tmp_root, context=page_path)
+        to_sanitize = line
+        for namespace in extract_link_tags(line):
+            new = resolver.resolve(factory.get(namespace))[1].link_tag
+            old = namespace
+            if new.startswith("["):
+                old = f"[[{old.lstrip('[').rstrip(']').strip()}]]"
+            to_sanitize = to_sanitize.replace(old, new)
+        return line != to_sanitize, to_sanitize
+
+    def __legacy_link_tag(self, page: str) -> str:
+        factory = LinkTagFactory(root_folder=self.tmp_root)
+        line = page
+        for raw_tag in LinkTagTokenizer.LINK_PATTERN.findall(page):
+            link_tag = factory.get(raw_tag)
+            line = line.replace(raw_tag, link_tag.label or link_tag.target, 1)
+        return line
+
+    @staticmethod
+    def __outcome(function: Callable[..., object], *args: object) -> object:
+        try:
+            return function(*args)
+        except (InvalidPathError, InvalidValueError, ValueError) as error:
+            return type(error), str(error)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from doku_gpt.error.invalid_path_error import InvalidPathError
+from doku_gpt.validator.path.file_validator import FileValidator
+from doku_gpt.validator.path.folder_validator import FolderValidator
+from doku_gpt.validator.path.path_context import PathContext
+from tests.unit.abstract_fake_doku_test import AbstractFakeDokuTest
+
+
+class TestPathContext(AbstractFakeDokuTest):
+    def test_existing_file(self):
+        context = PathContext(f" {self.file_valid} ")
+        self.assertTrue(context.exists)
+        self.assertEqual(self.file_valid, context.resolved)
+        self.assertTrue(context.is_file)
+        self.assertFalse(context.is_dir)
+        self.assertFalse(context.is_hidden)
+
+    def test_missing_file_with_parent(self):
+        context = PathContext(self.file_invalid)
+        self.assertFalse(context.exists)
+        self.assertEqual(self.file_invalid, context.resolved)
+        self.assertFalse(context.is_file)
+
+    def test_missing_parent(self):
+        context = PathContext(self.folder_invalid.joinpath("start.txt"))
+        self.assertFalse(context.exists)
+        self.assertIsNone(context.resolved)
+        self.assertFalse(context.is_hidden)
+
+    def test_hidden(self):
+        self.assertTrue(PathContext(self.file_secret).is_hidden)
+        self.assertTrue(PathContext(self.folder_secret.joinpath("start.txt")).is_hidden)
+
+    def test_chain_on_shared_context(self):
+        context = PathContext(self.file_valid)
+        self.assertEqual(self.file_valid, FileValidator.validate_context(context))
+
+        with self.assertRaises(InvalidPathError) as error:
+            FolderValidator.validate_context(context)
+
+        self.assertEqual(f"The given path '{self.file_valid}' is not a directory!", str(error.exception))
+
+    def test_chain_errors(self):
+        expected_errors = {
+            self.file_invalid: f"The given path '{self.file_invalid}' does not exist!",
+            self.file_secret: f"The given path '{self.file_secret}' is hidden!",
+            self.folder_valid: f"The given path '{self.folder_valid}' is not a file!",
+        }
+        for path, message in expected_errors.items():
+            with self.assertRaises(InvalidPathError) as error:
+                FileValidator.validate_context(PathContext(path))
+
+            self.assertEqual(message, str(error.exception))